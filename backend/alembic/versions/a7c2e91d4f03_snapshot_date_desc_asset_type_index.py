@@ -0,0 +1,40 @@
+"""snapshot_date_desc_asset_type_index
+
+Revision ID: a7c2e91d4f03
+Revises: 3ebbf274293e
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c2e91d4f03'
+down_revision: Union[str, Sequence[str], None] = '3ebbf274293e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('idx_snapshot_date_asset_type', table_name='asset_snapshots')
+    op.create_index(
+        'idx_snapshot_date_desc_asset_type',
+        'asset_snapshots',
+        [sa.text('snapshot_date DESC'), 'asset_type'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_snapshot_date_desc_asset_type', table_name='asset_snapshots')
+    op.create_index(
+        'idx_snapshot_date_asset_type',
+        'asset_snapshots',
+        ['snapshot_date', 'asset_type'],
+        unique=False,
+    )
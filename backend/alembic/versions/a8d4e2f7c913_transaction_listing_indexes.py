@@ -0,0 +1,29 @@
+"""transaction_listing_indexes
+
+Revision ID: a8d4e2f7c913
+Revises: f3a8c1d6e2b4
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d4e2f7c913'
+down_revision: Union[str, Sequence[str], None] = 'f3a8c1d6e2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_broker_date', 'transactions', ['broker', 'date'], unique=False)
+    op.create_index('idx_created_at', 'transactions', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_created_at', table_name='transactions')
+    op.drop_index('idx_broker_date', table_name='transactions')
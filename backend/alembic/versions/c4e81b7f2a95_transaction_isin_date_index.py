@@ -0,0 +1,27 @@
+"""transaction_isin_date_index
+
+Revision ID: c4e81b7f2a95
+Revises: a7c2e91d4f03
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e81b7f2a95'
+down_revision: Union[str, Sequence[str], None] = 'a7c2e91d4f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_isin_date', 'transactions', ['isin', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_isin_date', table_name='transactions')
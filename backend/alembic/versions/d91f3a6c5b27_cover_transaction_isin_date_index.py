@@ -0,0 +1,35 @@
+"""cover_transaction_isin_date_index
+
+Revision ID: d91f3a6c5b27
+Revises: c4e81b7f2a95
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91f3a6c5b27'
+down_revision: Union[str, Sequence[str], None] = 'c4e81b7f2a95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('idx_isin_date', table_name='transactions')
+    op.create_index(
+        'idx_isin_date',
+        'transactions',
+        ['isin', 'date'],
+        unique=False,
+        postgresql_include=['transaction_type', 'units', 'price_per_unit', 'fee'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_isin_date', table_name='transactions')
+    op.create_index('idx_isin_date', 'transactions', ['isin', 'date'], unique=False)
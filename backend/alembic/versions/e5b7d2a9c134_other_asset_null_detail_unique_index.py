@@ -0,0 +1,41 @@
+"""other_asset_null_detail_unique_index
+
+Revision ID: e5b7d2a9c134
+Revises: d91f3a6c5b27
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b7d2a9c134'
+down_revision: Union[str, Sequence[str], None] = 'd91f3a6c5b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NULL asset_detail rows were never deduplicated by
+    # uq_other_asset_type_detail; keep the newest row per asset_type
+    op.execute(
+        "DELETE FROM other_assets WHERE asset_detail IS NULL AND id NOT IN ("
+        "SELECT MAX(id) FROM other_assets WHERE asset_detail IS NULL GROUP BY asset_type)"
+    )
+    op.create_index(
+        'uq_other_asset_type_null_detail',
+        'other_assets',
+        ['asset_type'],
+        unique=True,
+        postgresql_where=sa.text('asset_detail IS NULL'),
+        sqlite_where=sa.text('asset_detail IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_other_asset_type_null_detail', table_name='other_assets')
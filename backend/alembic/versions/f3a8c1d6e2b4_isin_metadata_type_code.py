@@ -0,0 +1,75 @@
+"""isin_metadata_type_code
+
+Revision ID: f3a8c1d6e2b4
+Revises: e5b7d2a9c134
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8c1d6e2b4'
+down_revision: Union[str, Sequence[str], None] = 'e5b7d2a9c134'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TO_CODE = "CASE type WHEN 'STOCK' THEN 'S' WHEN 'BOND' THEN 'B' WHEN 'REAL_ASSET' THEN 'R' END"
+TO_NAME = "CASE type WHEN 'S' THEN 'STOCK' WHEN 'B' THEN 'BOND' WHEN 'R' THEN 'REAL_ASSET' END"
+CHECK_NAME = 'ck_isin_metadata_type_code'
+CHECK_SQL = "type IN ('S', 'B', 'R')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.alter_column(
+            'isin_metadata',
+            'type',
+            type_=sa.String(length=1),
+            existing_nullable=False,
+            postgresql_using=TO_CODE.replace("CASE type", "CASE type::text", 1),
+        )
+        op.execute("DROP TYPE IF EXISTS isintype")
+        op.create_check_constraint(CHECK_NAME, 'isin_metadata', CHECK_SQL)
+        return
+
+    op.execute(f"UPDATE isin_metadata SET type = {TO_CODE}")
+    with op.batch_alter_table('isin_metadata') as batch_op:
+        batch_op.alter_column(
+            'type',
+            type_=sa.String(length=1),
+            existing_type=sa.Enum('STOCK', 'BOND', 'REAL_ASSET', name='isintype'),
+            existing_nullable=False,
+        )
+        batch_op.create_check_constraint(CHECK_NAME, CHECK_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    isin_type = sa.Enum('STOCK', 'BOND', 'REAL_ASSET', name='isintype')
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_constraint(CHECK_NAME, 'isin_metadata', type_='check')
+        isin_type.create(op.get_bind())
+        op.alter_column(
+            'isin_metadata',
+            'type',
+            type_=isin_type,
+            existing_nullable=False,
+            postgresql_using=f"({TO_NAME})::isintype",
+        )
+        return
+
+    with op.batch_alter_table('isin_metadata') as batch_op:
+        batch_op.drop_constraint(CHECK_NAME, type_='check')
+        batch_op.alter_column(
+            'type',
+            type_=isin_type,
+            existing_type=sa.String(length=1),
+            existing_nullable=False,
+        )
+    op.execute(f"UPDATE isin_metadata SET type = {TO_NAME}")
@@ -14,6 +14,20 @@ class Settings(BaseSettings):
     cors_origins: str = '["http://localhost:3000", "http://localhost:8000"]'
     s3_bucket_backups: str = "your-s3-bucket-name"
 
+    # Seconds to reuse the exchange rate read from user settings (0 disables).
+    # Each worker process caches separately, so keep this short when running
+    # several workers.
+    exchange_rate_cache_ttl_seconds: int = 60
+
+    # Connection pool per worker process (ignored for SQLite). Production runs
+    # several workers, so (pool_size + max_overflow) * workers must stay
+    # below the server's max_connections.
+    db_pool_size: int = 5
+    db_max_overflow: int = 5
+    db_pool_timeout_seconds: int = 10
+    # Recycle connections before server/proxy idle timeouts drop them
+    db_pool_recycle_seconds: int = 1800
+
     # Logging configuration
     log_level: str = "INFO"
     log_format: str = "json"  # json or text
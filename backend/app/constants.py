@@ -45,3 +45,13 @@ ISIN_PATTERN = re.compile(r"^[A-Z]{2}[A-Z0-9]{9}[0-9]$")
 # Pagination defaults
 DEFAULT_PAGE_SIZE = 100
 MAX_PAGE_SIZE = 1000
+
+# CSV import batching
+CSV_IMPORT_CHUNK_SIZE = 500
+CSV_IMPORT_MAX_WORKERS = 4
+
+# Rows fetched per round-trip when streaming snapshot listings
+SNAPSHOT_STREAM_BATCH_SIZE = 1000
+
+# Rows fetched per round-trip when streaming position value listings
+POSITION_VALUE_STREAM_BATCH_SIZE = 500
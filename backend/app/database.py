@@ -1,14 +1,31 @@
+import logging
+from datetime import datetime, timezone
+
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Pool sizing only applies to server databases; SQLite keeps SQLAlchemy's defaults
+if "sqlite" in settings.database_url:
+    engine_options = {"connect_args": {"check_same_thread": False}}
+else:
+    engine_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        # Test each connection on checkout so dropped idle connections are
+        # replaced instead of failing the request
+        "pool_pre_ping": True,
+    }
+
 # Create SQLAlchemy engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-    echo=settings.debug,
-)
+engine = create_engine(settings.database_url, echo=settings.debug, **engine_options)
 
 
 # Enable WAL mode and foreign keys for SQLite
@@ -22,13 +39,57 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
         cursor.close()
 
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Pool usage at DEBUG level, to diagnose exhaustion (QueuePool limit reached)
+@event.listens_for(engine, "checkout")
+def log_pool_checkout(dbapi_conn, connection_record, connection_proxy):
+    """Log pool status each time a connection is checked out."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Connection checked out: %s", engine.pool.status())
+
+
+@event.listens_for(engine, "checkin")
+def log_pool_checkin(dbapi_conn, connection_record):
+    """Log pool status each time a connection is returned."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Connection checked in: %s", engine.pool.status())
+
+
+# Create SessionLocal class.
+# expire_on_commit=False keeps committed objects loaded: primary keys come back
+# from the INSERT and timestamps are Python-side defaults, so re-reading the row
+# after every commit (refresh or lazy reload) would only repeat what we wrote.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 # Create declarative base
 Base = declarative_base()
 
 
+def utc_now() -> datetime:
+    """
+    Current UTC time as a naive datetime, matching how timestamp columns are stored.
+
+    Replaces the deprecated datetime.utcnow().
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def dialect_insert(db: Session):
+    """
+    Return the insert construct supporting ON CONFLICT for the session's dialect.
+
+    Args:
+        db: Database session
+
+    Returns:
+        PostgreSQL or SQLite insert() function
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql_insert
+    return sqlite_insert
+
+
 # Dependency for FastAPI routes
 def get_db():
     """
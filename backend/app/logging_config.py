@@ -1,8 +1,12 @@
 """Logging configuration for structured JSON logging."""
 
+import atexit
+import copy
 import logging
+import queue
 import sys
 from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict
 
 from pythonjsonlogger import jsonlogger
@@ -42,19 +46,41 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         log_record["level"] = record.levelname
         log_record["logger"] = record.name
 
-        # Add request ID from context if available
-        request_id = request_id_context.get()
+        # Add request ID captured when the record was queued, else from context
+        request_id = getattr(record, "request_id", "") or request_id_context.get()
         if request_id:
             log_record["request_id"] = request_id
 
 
+class ContextQueueHandler(QueueHandler):
+    """
+    Queue handler that keeps request context for the listener thread.
+
+    Records are formatted on the QueueListener thread, where the request_id
+    context variable is not set, so the ID is copied onto the record here.
+    The message is resolved eagerly but exc_info is kept, so the real
+    formatter still renders tracebacks as structured fields.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Snapshot the message and request ID before the record is queued."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        request_id = request_id_context.get()
+        if request_id:
+            record.request_id = request_id
+        return record
+
+
 def setup_logging() -> None:
     """
     Configure application-wide logging.
 
     Sets up:
     - JSON formatter for structured logs
-    - Console handler to stdout/stderr
+    - Console handler to stdout/stderr, fed from a queue by a background
+      listener thread so request handlers never block on log I/O
     - Log level from configuration
     - Module-level loggers
     """
@@ -79,10 +105,16 @@ def setup_logging() -> None:
     handler.setFormatter(formatter)
     handler.setLevel(log_level)
 
+    # Emit through a queue; the listener writes to the console off-thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    root_logger.addHandler(handler)
+    root_logger.addHandler(ContextQueueHandler(log_queue))
 
     # Reduce noise from third-party libraries
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -7,7 +7,7 @@ from typing import Optional
 from sqlalchemy import DateTime, Index, Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class AssetSnapshot(Base):
@@ -42,13 +42,15 @@ class AssetSnapshot(Base):
 
     # Audit timestamp
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow
+        DateTime, nullable=False, default=utc_now
     )
 
     # Table constraints and indexes
     __table_args__ = (
         Index('idx_snapshot_date', 'snapshot_date'),
-        Index('idx_snapshot_date_asset_type', 'snapshot_date', 'asset_type'),
+        # Matches get_snapshots ordering (date DESC, asset_type ASC) and still
+        # serves equality lookups on snapshot_date ordered by asset_type
+        Index('idx_snapshot_date_desc_asset_type', snapshot_date.desc(), asset_type),
     )
 
     def __repr__(self) -> str:
@@ -2,11 +2,50 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, Index, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    TypeDecorator,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.constants import ISINType
-from app.database import Base
+from app.database import Base, utc_now
+
+# One-character storage code per ISIN type
+ISIN_TYPE_CODES = {
+    ISINType.STOCK: "S",
+    ISINType.BOND: "B",
+    ISINType.REAL_ASSET: "R",
+}
+_ISIN_TYPES_BY_CODE = {code: isin_type for isin_type, code in ISIN_TYPE_CODES.items()}
+
+
+class ISINTypeCode(TypeDecorator):
+    """Store ISINType as its one-character code in a String(1) column.
+
+    A plain dict lookup each way replaces the Enum type's name/value
+    coercion, and the column stays a narrow string on every backend.
+    """
+
+    impl = String(1)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        """Convert ISINType (or its value) to the stored code."""
+        if value is None:
+            return None
+        return ISIN_TYPE_CODES[ISINType(value)]
+
+    def process_result_value(self, value, dialect):
+        """Convert the stored code back to ISINType."""
+        if value is None:
+            return None
+        return _ISIN_TYPES_BY_CODE[value]
 
 
 class ISINMetadata(Base):
@@ -28,14 +67,14 @@ class ISINMetadata(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Asset type (stock, bond, real-asset)
-    type: Mapped[ISINType] = mapped_column(Enum(ISINType), nullable=False, index=True)
+    type: Mapped[ISINType] = mapped_column(ISINTypeCode(), nullable=False, index=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow
+        DateTime, nullable=False, default=utc_now
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, nullable=False, default=utc_now, onupdate=utc_now
     )
 
     # Table constraints
@@ -43,6 +82,7 @@ class ISINMetadata(Base):
         UniqueConstraint('isin', name='uq_isin_metadata_isin'),
         Index('idx_isin_metadata_isin', 'isin'),
         Index('idx_isin_metadata_type', 'type'),
+        CheckConstraint("type IN ('S', 'B', 'R')", name='ck_isin_metadata_type_code'),
     )
 
     def __repr__(self) -> str:
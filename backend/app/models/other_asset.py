@@ -4,10 +4,10 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import DateTime, Index, Integer, Numeric, String, UniqueConstraint
+from sqlalchemy import DateTime, Index, Integer, Numeric, String, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class OtherAsset(Base):
@@ -18,7 +18,8 @@ class OtherAsset(Base):
     is computed from portfolio summary and not stored in the database.
 
     UNIQUE constraint on (asset_type, asset_detail) ensures only one value
-    per asset type and account combination.
+    per asset type and account combination. NULLs never conflict in that
+    constraint, so a partial unique index covers rows without asset_detail.
     """
 
     __tablename__ = "other_assets"
@@ -40,15 +41,22 @@ class OtherAsset(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow
+        DateTime, nullable=False, default=utc_now
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, nullable=False, default=utc_now, onupdate=utc_now
     )
 
     # Table constraints
     __table_args__ = (
         UniqueConstraint('asset_type', 'asset_detail', name='uq_other_asset_type_detail'),
+        Index(
+            'uq_other_asset_type_null_detail',
+            'asset_type',
+            unique=True,
+            postgresql_where=text('asset_detail IS NULL'),
+            sqlite_where=text('asset_detail IS NULL'),
+        ),
         Index('idx_other_asset_type', 'asset_type'),
     )
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 
 from sqlalchemy import (
     CheckConstraint,
@@ -11,10 +11,10 @@ from sqlalchemy import (
     Numeric,
     String,
 )
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from app.constants import TransactionType
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class Transaction(Base):
@@ -40,10 +40,10 @@ class Transaction(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow
+        DateTime, nullable=False, default=utc_now
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, nullable=False, default=utc_now, onupdate=utc_now
     )
 
     # Constraints
@@ -53,8 +53,34 @@ class Transaction(Base):
         CheckConstraint("fee >= 0", name="check_non_negative_fee"),
         # Composite index for date and ISIN queries
         Index("idx_date_isin", "date", "isin"),
+        # Per-ISIN scans in (isin, date) order: cost basis as-of and the
+        # grouped all-ISIN aggregate. On PostgreSQL the included columns make
+        # the cost basis sums index-only scans.
+        Index(
+            "idx_isin_date",
+            "isin",
+            "date",
+            postgresql_include=["transaction_type", "units", "price_per_unit", "fee"],
+        ),
+        # Transaction listing: broker filter in date order, and the
+        # created_at sort option
+        Index("idx_broker_date", "broker", "date"),
+        Index("idx_created_at", "created_at"),
     )
 
+    @validates("fee", "price_per_unit", "units")
+    def _round_to_column_scale(self, key: str, value: Decimal) -> Decimal:
+        """
+        Round amounts to their column's scale, as the database stores them.
+
+        Keeps a just-written instance identical to the stored row (e.g. units
+        "2" reads back as 2.0000), so callers need no refresh after commit.
+        """
+        if value is None:
+            return value
+        scale = self.__table__.c[key].type.scale
+        return Decimal(value).quantize(Decimal(1).scaleb(-scale), ROUND_HALF_UP)
+
     def __repr__(self) -> str:
         return (
             f"<Transaction(id={self.id}, date={self.date}, isin={self.isin}, "
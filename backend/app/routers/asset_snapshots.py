@@ -60,12 +60,16 @@ def list_snapshots(
     db: Session = Depends(get_db),
 ) -> AssetSnapshotListResponse:
     """List asset snapshots with optional filters."""
-    snapshots = asset_snapshot_service.get_snapshots(
-        db, start_date, end_date, asset_type
-    )
+    # Validate rows as they stream in rather than holding every ORM object first
+    snapshots = [
+        AssetSnapshotResponse.model_validate(s)
+        for s in asset_snapshot_service.get_snapshots_iter(
+            db, start_date, end_date, asset_type
+        )
+    ]
 
     return AssetSnapshotListResponse(
-        snapshots=[AssetSnapshotResponse.model_validate(s) for s in snapshots],
+        snapshots=snapshots,
         total=len(snapshots),
         metadata=None,
     )
@@ -45,7 +45,7 @@ def list_isin_metadata(
     db: Session = Depends(get_db),
 ) -> ISINMetadataListResponse:
     """List all ISIN metadata with optional type filter."""
-    isin_metadata_list = isin_metadata_service.get_all_isin_metadata(db, asset_type=type)
+    isin_metadata_list = isin_metadata_service.get_all_isin_metadata_rows(db, asset_type=type)
 
     return ISINMetadataListResponse(
         items=[
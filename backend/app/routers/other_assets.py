@@ -1,6 +1,5 @@
 """Other assets API router."""
 
-from decimal import Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Path, Query, status
@@ -11,6 +10,7 @@ from app.schemas.other_asset import (
     OtherAssetCreate,
     OtherAssetListResponse,
     OtherAssetResponse,
+    OtherAssetResponseListAdapter,
 )
 from app.services import other_asset_service, user_setting_service
 
@@ -30,8 +30,7 @@ def upsert_other_asset(
 ) -> OtherAssetResponse:
     """Create or update an other asset."""
     result = other_asset_service.upsert_other_asset(db, asset)
-    setting = user_setting_service.get_exchange_rate_setting(db)
-    exchange_rate = Decimal(setting.setting_value) if setting else Decimal("25.00")
+    exchange_rate = user_setting_service.get_exchange_rate(db)
 
     return OtherAssetResponse(
         id=result.id,
@@ -62,24 +61,25 @@ def list_other_assets(
     if include_investments:
         other_assets, exchange_rate = other_asset_service.get_all_other_assets_with_investments(db)
     else:
-        other_assets = other_asset_service.get_all_other_assets(db)
-        setting = user_setting_service.get_exchange_rate_setting(db)
-        exchange_rate = Decimal(setting.setting_value) if setting else Decimal("25.00")
+        other_assets = other_asset_service.get_all_other_asset_rows(db)
+        exchange_rate = user_setting_service.get_exchange_rate(db)
 
-    # Create response objects with exchange_rate_ set
-    response_assets = []
-    for asset in other_assets:
-        asset_dict = {
-            "id": asset.id,
-            "asset_type": asset.asset_type,
-            "asset_detail": asset.asset_detail,
-            "currency": asset.currency,
-            "value": asset.value,
-            "created_at": asset.created_at,
-            "updated_at": asset.updated_at,
-            "exchange_rate_": exchange_rate,
-        }
-        response_assets.append(OtherAssetResponse(**asset_dict))
+    # Validate all response objects in one pass with exchange_rate_ set
+    response_assets = OtherAssetResponseListAdapter.validate_python(
+        [
+            {
+                "id": asset.id,
+                "asset_type": asset.asset_type,
+                "asset_detail": asset.asset_detail,
+                "currency": asset.currency,
+                "value": asset.value,
+                "created_at": asset.created_at,
+                "updated_at": asset.updated_at,
+                "exchange_rate_": exchange_rate,
+            }
+            for asset in other_assets
+        ]
+    )
 
     return OtherAssetListResponse(
         other_assets=response_assets,
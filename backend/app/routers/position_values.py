@@ -40,12 +40,14 @@ def list_position_values(
     db: Session = Depends(get_db),
 ) -> PositionValueListResponse:
     """List all position values."""
-    position_values = position_value_service.get_all_position_values(db)
+    # Validate while streaming so ORM instances are not all held at once
+    position_values = [
+        PositionValueResponse.model_validate(pv)
+        for pv in position_value_service.get_position_values_iter(db)
+    ]
 
     return PositionValueListResponse(
-        position_values=[
-            PositionValueResponse.model_validate(pv) for pv in position_values
-        ],
+        position_values=position_values,
         total=len(position_values),
     )
 
@@ -5,7 +5,7 @@ from decimal import Decimal
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, utc_now
 from app.schemas.user_setting import ExchangeRateResponse, ExchangeRateUpdateRequest
 from app.services import user_setting_service
 
@@ -21,15 +21,21 @@ router = APIRouter(prefix="/settings", tags=["settings"])
 def get_exchange_rate(
     db: Session = Depends(get_db),
 ) -> ExchangeRateResponse:
-    """Get the exchange rate setting."""
+    """
+    Get the exchange rate setting.
+
+    Reads the stored row (not the in-process cache) because the response
+    also carries updated_at. Updates write the new rate into this process's
+    cache when they commit, so here it matches the rate snapshots use; other
+    workers may serve their cached rate for up to the cache TTL.
+    """
     setting = user_setting_service.get_exchange_rate_setting(db)
 
     if setting is None:
         # Return default when not set
-        from datetime import datetime
         return ExchangeRateResponse(
             exchange_rate=Decimal("25.00"),
-            updated_at=datetime.utcnow()
+            updated_at=utc_now()
         )
 
     # Extract value and timestamp from single object
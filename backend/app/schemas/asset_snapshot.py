@@ -20,7 +20,9 @@ class AssetSnapshotResponse(BaseModel):
     value_eur: Decimal = Field(..., description="Value converted to EUR using snapshot exchange rate")
     created_at: datetime = Field(..., description="When record was created")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True, frozen=True, defer_build=True, use_enum_values=False
+    )
 
 
 class SnapshotMetadata(BaseModel):
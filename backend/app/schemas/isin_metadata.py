@@ -23,11 +23,12 @@ class ISINMetadataCreate(ISINMetadataBase):
     @classmethod
     def validate_isin(cls, v: str) -> str:
         """Validate ISIN format and normalize to uppercase."""
-        if not ISIN_PATTERN.match(v.upper()):
+        v = v.upper()
+        if not ISIN_PATTERN.match(v):
             raise ValueError(
                 "ISIN must be 12 characters: 2 letters + 9 alphanumeric + 1 digit"
             )
-        return v.upper()
+        return v
 
     @field_validator("name")
     @classmethod
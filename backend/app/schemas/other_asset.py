@@ -2,9 +2,18 @@
 
 from datetime import datetime
 from decimal import Decimal
+from functools import cached_property
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+    model_validator,
+)
 
 from app.constants import AssetType, Currency, VALID_ACCOUNT_NAMES
 
@@ -18,14 +27,9 @@ class OtherAssetBase(BaseModel):
     value: Decimal = Field(..., ge=0, description="Value in the specified currency")
 
 
-class OtherAssetCreate(BaseModel):
+class OtherAssetCreate(OtherAssetBase):
     """Schema for creating/updating an other asset (UPSERT operation)."""
 
-    asset_type: AssetType = Field(..., description="Asset type (crypto, cash_eur, cash_czk, cd_account, pension_fund)")
-    asset_detail: Optional[str] = Field(None, max_length=100, description="Asset detail (account name for cash assets, None for others)")
-    currency: Currency = Field(..., description="Currency (EUR or CZK)")
-    value: Decimal = Field(..., ge=0, description="Value in the specified currency")
-
     @field_validator("asset_type")
     @classmethod
     def validate_not_investments(cls, v: AssetType) -> AssetType:
@@ -81,13 +85,14 @@ class OtherAssetResponse(OtherAssetBase):
     exchange_rate_: Decimal = Field(default=Decimal("25.00"), exclude=True, description="Exchange rate (CZK per 1 EUR)")
 
     @computed_field
-    @property
+    @cached_property
     def value_eur(self) -> Decimal:
         """
         Value converted to EUR using exchange rate.
 
         For EUR assets, returns the value as-is.
         For CZK assets, converts using the exchange rate attached by service layer.
+        Computed once per instance; safe to cache because the model is frozen.
         """
         if self.currency == Currency.EUR:
             return self.value
@@ -95,7 +100,14 @@ class OtherAssetResponse(OtherAssetBase):
             # Use the exchange rate field (will be set by service layer)
             return self.value / self.exchange_rate_
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True, frozen=True, defer_build=True, use_enum_values=False
+    )
+
+
+# Built once at import so list endpoints validate all rows in a single core call
+# instead of constructing OtherAssetResponse objects one by one.
+OtherAssetResponseListAdapter = TypeAdapter(list[OtherAssetResponse])
 
 
 class OtherAssetListResponse(BaseModel):
@@ -3,7 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class PositionValueBase(BaseModel):
@@ -19,6 +19,12 @@ class PositionValueCreate(BaseModel):
     isin: str = Field(..., min_length=1, max_length=12, description="ISIN code")
     current_value: Decimal = Field(..., gt=0, description="Current total position value")
 
+    @field_validator("isin")
+    @classmethod
+    def normalize_isin(cls, v: str) -> str:
+        """Normalize ISIN to uppercase."""
+        return v.upper()
+
 
 class PositionValueResponse(PositionValueBase):
     """Schema for position value responses."""
@@ -23,11 +23,12 @@ class TransactionBase(BaseModel):
     @classmethod
     def validate_isin(cls, v: str) -> str:
         """Validate ISIN format."""
-        if not ISIN_PATTERN.match(v.upper()):
+        v = v.upper()
+        if not ISIN_PATTERN.match(v):
             raise ValueError(
                 "ISIN must be 12 characters: 2 letters + 9 alphanumeric + 1 digit"
             )
-        return v.upper()
+        return v
 
     @field_validator("date")
     @classmethod
@@ -68,11 +69,14 @@ class TransactionUpdate(BaseModel):
     @classmethod
     def validate_isin(cls, v: Optional[str]) -> Optional[str]:
         """Validate ISIN format if provided."""
-        if v is not None and not ISIN_PATTERN.match(v.upper()):
+        if v is None:
+            return None
+        v = v.upper()
+        if not ISIN_PATTERN.match(v):
             raise ValueError(
                 "ISIN must be 12 characters: 2 letters + 9 alphanumeric + 1 digit"
             )
-        return v.upper() if v else None
+        return v
 
     @field_validator("date")
     @classmethod
@@ -106,7 +110,9 @@ class TransactionResponse(TransactionBase):
         """Calculate total with fees (total_without_fees + fee)."""
         return self.total_without_fees + self.fee
 
-    model_config = ConfigDict(from_attributes=True, use_enum_values=False)
+    model_config = ConfigDict(
+        from_attributes=True, frozen=True, defer_build=True, use_enum_values=False
+    )
 
 
 class TransactionListResponse(BaseModel):
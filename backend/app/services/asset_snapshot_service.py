@@ -1,13 +1,31 @@
 """Asset snapshot service for business logic."""
 
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from decimal import Decimal
-
+from itertools import groupby
+from operator import attrgetter
+
+from sqlalchemy import (
+    Row,
+    String,
+    cast,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    null,
+    select,
+    text,
+    union_all,
+)
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from sqlalchemy import func
-
+from app.constants import CSV_IMPORT_CHUNK_SIZE, SNAPSHOT_STREAM_BATCH_SIZE
+from app.database import utc_now
 from app.exceptions import SnapshotNotFoundError
 from app.logging_config import log_with_context
 from app.models.asset_snapshot import AssetSnapshot
@@ -24,7 +42,7 @@ logger = logging.getLogger(__name__)
 
 def create_snapshot(
     db: Session, snapshot_datetime: datetime | None = None
-) -> tuple[list[AssetSnapshot], SnapshotMetadata]:
+) -> tuple[list[Row], SnapshotMetadata]:
     """
     Create a snapshot of current asset state.
 
@@ -37,43 +55,51 @@ def create_snapshot(
         snapshot_datetime: Optional timestamp for snapshot (defaults to now)
 
     Returns:
-        Tuple of (list of created snapshots, snapshot metadata)
+        Tuple of (list of created snapshot rows with every column as an
+        attribute, snapshot metadata)
     """
-    # Get all assets including synthetic investments row
-    assets, exchange_rate = other_asset_service.get_all_other_assets_with_investments(db)
-
-    snapshot_date = snapshot_datetime or datetime.utcnow()
-    snapshots = []
-    total_value_eur = Decimal("0")
-
-    # Store each asset as-is (no aggregation)
-    for asset in assets:
-        # Calculate value_eur based on currency
-        if asset.currency == "CZK":
-            value_eur = asset.value / exchange_rate
-        else:
-            value_eur = asset.value
-
-        # Create snapshot row
-        snapshot = AssetSnapshot(
-            snapshot_date=snapshot_date,
-            asset_type=asset.asset_type,
-            asset_detail=asset.asset_detail,  # Includes account name or NULL
-            currency=asset.currency,
-            value=asset.value,
-            exchange_rate=exchange_rate,
-            value_eur=value_eur,
-        )
-        snapshots.append(snapshot)
-        total_value_eur += value_eur
+    snapshot_date = snapshot_datetime or utc_now()
+    rows = []
+
+    # Read assets and build rows without flushing anything pending mid-way
+    with db.no_autoflush:
+        # Get all assets including synthetic investments row
+        assets, exchange_rate = other_asset_service.get_all_other_assets_with_investments(db)
+
+        # Divisor converting each currency to EUR; EUR (and anything else) is 1
+        divisors = {"CZK": exchange_rate}
+        one = Decimal(1)
+
+        # Store each asset as-is (no aggregation)
+        for asset in assets:
+            value_eur = asset.value / divisors.get(asset.currency, one)
+
+            # Snapshot row payload
+            rows.append({
+                "snapshot_date": snapshot_date,
+                "asset_type": asset.asset_type,
+                "asset_detail": asset.asset_detail,  # Includes account name or NULL
+                "currency": asset.currency,
+                "value": asset.value,
+                "exchange_rate": exchange_rate,
+                "value_eur": value_eur,
+            })
 
-    # Bulk insert
-    db.add_all(snapshots)
+    # Bulk insert; generated IDs and defaults come back in the same statement.
+    # Returning plain column rows keeps ORM instances (and the identity map) out
+    # of it, and commit has nothing to expire
+    snapshots = list(
+        db.execute(
+            insert(AssetSnapshot).returning(
+                *AssetSnapshot.__table__.columns, sort_by_parameter_order=True
+            ),
+            rows,
+        ).all()
+    )
     db.commit()
 
-    # Refresh all snapshots to get database-generated IDs
-    for snapshot in snapshots:
-        db.refresh(snapshot)
+    # Total from the stored (rounded) values, matching what summaries report later
+    total_value_eur = sum((snapshot.value_eur for snapshot in snapshots), Decimal("0"))
 
     # Create metadata
     metadata = SnapshotMetadata(
@@ -83,29 +109,34 @@ def create_snapshot(
         total_value_eur=total_value_eur,
     )
 
-    # AUDIT LOG
-    log_with_context(
-        logger,
-        logging.INFO,
-        "Asset snapshot created",
-        operation="CREATE",
-        snapshot_date=snapshot_date.isoformat(),
-        total_assets=len(snapshots),
-        total_value_eur=str(total_value_eur),
-        exchange_rate=str(exchange_rate),
-    )
+    # AUDIT LOG (skip building fields entirely when INFO is disabled)
+    if logger.isEnabledFor(logging.INFO):
+        log_with_context(
+            logger,
+            logging.INFO,
+            "Asset snapshot created",
+            operation="CREATE",
+            snapshot_date=snapshot_date.isoformat(),
+            total_assets=len(snapshots),
+            total_value_eur=str(total_value_eur),
+            exchange_rate=str(exchange_rate),
+        )
 
     return snapshots, metadata
 
 
-def get_snapshots(
+def get_snapshots_iter(
     db: Session,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
     asset_type: str | None = None,
-) -> list[AssetSnapshot]:
+) -> Iterator[AssetSnapshot]:
     """
-    Get asset snapshots with optional filtering.
+    Stream asset snapshots with optional filtering.
+
+    Rows are fetched in batches of SNAPSHOT_STREAM_BATCH_SIZE (server-side
+    cursor where the driver supports it), so memory stays bounded for callers
+    that iterate once.
 
     Args:
         db: Database session
@@ -113,21 +144,48 @@ def get_snapshots(
         end_date: Optional end date filter (inclusive)
         asset_type: Optional asset type filter
 
-    Returns:
-        List of asset snapshots ordered by snapshot_date DESC, asset_type ASC
+    Yields:
+        Asset snapshots ordered by snapshot_date DESC, asset_type ASC
     """
-    query = db.query(AssetSnapshot)
+    # Lambda statements are cached by code location, so each filter combination
+    # is built and compiled once; the closure values become bound parameters
+    stmt = lambda_stmt(lambda: select(AssetSnapshot))
 
     if start_date:
-        query = query.filter(AssetSnapshot.snapshot_date >= start_date)
+        stmt += lambda s: s.where(AssetSnapshot.snapshot_date >= start_date)
     if end_date:
-        query = query.filter(AssetSnapshot.snapshot_date <= end_date)
+        stmt += lambda s: s.where(AssetSnapshot.snapshot_date <= end_date)
     if asset_type:
-        query = query.filter(AssetSnapshot.asset_type == asset_type)
+        stmt += lambda s: s.where(AssetSnapshot.asset_type == asset_type)
 
-    return query.order_by(
+    stmt += lambda s: s.order_by(
         AssetSnapshot.snapshot_date.desc(), AssetSnapshot.asset_type.asc()
-    ).all()
+    )
+
+    yield from db.scalars(
+        stmt, execution_options={"yield_per": SNAPSHOT_STREAM_BATCH_SIZE}
+    )
+
+
+def get_snapshots(
+    db: Session,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    asset_type: str | None = None,
+) -> list[AssetSnapshot]:
+    """
+    Get asset snapshots with optional filtering.
+
+    Args:
+        db: Database session
+        start_date: Optional start date filter (inclusive)
+        end_date: Optional end date filter (inclusive)
+        asset_type: Optional asset type filter
+
+    Returns:
+        List of asset snapshots ordered by snapshot_date DESC, asset_type ASC
+    """
+    return list(get_snapshots_iter(db, start_date, end_date, asset_type))
 
 
 def get_snapshots_by_date(db: Session, snapshot_date: datetime) -> list[AssetSnapshot]:
@@ -144,17 +202,20 @@ def get_snapshots_by_date(db: Session, snapshot_date: datetime) -> list[AssetSna
     Raises:
         SnapshotNotFoundError: If no snapshots exist for that date
     """
-    snapshots = (
-        db.query(AssetSnapshot)
-        .filter(AssetSnapshot.snapshot_date == snapshot_date)
-        .order_by(AssetSnapshot.asset_type.asc())
-        .all()
-    )
+    # Single range scan on idx_snapshot_date_desc_asset_type; the ordering comes from
+    # the index and an empty result doubles as the existence check
+    snapshots = db.scalars(
+        lambda_stmt(
+            lambda: select(AssetSnapshot)
+            .where(AssetSnapshot.snapshot_date == snapshot_date)
+            .order_by(AssetSnapshot.asset_type.asc())
+        )
+    ).all()
 
     if not snapshots:
         raise SnapshotNotFoundError(snapshot_date.isoformat())
 
-    return snapshots
+    return list(snapshots)
 
 
 def delete_snapshots_by_date(db: Session, snapshot_date: datetime) -> int:
@@ -171,38 +232,118 @@ def delete_snapshots_by_date(db: Session, snapshot_date: datetime) -> int:
     Raises:
         SnapshotNotFoundError: If no snapshots exist for that date
     """
-    # Get snapshots to check existence and for audit log
-    snapshots = (
-        db.query(AssetSnapshot)
-        .filter(AssetSnapshot.snapshot_date == snapshot_date)
-        .all()
-    )
+    # Delete in one statement; the returned IDs double as the existence check
+    deleted_ids = db.scalars(
+        delete(AssetSnapshot)
+        .where(AssetSnapshot.snapshot_date == snapshot_date)
+        .returning(AssetSnapshot.id)
+    ).all()
 
-    if not snapshots:
+    if not deleted_ids:
+        db.rollback()
         raise SnapshotNotFoundError(snapshot_date.isoformat())
 
-    # Store for audit log
-    deleted_count = len(snapshots)
-
-    # Delete all snapshots for this date
-    db.query(AssetSnapshot).filter(
-        AssetSnapshot.snapshot_date == snapshot_date
-    ).delete()
     db.commit()
 
-    # AUDIT LOG
-    log_with_context(
-        logger,
-        logging.INFO,
-        "Asset snapshots deleted",
-        operation="DELETE",
-        snapshot_date=snapshot_date.isoformat(),
-        deleted_count=deleted_count,
-    )
+    # Store for audit log
+    deleted_count = len(deleted_ids)
+
+    # AUDIT LOG (skip building fields entirely when INFO is disabled)
+    if logger.isEnabledFor(logging.INFO):
+        log_with_context(
+            logger,
+            logging.INFO,
+            "Asset snapshots deleted",
+            operation="DELETE",
+            snapshot_date=snapshot_date.isoformat(),
+            deleted_count=deleted_count,
+        )
 
     return deleted_count
 
 
+def _apply_date_filters(query, start_date: datetime | None, end_date: datetime | None):
+    """Apply optional inclusive snapshot_date bounds to a query."""
+    if start_date:
+        query = query.filter(AssetSnapshot.snapshot_date >= start_date)
+    if end_date:
+        query = query.filter(AssetSnapshot.snapshot_date <= end_date)
+    return query
+
+
+# Row kinds in the summary bundle; also its sort order within a date
+_SUMMARY_KIND_TOTAL = 0
+_SUMMARY_KIND_CURRENCY = 1
+_SUMMARY_KIND_ASSET_TYPE = 2
+
+
+def _snapshot_summary_bundle(start_date: datetime | None, end_date: datetime | None):
+    """
+    Build one UNION ALL query returning every per-date summary aggregate.
+
+    Each row is (snapshot_date, kind, key, total, exchange_rate, oldest_total):
+    - kind 0: EUR total per date (key NULL), with the date's exchange rate and
+      the EUR total of the oldest date in the filtered range
+    - kind 1: native-currency total per (date, currency)
+    - kind 2: EUR total per (date, asset_type)
+
+    Rows are ordered by snapshot_date DESC, kind, key.
+    """
+    no_key = cast(null(), String)
+    no_rate = cast(null(), AssetSnapshot.exchange_rate.type)
+    no_total = cast(null(), AssetSnapshot.value_eur.type)
+
+    # Baseline is the oldest date's total, carried on every totals row; the
+    # changes from it are computed in Python with Decimal arithmetic
+    total = func.sum(AssetSnapshot.value_eur)
+    baseline = func.first_value(total).over(order_by=AssetSnapshot.snapshot_date.asc())
+
+    totals = _apply_date_filters(
+        select(
+            AssetSnapshot.snapshot_date,
+            literal(_SUMMARY_KIND_TOTAL).label("kind"),
+            no_key.label("key"),
+            total.label("total"),
+            func.max(AssetSnapshot.exchange_rate).label("exchange_rate"),
+            baseline.label("oldest_total"),
+        ),
+        start_date,
+        end_date,
+    ).group_by(AssetSnapshot.snapshot_date)
+
+    by_currency = _apply_date_filters(
+        select(
+            AssetSnapshot.snapshot_date,
+            literal(_SUMMARY_KIND_CURRENCY),
+            AssetSnapshot.currency,
+            func.sum(AssetSnapshot.value),
+            no_rate,
+            no_total,
+        ),
+        start_date,
+        end_date,
+    ).group_by(AssetSnapshot.snapshot_date, AssetSnapshot.currency)
+
+    by_asset_type = _apply_date_filters(
+        select(
+            AssetSnapshot.snapshot_date,
+            literal(_SUMMARY_KIND_ASSET_TYPE),
+            AssetSnapshot.asset_type,
+            func.sum(AssetSnapshot.value_eur),
+            no_rate,
+            no_total,
+        ),
+        start_date,
+        end_date,
+    ).group_by(AssetSnapshot.snapshot_date, AssetSnapshot.asset_type)
+
+    bundle = union_all(totals, by_currency, by_asset_type)
+    columns = bundle.selected_columns
+    return bundle.order_by(
+        columns.snapshot_date.desc(), columns.kind.asc(), columns.key.asc()
+    )
+
+
 def get_snapshot_summaries(
     db: Session,
     start_date: datetime | None = None,
@@ -224,145 +365,80 @@ def get_snapshot_summaries(
     Returns:
         List of SnapshotSummary objects ordered by snapshot_date DESC
     """
-    # Build query with date filters
-    query = db.query(
-        AssetSnapshot.snapshot_date,
-        AssetSnapshot.currency,
-        AssetSnapshot.asset_type,
-        AssetSnapshot.exchange_rate,
-        func.sum(AssetSnapshot.value).label("total_value"),
-        func.sum(AssetSnapshot.value_eur).label("total_value_eur"),
+    # Totals and both breakdowns in a single round-trip, newest date first.
+    # Rows are streamed in batches; only the current date's rows are held
+    rows = db.execute(
+        _snapshot_summary_bundle(start_date, end_date),
+        execution_options={"yield_per": SNAPSHOT_STREAM_BATCH_SIZE},
     )
 
-    if start_date:
-        query = query.filter(AssetSnapshot.snapshot_date >= start_date)
-    if end_date:
-        query = query.filter(AssetSnapshot.snapshot_date <= end_date)
-
-    # Group by snapshot_date, currency, asset_type, exchange_rate
-    # Order by snapshot_date DESC
-    results = (
-        query.group_by(
-            AssetSnapshot.snapshot_date,
-            AssetSnapshot.currency,
-            AssetSnapshot.asset_type,
-            AssetSnapshot.exchange_rate,
+    # Each date's rows arrive together: its totals row first, then currencies,
+    # then asset types (each ordered by key)
+    by_kind = attrgetter("kind")
+    summaries = []
+    for snapshot_date, group in groupby(rows, key=attrgetter("snapshot_date")):
+        totals = next(group)
+        absolute_change = totals.total - totals.oldest_total
+        if totals.oldest_total > 0:
+            # ((current - oldest) / oldest) x 100
+            percentage_change = absolute_change / totals.oldest_total * Decimal("100")
+        else:
+            # Avoid division by zero - set to 0%
+            percentage_change = Decimal("0")
+        by_currency = []
+        by_asset_type = []
+        # Rows are already sorted by kind then key, so each breakdown is built
+        # straight from its run of rows: one kind test per run, no re-sorting
+        for kind, kind_rows in groupby(group, key=by_kind):
+            if kind == _SUMMARY_KIND_CURRENCY:
+                by_currency = [
+                    CurrencyBreakdown(currency=row.key, total_value=row.total)
+                    for row in kind_rows
+                ]
+            else:
+                by_asset_type = [
+                    AssetTypeBreakdown(asset_type=row.key, total_value_eur=row.total)
+                    for row in kind_rows
+                ]
+
+        summaries.append(
+            SnapshotSummary(
+                snapshot_date=snapshot_date,
+                total_value_eur=totals.total,
+                exchange_rate_used=totals.exchange_rate,
+                by_currency=by_currency,
+                by_asset_type=by_asset_type,
+                absolute_change_from_oldest=absolute_change,
+                percentage_change_from_oldest=percentage_change,
+            )
         )
-        .order_by(AssetSnapshot.snapshot_date.desc())
-        .all()
-    )
 
     # If no results, return empty list and 0 avg_monthly_increment
-    if not results:
+    if not summaries:
         return [], Decimal("0")
 
-    # Group results by snapshot_date using Python
-    summaries_dict: dict[datetime, dict] = {}
+    # Oldest snapshot is last element (DESC order)
+    oldest_value = summaries[-1].total_value_eur
+    oldest_date = summaries[-1].snapshot_date
 
-    for row in results:
-        snapshot_date = row.snapshot_date
-        currency = row.currency
-        asset_type = row.asset_type
-        exchange_rate = row.exchange_rate
-        total_value = row.total_value
-        total_value_eur = row.total_value_eur
+    # Latest snapshot is first element (DESC order)
+    latest_value = summaries[0].total_value_eur
+    latest_date = summaries[0].snapshot_date
 
-        # Initialize summary for this date if not exists
-        if snapshot_date not in summaries_dict:
-            summaries_dict[snapshot_date] = {
-                "snapshot_date": snapshot_date,
-                "exchange_rate_used": exchange_rate,
-                "total_value_eur": Decimal("0"),
-                "by_currency": {},
-                "by_asset_type": {},
-            }
-
-        # Accumulate total EUR value
-        summaries_dict[snapshot_date]["total_value_eur"] += total_value_eur
-
-        # Accumulate currency breakdown
-        if currency in summaries_dict[snapshot_date]["by_currency"]:
-            summaries_dict[snapshot_date]["by_currency"][currency] += total_value
-        else:
-            summaries_dict[snapshot_date]["by_currency"][currency] = total_value
-
-        # Accumulate asset type breakdown
-        if asset_type in summaries_dict[snapshot_date]["by_asset_type"]:
-            summaries_dict[snapshot_date]["by_asset_type"][asset_type] += total_value_eur
-        else:
-            summaries_dict[snapshot_date]["by_asset_type"][asset_type] = total_value_eur
-
-    # Convert to list of SnapshotSummary objects
-    summaries = []
-    for snapshot_date in sorted(summaries_dict.keys(), reverse=True):  # DESC order
-        summary_data = summaries_dict[snapshot_date]
-
-        # Convert currency dict to list of CurrencyBreakdown
-        by_currency = [
-            CurrencyBreakdown(currency=curr, total_value=val)
-            for curr, val in sorted(summary_data["by_currency"].items())
-        ]
-
-        # Convert asset_type dict to list of AssetTypeBreakdown
-        by_asset_type = [
-            AssetTypeBreakdown(asset_type=asset_type, total_value_eur=val)
-            for asset_type, val in sorted(summary_data["by_asset_type"].items())
-        ]
-
-        summary = SnapshotSummary(
-            snapshot_date=snapshot_date,
-            total_value_eur=summary_data["total_value_eur"],
-            exchange_rate_used=summary_data["exchange_rate_used"],
-            by_currency=by_currency,
-            by_asset_type=by_asset_type,
-            absolute_change_from_oldest=Decimal("0"),  # Placeholder, calculated below
-            percentage_change_from_oldest=Decimal("0"),  # Placeholder, calculated below
-        )
-        summaries.append(summary)
-
-    # Calculate absolute and percentage change from oldest snapshot (baseline)
-    if summaries:
-        # Oldest snapshot is last element (DESC order)
-        oldest_value = summaries[-1].total_value_eur
-        oldest_date = summaries[-1].snapshot_date
-
-        # Latest snapshot is first element (DESC order)
-        latest_value = summaries[0].total_value_eur
-        latest_date = summaries[0].snapshot_date
+    # Calculate days between oldest and latest
+    days_between = (latest_date - oldest_date).days
 
-        # Calculate days between oldest and latest
-        days_between = (latest_date - oldest_date).days
-
-        # Calculate average monthly increment
-        # If 0 or 1 summaries, or days_between is 0, avg_monthly_increment = 0
-        if len(summaries) <= 1 or days_between == 0:
-            avg_monthly_increment = Decimal("0.00")
-        else:
-            # Formula: ((latest - oldest) / days) * 30
-            value_change = latest_value - oldest_value
-            avg_monthly_increment = ((value_change / Decimal(str(days_between))) * Decimal("30")).quantize(Decimal("0.01"))
-
-        for summary in summaries:
-            # Calculate absolute change: current - oldest
-            absolute_change = summary.total_value_eur - oldest_value
-
-            if oldest_value > 0:
-                # Calculate percentage: ((current - oldest) / oldest) × 100
-                percentage_change = (
-                    absolute_change
-                    / oldest_value
-                    * Decimal("100")
-                )
-            else:
-                # Avoid division by zero - set to 0%
-                percentage_change = Decimal("0")
-
-            # Update changes in summary
-            summary.absolute_change_from_oldest = absolute_change
-            summary.percentage_change_from_oldest = percentage_change
+    # Calculate average monthly increment
+    # If 0 or 1 summaries, or days_between is 0, avg_monthly_increment = 0
+    if len(summaries) <= 1 or days_between == 0:
+        avg_monthly_increment = Decimal("0.00")
     else:
-        # Empty summaries, set avg_monthly_increment to 0
-        avg_monthly_increment = Decimal("0")
+        # Formula: ((latest - oldest) / days) * 30
+        value_change = latest_value - oldest_value
+        # Decimal(int) is exact; no need to round-trip the day count through str
+        avg_monthly_increment = (
+            (value_change / Decimal(days_between)) * Decimal("30")
+        ).quantize(Decimal("0.01"))
 
     # AUDIT LOG
     log_with_context(
@@ -378,6 +454,43 @@ def get_snapshot_summaries(
     return summaries, avg_monthly_increment
 
 
+def _snapshot_import_result(row_data, snapshot_id: int) -> dict:
+    """Build the import result entry for a successfully inserted CSV row."""
+    return {
+        "row": row_data.row_number,
+        "snapshot_id": snapshot_id,
+        "snapshot_date": row_data.snapshot_date,
+        "asset_type": row_data.asset_type,
+    }
+
+
+def _record_snapshot_import_success(results: dict, row_data, snapshot_id: int) -> None:
+    """Append a successfully inserted CSV row to the import results."""
+    results["successful"] += 1
+    results["results"].append(_snapshot_import_result(row_data, snapshot_id))
+
+
+def _record_snapshot_import_error(results: dict, row_data, error: Exception) -> None:
+    """Append a failed CSV row to the import results."""
+    results["failed"] += 1
+    error_message = str(error)
+    results["errors"].append({
+        "row": row_data.row_number,
+        "snapshot_date": row_data.snapshot_date.isoformat() if row_data.snapshot_date else None,
+        "asset_type": row_data.asset_type,
+        "errors": [error_message],
+        "raw_data": row_data.raw_row,
+    })
+
+    log_with_context(
+        logger,
+        logging.WARNING,
+        "Snapshot import failed for row",
+        row=row_data.row_number,
+        error=error_message,
+    )
+
+
 def import_snapshots_from_csv(db: Session, csv_content: str) -> dict:
     """
     Import asset snapshots from CSV file.
@@ -431,52 +544,63 @@ def import_snapshots_from_csv(db: Session, csv_content: str) -> dict:
         )
         raise
 
-    # Process each row
-    for row_data in parsed_rows:
-        try:
-            # Create AssetSnapshot record
-            snapshot = AssetSnapshot(
-                snapshot_date=row_data.snapshot_date,
-                asset_type=row_data.asset_type,
-                asset_detail=row_data.asset_detail,
-                currency=row_data.currency,
-                value=row_data.value,
-                exchange_rate=row_data.exchange_rate,
-                value_eur=row_data.value_eur,
-                created_at=row_data.created_at or datetime.utcnow(),
-            )
-
-            db.add(snapshot)
-            db.flush()  # Get the ID
-
-            # Record success
-            results["successful"] += 1
-            results["results"].append({
-                "row": row_data.row_number,
-                "snapshot_id": snapshot.id,
-                "snapshot_date": snapshot.snapshot_date,
-                "asset_type": snapshot.asset_type,
-            })
+    # Insert payloads built once, straight from the parsed rows; rows without a
+    # created_at share one import timestamp (naive UTC, like the column)
+    imported_at = utc_now()
+    payloads = [
+        {
+            "snapshot_date": row_data.snapshot_date,
+            "asset_type": row_data.asset_type,
+            "asset_detail": row_data.asset_detail,
+            "currency": row_data.currency,
+            "value": row_data.value,
+            "exchange_rate": row_data.exchange_rate,
+            "value_eur": row_data.value_eur,
+            "created_at": row_data.created_at or imported_at,
+        }
+        for row_data in parsed_rows
+    ]
 
-        except Exception as e:
-            # Record failure
-            results["failed"] += 1
-            error_message = str(e)
-            results["errors"].append({
-                "row": row_data.row_number,
-                "snapshot_date": row_data.snapshot_date.isoformat() if row_data.snapshot_date else None,
-                "asset_type": row_data.asset_type,
-                "errors": [error_message],
-                "raw_data": row_data.raw_row,
-            })
+    # Insert in chunks: one multi-row INSERT ... RETURNING id per chunk
+    for start in range(0, len(parsed_rows), CSV_IMPORT_CHUNK_SIZE):
+        chunk = parsed_rows[start:start + CSV_IMPORT_CHUNK_SIZE]
+        chunk_dicts = payloads[start:start + CSV_IMPORT_CHUNK_SIZE]
 
+        try:
+            with db.begin_nested():
+                inserted_ids = db.scalars(
+                    insert(AssetSnapshot).returning(
+                        AssetSnapshot.id, sort_by_parameter_order=True
+                    ),
+                    chunk_dicts,
+                ).all()
+        except SQLAlchemyError as e:
             log_with_context(
                 logger,
                 logging.WARNING,
-                "Snapshot import failed for row",
-                row=row_data.row_number,
-                error=error_message,
+                "Snapshot chunk insert failed, retrying row by row",
+                rows=len(chunk),
+                error=str(e),
             )
+            # Fall back to one savepoint per row to isolate the failing rows
+            for row_data, row_dict in zip(chunk, chunk_dicts):
+                try:
+                    with db.begin_nested():
+                        snapshot_id = db.scalars(
+                            insert(AssetSnapshot).returning(AssetSnapshot.id),
+                            row_dict,
+                        ).one()
+                    _record_snapshot_import_success(results, row_data, snapshot_id)
+                except Exception as row_error:
+                    _record_snapshot_import_error(results, row_data, row_error)
+            continue
+
+        # Record the whole chunk at once rather than touching results per row
+        results["results"].extend(
+            _snapshot_import_result(row_data, snapshot_id)
+            for row_data, snapshot_id in zip(chunk, inserted_ids)
+        )
+        results["successful"] += len(inserted_ids)
 
     # Commit if any successful
     if results["successful"] > 0:
@@ -515,11 +639,14 @@ def delete_all_snapshots(db: Session) -> int:
         Exception: If database operation fails
     """
     try:
-        # Get count before deletion
-        count = db.query(AssetSnapshot).count()
+        # Get count before deletion (server-side scalar)
+        count = db.scalar(select(func.count()).select_from(AssetSnapshot))
 
-        # Delete all snapshots
-        db.query(AssetSnapshot).delete()
+        # Delete all snapshots; TRUNCATE skips per-row work where supported
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text(f"TRUNCATE TABLE {AssetSnapshot.__tablename__} RESTART IDENTITY"))
+        else:
+            db.query(AssetSnapshot).delete(synchronize_session=False)
         db.commit()
 
         # AUDIT LOG
@@ -2,21 +2,80 @@ import logging
 import time
 from datetime import date
 from decimal import Decimal
+from itertools import groupby
+from operator import itemgetter
 from typing import Optional
 
+from sqlalchemy import case, event, func, select
 from sqlalchemy.orm import Session
 
 from app.constants import TransactionType
 from app.logging_config import log_with_context
+from app.models.position_value import PositionValue
 from app.models.transaction import Transaction
 from app.schemas.analytics import (
     CostBasisResponse,
     PortfolioSummaryResponse,
 )
-from app.services import position_value_service
 
 logger = logging.getLogger(__name__)
 
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+
+# Scale of Transaction.units; SQL-side unit comparisons round to it
+_UNITS_SCALE = 4
+
+# Session.info key for request-scoped memoization
+_OPEN_POSITIONS_VALUE_KEY = "open_positions_value"
+
+# Last portfolio summary and the data version token it was computed from
+_PORTFOLIO_SUMMARY_CACHE_KEY = "portfolio_summary"
+_portfolio_summary_cache: dict[str, tuple[tuple, PortfolioSummaryResponse]] = {}
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_open_positions_value(session: Session, transaction) -> None:
+    """Drop the memoized value whenever a session transaction ends (commit, rollback, close)."""
+    session.info.pop(_OPEN_POSITIONS_VALUE_KEY, None)
+
+
+def _net_units():
+    """SUM of units with SELLs counted negative (NULL when there are no rows)."""
+    is_buy = Transaction.transaction_type == TransactionType.BUY
+    return func.sum(case((is_buy, Transaction.units), else_=-Transaction.units))
+
+
+def _rounded_net_units():
+    """
+    _net_units() rounded to the units scale, for comparisons in SQL.
+
+    SQLite stores Numeric columns as REAL, so e.g. BUY 0.1 + BUY 0.2 - SELL 0.3
+    sums to a tiny non-zero residue; rounding makes such a position compare
+    as closed, as the Decimal result does in Python.
+    """
+    return func.round(_net_units(), _UNITS_SCALE)
+
+
+def _cost_basis_columns() -> list:
+    """
+    Labeled aggregate columns shared by the single-ISIN and all-ISIN queries.
+
+    BUY/SELL amounts are split with conditional SUMs so a group needs no
+    per-type rows and no Python-side Decimal folding.
+    """
+    is_buy = Transaction.transaction_type == TransactionType.BUY
+    is_sell = Transaction.transaction_type == TransactionType.SELL
+    amount = Transaction.price_per_unit * Transaction.units
+
+    return [
+        func.coalesce(func.sum(case((is_buy, amount), else_=0)), 0).label("costs"),
+        func.coalesce(func.sum(case((is_sell, amount), else_=0)), 0).label("gains"),
+        func.coalesce(_net_units(), 0).label("units"),
+        func.coalesce(func.sum(Transaction.fee), 0).label("fees"),
+        func.count(Transaction.id).label("count"),
+    ]
+
 
 def calculate_cost_basis(
     db: Session, isin: str, as_of_date: Optional[date] = None
@@ -32,46 +91,22 @@ def calculate_cost_basis(
     Returns:
         Cost basis response or None if no transactions found
     """
+    # Normalize once; everything below uses the canonical (stored) form
+    isin = isin.upper()
     start_time = time.time()
 
-    query = db.query(Transaction).filter(Transaction.isin == isin.upper())
+    # All sums in one conditional aggregate; no rows are loaded, and no ORDER BY
+    # since the sums do not depend on row order
+    query = db.query(*_cost_basis_columns()).filter(Transaction.isin == isin)
 
     if as_of_date:
         query = query.filter(Transaction.date <= as_of_date)
 
-    transactions = query.order_by(Transaction.date.asc()).all()
+    totals = query.one()
 
-    if not transactions:
+    if totals.count == 0:
         return None
 
-    total_units = Decimal("0")
-
-    sum_costs_without_fees = Decimal("0")
-    sum_gains_without_fees = Decimal("0")
-
-    total_fees = Decimal("0")
-    transaction_count = 0
-
-    for txn in transactions:
-        if txn.transaction_type == TransactionType.BUY:
-            # Add cost including fee
-            without_fee_cost = txn.price_per_unit * txn.units
-            sum_costs_without_fees += without_fee_cost
-
-            total_fees += txn.fee
-            total_units += txn.units
-
-            transaction_count += 1
-        elif txn.transaction_type == TransactionType.SELL:
-            # Calculate proportion of cost basis to remove
-            gaining_without_fees = txn.price_per_unit * txn.units
-            sum_gains_without_fees = sum_gains_without_fees + gaining_without_fees
-
-            total_fees += txn.fee
-            total_units -= txn.units
-
-            transaction_count += 1
-
     duration_ms = (time.time() - start_time) * 1000
 
     # PERFORMANCE LOG (only if slow)
@@ -80,18 +115,18 @@ def calculate_cost_basis(
             logger,
             logging.WARNING,
             "Slow cost basis calculation",
-            isin=isin.upper(),
-            transaction_count=len(transactions),
+            isin=isin,
+            transaction_count=totals.count,
             duration_ms=round(duration_ms, 2),
         )
 
     return CostBasisResponse(
-        isin=isin.upper(),
-        total_units=total_units,
-        total_cost_without_fees=sum_costs_without_fees,
-        total_gains_without_fees=sum_gains_without_fees,
-        total_fees=total_fees,
-        transactions_count=transaction_count,
+        isin=isin,
+        total_units=totals.units,
+        total_cost_without_fees=totals.costs,
+        total_gains_without_fees=totals.gains,
+        total_fees=totals.fees,
+        transactions_count=totals.count,
         current_value=None,  # Will be set by caller if available
         absolute_pl_without_fees=None,
         percentage_pl_without_fees=None,
@@ -100,136 +135,283 @@ def calculate_cost_basis(
     )
 
 
+# Position state computed in the aggregate query (sorted DESC, then by ISIN)
+_OPEN = 1
+_CLOSED = 0
+
+
+def _aggregate_all(
+    db: Session,
+) -> list[tuple[int, CostBasisResponse, Optional[Decimal]]]:
+    """
+    Calculate cost basis for every ISIN with one grouped aggregate query.
+
+    Equivalent to calling calculate_cost_basis() per ISIN, but every sum is
+    taken per ISIN in the database in a single round-trip. Each ISIN's
+    position value comes from a LEFT JOIN in the same query (isin is unique
+    in position_values, so the join does not multiply transaction rows).
+    The query also classifies each position (1 open, 0 closed, -1 negative
+    units) and sorts on it, so open and closed positions arrive as
+    contiguous runs.
+
+    Args:
+        db: Database session
+
+    Returns:
+        (state, cost basis without P/L fields, position value or None) tuples,
+        ordered by state descending, then ISIN
+    """
+    net_units = _rounded_net_units()
+    state = case((net_units > 0, _OPEN), (net_units == 0, _CLOSED), else_=-1).label("state")
+    rows = (
+        db.query(Transaction.isin, *_cost_basis_columns(), PositionValue.current_value, state)
+        .outerjoin(PositionValue, PositionValue.isin == Transaction.isin)
+        .group_by(Transaction.isin, PositionValue.current_value)
+        .order_by(state.desc(), Transaction.isin)
+        .all()
+    )
+
+    return [
+        (
+            row.state,
+            CostBasisResponse(
+                isin=row.isin,  # Stored uppercase (schema-normalized)
+                total_units=row.units,
+                total_cost_without_fees=row.costs,
+                total_gains_without_fees=row.gains,
+                total_fees=row.fees,
+                transactions_count=row.count,
+            ),
+            row.current_value,
+        )
+        for row in rows
+    ]
+
+
+def _profit_loss(value: Decimal, cost: Decimal) -> tuple[Decimal, Decimal]:
+    """
+    Absolute and percentage profit/loss of value against cost.
+
+    Percentage is 0 when cost is not positive (avoids division by zero).
+    """
+    absolute = value - cost
+    return absolute, (absolute / cost * _HUNDRED if cost > 0 else _ZERO)
+
+
+def _with_unrealized_pl(
+    cost_basis: CostBasisResponse, current_value: Optional[Decimal]
+) -> CostBasisResponse:
+    """Fill in P/L of an open holding against its current value, if known."""
+    if current_value is not None:
+        net_cost = cost_basis.total_cost_without_fees - cost_basis.total_gains_without_fees
+        cost_basis.current_value = current_value
+        (
+            cost_basis.absolute_pl_without_fees,
+            cost_basis.percentage_pl_without_fees,
+        ) = _profit_loss(current_value, net_cost)
+        (
+            cost_basis.absolute_pl_with_fees,
+            cost_basis.percentage_pl_with_fees,
+        ) = _profit_loss(current_value, net_cost + cost_basis.total_fees)
+    return cost_basis
+
+
+def _with_realized_pl(cost_basis: CostBasisResponse) -> CostBasisResponse:
+    """Fill in realized P/L of a closed position (sell proceeds vs buy cost)."""
+    cost_basis.current_value = _ZERO
+    (
+        cost_basis.absolute_pl_without_fees,
+        cost_basis.percentage_pl_without_fees,
+    ) = _profit_loss(cost_basis.total_gains_without_fees, cost_basis.total_cost_without_fees)
+    (
+        cost_basis.absolute_pl_with_fees,
+        cost_basis.percentage_pl_with_fees,
+    ) = _profit_loss(
+        cost_basis.total_gains_without_fees,
+        cost_basis.total_cost_without_fees + cost_basis.total_fees,
+    )
+    return cost_basis
+
+
 def calculate_current_holdings_and_closed_positions(
-    db: Session, position_values_map: dict[str, Decimal]
+    db: Session, position_values_map: Optional[dict[str, Decimal]] = None
 ) -> tuple[list[CostBasisResponse], list[CostBasisResponse]]:
     """
     Calculate current holdings and closed positions for all ISINs with P/L calculations.
 
     Args:
         db: Database session
-        position_values_map: Dictionary mapping ISIN to current position value
+        position_values_map: Optional mapping of ISIN to current position value.
+            When omitted, stored position values are joined in the aggregate query.
 
     Returns:
         Tuple of (holdings, closed_positions)
     """
-    # Get all unique ISINs
-    isins = db.query(Transaction.isin).distinct().all()
-
-    holdings = []
-    closed_positions = []
-    for (isin,) in isins:
-        cost_basis = calculate_cost_basis(db, isin)
-        if cost_basis:
-            # Get position value for this ISIN
-            current_value = position_values_map.get(isin.upper())
-
-            # Calculate P/L if position value is available and position is open
-            if current_value is not None and cost_basis.total_units > 0:
-                # P/L without fees
-                total_cost_without_fees = (
-                    cost_basis.total_cost_without_fees - cost_basis.total_gains_without_fees
-                )
-                absolute_pl_without_fees = current_value - total_cost_without_fees
-                percentage_pl_without_fees = (
-                    (absolute_pl_without_fees / total_cost_without_fees * Decimal("100"))
-                    if total_cost_without_fees > 0
-                    else Decimal("0")
-                )
-
-                # P/L with fees
-                total_cost_with_fees = total_cost_without_fees + cost_basis.total_fees
-                absolute_pl_with_fees = current_value - total_cost_with_fees
-                percentage_pl_with_fees = (
-                    (absolute_pl_with_fees / total_cost_with_fees * Decimal("100"))
-                    if total_cost_with_fees > 0
-                    else Decimal("0")
-                )
-
-                # Update cost basis with P/L values
-                cost_basis.current_value = current_value
-                cost_basis.absolute_pl_without_fees = absolute_pl_without_fees
-                cost_basis.percentage_pl_without_fees = percentage_pl_without_fees
-                cost_basis.absolute_pl_with_fees = absolute_pl_with_fees
-                cost_basis.percentage_pl_with_fees = percentage_pl_with_fees
-
-            # For closed positions, calculate realized P/L
-            elif cost_basis.total_units == 0:
-                # Realized P/L without fees
-                absolute_pl_without_fees = (
-                    cost_basis.total_gains_without_fees - cost_basis.total_cost_without_fees
-                )
-                percentage_pl_without_fees = (
-                    (absolute_pl_without_fees / cost_basis.total_cost_without_fees * Decimal("100"))
-                    if cost_basis.total_cost_without_fees > 0
-                    else Decimal("0")
-                )
-
-                # Realized P/L with fees
-                absolute_pl_with_fees = absolute_pl_without_fees - cost_basis.total_fees
-                total_cost_with_fees = cost_basis.total_cost_without_fees + cost_basis.total_fees
-                percentage_pl_with_fees = (
-                    (absolute_pl_with_fees / total_cost_with_fees * Decimal("100"))
-                    if total_cost_with_fees > 0
-                    else Decimal("0")
-                )
-
-                # Update with realized P/L
-                cost_basis.current_value = Decimal("0")  # Closed position
-                cost_basis.absolute_pl_without_fees = absolute_pl_without_fees
-                cost_basis.percentage_pl_without_fees = percentage_pl_without_fees
-                cost_basis.absolute_pl_with_fees = absolute_pl_with_fees
-                cost_basis.percentage_pl_with_fees = percentage_pl_with_fees
-
-            # Categorize as holding or closed position
-            if cost_basis.total_units > 0:
-                holdings.append(cost_basis)
-            elif cost_basis.total_units == 0:
-                closed_positions.append(cost_basis)
+    # Cost basis for every ISIN from a single aggregate query, already split
+    # into contiguous runs by position state
+    by_state = {
+        state: [(cost_basis, stored_value) for _, cost_basis, stored_value in group]
+        for state, group in groupby(_aggregate_all(db), key=itemgetter(0))
+    }
+
+    holdings = [
+        _with_unrealized_pl(
+            cost_basis,
+            stored_value
+            if position_values_map is None
+            else position_values_map.get(cost_basis.isin),
+        )
+        for cost_basis, stored_value in by_state.get(_OPEN, [])
+    ]
+    closed_positions = [
+        _with_realized_pl(cost_basis) for cost_basis, _ in by_state.get(_CLOSED, [])
+    ]
 
     return holdings, closed_positions
 
 
+def sum_units_for_isin(db: Session, isin: str) -> Optional[Decimal]:
+    """
+    Net units held for an ISIN (BUYs minus SELLs), in one aggregate query.
+
+    Cheaper than calculate_cost_basis when only the unit total is needed,
+    e.g. to tell whether a position is open, closed or being reopened.
+
+    Args:
+        db: Database session
+        isin: ISIN code (stored uppercase form)
+
+    Returns:
+        Net units, or None if the ISIN has no transactions
+    """
+    return db.scalar(select(_net_units()).where(Transaction.isin == isin))
+
+
+def nonzero_position_isins():
+    """
+    SELECT of ISINs whose net units are not zero.
+
+    Covers open positions (and oversold ones); ISINs that are closed or have
+    no transactions are not returned. Meant to be used as a subquery.
+    """
+    return select(Transaction.isin).group_by(Transaction.isin).having(_rounded_net_units() != 0)
+
+
+def get_open_positions_value(db: Session) -> Decimal:
+    """
+    Get the total current value of open positions.
+
+    Same figure as summing current_value over the holdings of
+    get_portfolio_summary(), computed in one aggregate that reads only the
+    ISIN, type and units columns instead of building the whole summary.
+    Memoized for the current session transaction.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Sum of position values for ISINs with units > 0
+    """
+    if _OPEN_POSITIONS_VALUE_KEY in db.info:
+        return db.info[_OPEN_POSITIONS_VALUE_KEY]
+
+    open_isins = (
+        select(Transaction.isin).group_by(Transaction.isin).having(_rounded_net_units() > 0)
+    )
+    value = db.scalar(
+        select(func.coalesce(func.sum(PositionValue.current_value), _ZERO))
+        .where(PositionValue.isin.in_(open_isins))
+    )
+    db.info[_OPEN_POSITIONS_VALUE_KEY] = value
+    return value
+
+
+def _portfolio_data_version(db: Session) -> tuple:
+    """
+    Cheap token that changes whenever transactions or position values change.
+
+    Row count catches deletes, max id catches inserts and max updated_at
+    catches in-place updates; both tables are read in one statement.
+    """
+    return tuple(
+        db.execute(
+            select(
+                select(func.count(Transaction.id)).scalar_subquery(),
+                select(func.max(Transaction.id)).scalar_subquery(),
+                select(func.max(Transaction.updated_at)).scalar_subquery(),
+                select(func.count(PositionValue.id)).scalar_subquery(),
+                select(func.max(PositionValue.id)).scalar_subquery(),
+                select(func.max(PositionValue.updated_at)).scalar_subquery(),
+            )
+        ).one()
+    )
+
+
+def invalidate_portfolio_summary_cache() -> None:
+    """Drop the cached portfolio summary so the next read recomputes it."""
+    _portfolio_summary_cache.pop(_PORTFOLIO_SUMMARY_CACHE_KEY, None)
+
+
 def get_portfolio_summary(db: Session) -> PortfolioSummaryResponse:
     """
     Get overall portfolio summary with P/L calculations.
 
+    The last summary is cached in-process together with the data version
+    token it was computed from. Repeat calls with no changes to transactions
+    or position values cost one small query; the token is read from the
+    database, so writes made through any worker invalidate it.
+
     Args:
         db: Database session
 
     Returns:
         Portfolio summary with calculated P/L for each holding
     """
-    start_time = time.time()
+    version = _portfolio_data_version(db)
+    cached = _portfolio_summary_cache.get(_PORTFOLIO_SUMMARY_CACHE_KEY)
+    if cached is not None and cached[0] == version:
+        return cached[1].model_copy(deep=True)
 
-    # Fetch all position values and create a map for efficient lookup
-    position_values = position_value_service.get_all_position_values(db)
-    position_values_map = {pv.isin.upper(): pv.current_value for pv in position_values}
+    summary = _build_portfolio_summary(db)
+    _portfolio_summary_cache[_PORTFOLIO_SUMMARY_CACHE_KEY] = (version, summary)
+    return summary.model_copy(deep=True)
 
-    # Calculate current holdings and closed positions with P/L
-    holdings, closed_positions = calculate_current_holdings_and_closed_positions(
-        db, position_values_map
-    )
 
-    # Calculate total invested (all BUY transactions)
-    buy_transactions = (
-        db.query(Transaction).filter(Transaction.transaction_type == TransactionType.BUY).all()
-    )
-    total_invested = sum((txn.price_per_unit * txn.units) for txn in buy_transactions)
+def _build_portfolio_summary(db: Session) -> PortfolioSummaryResponse:
+    """Compute the portfolio summary from the database (uncached)."""
+    start_time = time.time()
 
-    # Calculate total amount withdrawn (all SELL transactions)
-    sell_transactions = (
-        db.query(Transaction).filter(Transaction.transaction_type == TransactionType.SELL).all()
-    )
-    total_withdrawn = sum((txn.price_per_unit * txn.units) for txn in sell_transactions)
+    # Calculate current holdings and closed positions with P/L; position
+    # values are joined into the same aggregate query
+    holdings, closed_positions = calculate_current_holdings_and_closed_positions(db)
+
+    # Amount and fees per transaction type in one grouped query (at most 2 rows)
+    totals_by_type = {
+        row.transaction_type: row
+        for row in db.query(
+            Transaction.transaction_type,
+            func.sum(Transaction.price_per_unit * Transaction.units).label("amount"),
+            func.sum(Transaction.fee).label("fees"),
+        )
+        .group_by(Transaction.transaction_type)
+        .all()
+    }
+    buy_totals = totals_by_type.get(TransactionType.BUY)
+    sell_totals = totals_by_type.get(TransactionType.SELL)
+
+    # Total invested (all BUY transactions)
+    total_invested = buy_totals.amount if buy_totals else Decimal("0")
+
+    # Total amount withdrawn (all SELL transactions)
+    total_withdrawn = sell_totals.amount if sell_totals else Decimal("0")
 
-    # Calculate total fees
-    all_transactions = db.query(Transaction).all()
-    total_fees = sum(txn.fee for txn in all_transactions)
+    # Total fees across both types
+    total_fees = sum((row.fees for row in totals_by_type.values()), Decimal("0"))
 
-    # Calculate sum of all position values
+    # Sum of all position values, aggregated in the database (NULL when empty)
+    position_values_total = db.query(func.sum(PositionValue.current_value)).scalar()
     total_current_portfolio_invested_value = (
-        sum(pv.current_value for pv in position_values) if position_values else Decimal("0")
+        position_values_total if position_values_total is not None else Decimal("0")
     )
 
     # Calculate total profit/loss
@@ -2,16 +2,26 @@
 
 import csv
 import logging
+import re
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from io import StringIO
+from operator import itemgetter
 from typing import Optional
 
 from app.constants import TransactionType
 from app.logging_config import log_with_context
+from app.services.csv_utils import row_dict
 
 logger = logging.getLogger(__name__)
 
+# Plain DEGIRO numbers: optional minus, digits, optional "," or "." fraction
+_NUM_RE = re.compile(r"^\s*(-?)(\d+)(?:[,.](\d+))?\s*$")
+
+# DEGIRO exports repeat the same handful of dates on every row of a day
+_DATE_CACHE: dict[str, datetime.date] = {}
+_DATE_CACHE_MAX_SIZE = 4096
+
 
 class DEGIRORowData:
     """Parsed DEGIRO CSV row data."""
@@ -25,7 +35,10 @@ class DEGIRORowData:
         price: Decimal,
         fee: Decimal,
         transaction_type: TransactionType,
-        raw_row: dict,
+        raw_row: Optional[dict] = None,
+        *,
+        header: Optional[list[str]] = None,
+        raw_values: Optional[list[str]] = None,
     ):
         self.row_number = row_number
         self.date = date
@@ -34,7 +47,16 @@ class DEGIRORowData:
         self.price = price
         self.fee = fee
         self.transaction_type = transaction_type
-        self.raw_row = raw_row
+        self._raw_row = raw_row
+        self._header = header
+        self._raw_values = raw_values
+
+    @property
+    def raw_row(self) -> dict:
+        """Original CSV row keyed by column name (built on first access)."""
+        if self._raw_row is None:
+            self._raw_row = row_dict(self._header, self._raw_values)
+        return self._raw_row
 
 
 def parse_european_decimal(value: str) -> Decimal:
@@ -55,9 +77,18 @@ def parse_european_decimal(value: str) -> Decimal:
     Raises:
         ValueError: If value cannot be parsed
     """
+    match = _NUM_RE.match(value) if value else None
+    if match:
+        sign, whole, fraction = match.groups()
+        fraction = fraction or ""
+        return Decimal(
+            (1 if sign else 0, tuple(map(int, whole + fraction)), -len(fraction))
+        )
+
     if not value or value.strip() == "":
         return Decimal("0.00")
 
+    # Anything unusual (exponents, explicit plus sign) takes the generic path
     try:
         # Remove any whitespace and replace comma with dot
         clean_value = value.strip().replace(",", ".")
@@ -79,11 +110,20 @@ def parse_degiro_date(date_str: str) -> datetime.date:
     Raises:
         ValueError: If date cannot be parsed
     """
+    cached = _DATE_CACHE.get(date_str)
+    if cached is not None:
+        return cached
+
     try:
-        return datetime.strptime(date_str.strip(), "%d-%m-%Y").date()
+        parsed = datetime.strptime(date_str.strip(), "%d-%m-%Y").date()
     except ValueError:
         raise ValueError(f"Invalid date format: {date_str} (expected DD-MM-YYYY)")
 
+    if len(_DATE_CACHE) >= _DATE_CACHE_MAX_SIZE:
+        _DATE_CACHE.clear()
+    _DATE_CACHE[date_str] = parsed
+    return parsed
+
 
 def parse_degiro_row(row: dict, row_number: int) -> DEGIRORowData:
     """
@@ -146,6 +186,93 @@ def parse_degiro_row(row: dict, row_number: int) -> DEGIRORowData:
         raise ValueError(f"Row {row_number}: {str(e)}") from e
 
 
+# Columns read by the importer, in DEGIRORowData field order
+_DATE_COLUMN = "Date"
+_ISIN_COLUMN = "ISIN"
+_QUANTITY_COLUMN = "Quantity"
+_PRICE_COLUMN = "Price"
+_FEE_COLUMN = "Transaction and/or third party fees EUR"
+
+
+def _parse_degiro_columns(
+    header: list[str],
+    numbered_rows: list[tuple[int, list[str]]],
+) -> list[DEGIRORowData]:
+    """
+    Parse DEGIRO rows column by column.
+
+    Applies the same rules as parse_degiro_row, but reads fields by position,
+    maps each parser over a whole column and validates the batch at once.
+    Errors carry no row context; callers fall back to parse_degiro_row to
+    locate the bad row.
+
+    Args:
+        header: CSV header row
+        numbered_rows: (row number, values) pairs of non-empty csv.reader rows
+
+    Returns:
+        List of DEGIRORowData objects in input order
+
+    Raises:
+        ValueError: If any row cannot be parsed
+    """
+    if not numbered_rows:
+        return []
+
+    # Last occurrence wins for duplicate names, as with csv.DictReader
+    header_index = {column: i for i, column in enumerate(header)}
+    # One getter specialized to this file's column positions pulls all five
+    # fields of a row in a single C call; zip(*) then transposes to columns
+    get_fields = itemgetter(
+        header_index[_DATE_COLUMN],
+        header_index[_ISIN_COLUMN],
+        header_index[_QUANTITY_COLUMN],
+        header_index[_PRICE_COLUMN],
+        header_index[_FEE_COLUMN],
+    )
+    # Short rows get None for missing trailing fields, as with csv.DictReader
+    width = len(header)
+    padded_rows = [
+        values if len(values) >= width else values + [None] * (width - len(values))
+        for _, values in numbered_rows
+    ]
+    raw_dates, raw_isins, raw_quantities, raw_prices, raw_fees = zip(
+        *map(get_fields, padded_rows)
+    )
+
+    dates = list(map(parse_degiro_date, raw_dates))
+    isins = [isin.strip().upper() for isin in raw_isins]
+    quantities = list(map(parse_european_decimal, raw_quantities))
+    prices = list(map(parse_european_decimal, raw_prices))
+    fees = list(map(parse_european_decimal, raw_fees))
+
+    if not all(len(isin) == 12 for isin in isins):
+        raise ValueError("Invalid ISIN")
+    if not all(quantities):
+        raise ValueError("Quantity cannot be zero")
+    if not all(price > 0 for price in prices):
+        raise ValueError("Price must be positive")
+
+    return [
+        DEGIRORowData(
+            row_number=idx,
+            date=date,
+            isin=isin,
+            quantity=abs(quantity),
+            price=price,
+            fee=abs(fee),
+            transaction_type=(
+                TransactionType.BUY if quantity > 0 else TransactionType.SELL
+            ),
+            header=header,
+            raw_values=values,
+        )
+        for (idx, values), date, isin, quantity, price, fee in zip(
+            numbered_rows, dates, isins, quantities, prices, fees
+        )
+    ]
+
+
 def parse_degiro_csv(csv_content: str) -> list[DEGIRORowData]:
     """
     Parse DEGIRO CSV content.
@@ -161,42 +288,43 @@ def parse_degiro_csv(csv_content: str) -> list[DEGIRORowData]:
     """
     try:
         csv_file = StringIO(csv_content)
-        reader = csv.DictReader(csv_file)
+        # Blank lines are dropped entirely (not numbered), as csv.DictReader does
+        reader = (values for values in csv.reader(csv_file) if values)
+        header = next(reader, None)
 
         # Validate required columns
         required_columns = {
-            "Date",
+            _DATE_COLUMN,
             "Time",
-            "ISIN",
-            "Quantity",
-            "Price",
-            "Transaction and/or third party fees EUR",
+            _ISIN_COLUMN,
+            _QUANTITY_COLUMN,
+            _PRICE_COLUMN,
+            _FEE_COLUMN,
         }
 
-        if not reader.fieldnames:
+        if not header:
             raise ValueError("CSV file is empty or has no header")
 
-        missing_columns = required_columns - set(reader.fieldnames)
+        missing_columns = required_columns - set(header)
         if missing_columns:
             raise ValueError(
                 f"Missing required columns: {', '.join(missing_columns)}"
             )
 
-        # Parse rows
-        parsed_rows = []
-        for idx, row in enumerate(reader, start=1):
-            # Skip empty rows
-            if not any(row.values()):
-                continue
-
-            try:
-                parsed_data = parse_degiro_row(row, idx)
-                parsed_rows.append(parsed_data)
-            except ValueError:
-                # Re-raise to be caught by import service
-                raise
-
-        return parsed_rows
+        # Skip empty rows, keeping the original row numbers for error reporting
+        numbered_rows = [
+            (idx, values) for idx, values in enumerate(reader, start=1) if any(values)
+        ]
+
+        try:
+            return _parse_degiro_columns(header, numbered_rows)
+        except Exception:
+            # Re-parse row by row so the error names the offending row; if
+            # every row parses on its own, the row-wise result stands
+            return [
+                parse_degiro_row(row_dict(header, values), idx)
+                for idx, values in numbered_rows
+            ]
 
     except csv.Error as e:
         raise ValueError(f"Invalid CSV format: {str(e)}") from e
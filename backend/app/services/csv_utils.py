@@ -0,0 +1,12 @@
+"""Helpers shared by the CSV import parsers."""
+
+
+def row_dict(header: list[str], values: list[str]) -> dict:
+    """Build a row dict from header and values the way csv.DictReader does."""
+    row = dict(zip(header, values))
+    if len(values) > len(header):
+        row[None] = values[len(header):]
+    elif len(values) < len(header):
+        for column in header[len(values):]:
+            row[column] = None
+    return row
@@ -3,10 +3,12 @@
 import logging
 from typing import Optional
 
+from sqlalchemy import Row, bindparam, delete, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.constants import ISINType
+from app.database import dialect_insert, utc_now
 from app.exceptions import ISINMetadataAlreadyExistsError, ISINMetadataNotFoundError
 from app.logging_config import log_with_context
 from app.models.isin_metadata import ISINMetadata
@@ -14,6 +16,9 @@ from app.schemas.isin_metadata import ISINMetadataCreate, ISINMetadataUpdate
 
 logger = logging.getLogger(__name__)
 
+# Lookup statement built once at import; each call only binds the ISIN
+_GET_ISIN_METADATA_STMT = select(ISINMetadata).where(ISINMetadata.isin == bindparam("isin"))
+
 
 def create_isin_metadata(
     db: Session,
@@ -32,18 +37,11 @@ def create_isin_metadata(
     Raises:
         ISINMetadataAlreadyExistsError: If ISIN already exists
     """
-    # Normalize ISIN to uppercase for consistency
-    isin_normalized = metadata_data.isin.upper()
-
-    # Check if ISIN metadata already exists
-    existing = db.query(ISINMetadata).filter(
-        ISINMetadata.isin == isin_normalized
-    ).first()
-
-    if existing:
-        raise ISINMetadataAlreadyExistsError(isin_normalized)
+    # ISIN is already normalized to uppercase by ISINMetadataCreate
+    isin_normalized = metadata_data.isin
 
-    # Create new record
+    # Create new record; a duplicate ISIN is caught by the unique constraint
+    # (IntegrityError below), so no separate existence query is needed
     isin_metadata = ISINMetadata(
         isin=isin_normalized,
         name=metadata_data.name,
@@ -53,7 +51,6 @@ def create_isin_metadata(
     try:
         db.add(isin_metadata)
         db.commit()
-        db.refresh(isin_metadata)
 
         # AUDIT LOG
         log_with_context(
@@ -99,9 +96,9 @@ def get_isin_metadata(db: Session, isin: str) -> ISINMetadata:
     """
     isin_normalized = isin.upper()
 
-    isin_metadata = db.query(ISINMetadata).filter(
-        ISINMetadata.isin == isin_normalized
-    ).first()
+    isin_metadata = db.scalars(
+        _GET_ISIN_METADATA_STMT, {"isin": isin_normalized}
+    ).one_or_none()
 
     if not isin_metadata:
         raise ISINMetadataNotFoundError(isin_normalized)
@@ -123,13 +120,39 @@ def get_all_isin_metadata(
     Returns:
         List of ISIN metadata ordered by ISIN
     """
-    query = db.query(ISINMetadata)
+    stmt = select(ISINMetadata)
+
+    # Apply type filter if provided
+    if asset_type:
+        stmt = stmt.where(ISINMetadata.type == asset_type)
+
+    return list(db.scalars(stmt.order_by(ISINMetadata.isin.asc())))
+
+
+def get_all_isin_metadata_rows(
+    db: Session,
+    asset_type: Optional[ISINType] = None
+) -> list[Row]:
+    """
+    Get all ISIN metadata as plain column rows, for read-only listings.
+
+    Same filter and order as get_all_isin_metadata, without hydrating ORM
+    instances.
+
+    Args:
+        db: Database session
+        asset_type: Optional filter by asset type
+
+    Returns:
+        Rows with the isin_metadata columns as attributes, ordered by ISIN
+    """
+    stmt = select(*ISINMetadata.__table__.columns)
 
     # Apply type filter if provided
     if asset_type:
-        query = query.filter(ISINMetadata.type == asset_type)
+        stmt = stmt.where(ISINMetadata.type == asset_type)
 
-    return query.order_by(ISINMetadata.isin.asc()).all()
+    return list(db.execute(stmt.order_by(ISINMetadata.isin.asc())))
 
 
 def update_isin_metadata(
@@ -168,20 +191,22 @@ def update_isin_metadata(
         }
         isin_metadata.type = metadata_update.type
 
+    # Nothing changed: skip the commit round-trip for idempotent retries
+    if not changes:
+        return isin_metadata
+
     # updated_at will auto-update via onupdate in model
     db.commit()
-    db.refresh(isin_metadata)
 
     # AUDIT LOG
-    if changes:
-        log_with_context(
-            logger,
-            logging.INFO,
-            "ISIN metadata updated",
-            operation="UPDATE",
-            isin=isin_metadata.isin,
-            changes=changes,
-        )
+    log_with_context(
+        logger,
+        logging.INFO,
+        "ISIN metadata updated",
+        operation="UPDATE",
+        isin=isin_metadata.isin,
+        changes=changes,
+    )
 
     return isin_metadata
 
@@ -197,18 +222,27 @@ def delete_isin_metadata(db: Session, isin: str) -> None:
     Raises:
         ISINMetadataNotFoundError: If ISIN metadata not found
     """
-    isin_metadata = get_isin_metadata(db, isin)
+    isin_normalized = isin.upper()
+
+    # Delete and fetch the audit payload in one round-trip
+    deleted = db.execute(
+        delete(ISINMetadata)
+        .where(ISINMetadata.isin == isin_normalized)
+        .returning(ISINMetadata.isin, ISINMetadata.name, ISINMetadata.type)
+    ).first()
+
+    if deleted is None:
+        raise ISINMetadataNotFoundError(isin_normalized)
+
+    db.commit()
 
     # Store for audit log
     deleted_data = {
-        "isin": isin_metadata.isin,
-        "isin_name": isin_metadata.name,
-        "isin_type": isin_metadata.type.value,
+        "isin": deleted.isin,
+        "isin_name": deleted.name,
+        "isin_type": deleted.type.value,
     }
 
-    db.delete(isin_metadata)
-    db.commit()
-
     # AUDIT LOG
     log_with_context(
         logger,
@@ -219,6 +253,112 @@ def delete_isin_metadata(db: Session, isin: str) -> None:
     )
 
 
+def _on_isin_conflict_update(stmt):
+    """
+    Turn an ISIN metadata insert into an upsert on the isin column.
+
+    Existing rows are only updated when the name or type differs, so
+    re-posting the same metadata writes nothing.
+    """
+    return stmt.on_conflict_do_update(
+        index_elements=[ISINMetadata.isin],
+        set_={
+            "name": stmt.excluded.name,
+            "type": stmt.excluded.type,
+            "updated_at": stmt.excluded.updated_at,
+        },
+        where=or_(
+            ISINMetadata.name.is_distinct_from(stmt.excluded.name),
+            ISINMetadata.type.is_distinct_from(stmt.excluded.type),
+        ),
+    )
+
+
+def _upsert_isin_metadata(
+    db: Session,
+    metadata_data: ISINMetadataCreate
+) -> tuple[ISINMetadata, Optional[dict]]:
+    """
+    Run the upsert statement without committing.
+
+    Returns the row and its audit record (log_with_context() arguments),
+    or None instead of the audit record when nothing was written.
+    """
+    # ISIN is already normalized to uppercase by ISINMetadataCreate
+    isin_normalized = metadata_data.isin
+
+    # The audit log records the values being replaced; only read them when
+    # that log will be emitted
+    previous = None
+    if logger.isEnabledFor(logging.INFO):
+        existing = db.scalars(_GET_ISIN_METADATA_STMT, {"isin": isin_normalized}).one_or_none()
+        if existing is not None:
+            previous = (existing.name, existing.type)
+
+    # One atomic INSERT ... ON CONFLICT DO UPDATE instead of SELECT + write.
+    # Both timestamps get the same value, so created_at == now means the
+    # row was inserted rather than updated.
+    now = utc_now()
+    stmt = dialect_insert(db)(ISINMetadata).values(
+        isin=isin_normalized,
+        name=metadata_data.name,
+        type=metadata_data.type,
+        created_at=now,
+        updated_at=now,
+    )
+    stmt = _on_isin_conflict_update(stmt).returning(ISINMetadata)
+
+    isin_metadata = db.scalars(
+        stmt, execution_options={"populate_existing": True}
+    ).one_or_none()
+    if isin_metadata is None:
+        # Existing row already holds these values: nothing written
+        return db.scalars(_GET_ISIN_METADATA_STMT, {"isin": isin_normalized}).one(), None
+
+    if isin_metadata.created_at == now:
+        audit = {
+            "message": "ISIN metadata upserted (created)",
+            "operation": "UPSERT_CREATE",
+            "isin": isin_normalized,
+            "isin_name": metadata_data.name,
+            "isin_type": metadata_data.type.value,
+        }
+    else:
+        # Track changes
+        changes = {}
+        if previous is not None:
+            old_name, old_type = previous
+            if old_name != metadata_data.name:
+                changes["isin_name"] = {"before": old_name, "after": metadata_data.name}
+            if old_type != metadata_data.type:
+                changes["isin_type"] = {
+                    "before": old_type.value,
+                    "after": metadata_data.type.value,
+                }
+
+        audit = {
+            "message": "ISIN metadata upserted (updated)",
+            "operation": "UPSERT_UPDATE",
+            "isin": isin_normalized,
+            "changes": changes,
+        }
+
+    return isin_metadata, audit
+
+
+def log_upsert_audit(audit: Optional[dict]) -> None:
+    """
+    Log the audit record of a committed ISIN metadata upsert.
+
+    Args:
+        audit: Audit record returned by upsert_isin_metadata_in_tx(),
+            or None when nothing was written (logs nothing)
+    """
+    if audit is not None:
+        # AUDIT LOG
+        log_with_context(logger, logging.INFO, **audit)
+
+
 def upsert_isin_metadata(
     db: Session,
     metadata_data: ISINMetadataCreate
@@ -226,7 +366,9 @@ def upsert_isin_metadata(
     """
     Create or update ISIN metadata (UPSERT operation).
 
-    If ISIN exists, updates the name and type.
+    If ISIN exists with a different name or type, updates them; re-posting
+    the same metadata is a no-op that neither writes nor commits, so
+    updated_at is left unchanged.
     If ISIN doesn't exist, creates new record.
 
     Args:
@@ -236,63 +378,82 @@ def upsert_isin_metadata(
     Returns:
         Created or updated ISIN metadata
     """
-    # Normalize ISIN to uppercase for consistency
-    isin_normalized = metadata_data.isin.upper()
+    isin_metadata, audit = _upsert_isin_metadata(db, metadata_data)
+    if audit is not None:
+        db.commit()
+        log_upsert_audit(audit)
+    return isin_metadata
 
-    # Check if ISIN metadata exists
-    existing = db.query(ISINMetadata).filter(
-        ISINMetadata.isin == isin_normalized
-    ).first()
 
-    if existing:
-        # Update existing record
-        # Track changes
-        changes = {}
-        if existing.name != metadata_data.name:
-            changes["isin_name"] = {"before": existing.name, "after": metadata_data.name}
-        if existing.type != metadata_data.type:
-            changes["isin_type"] = {
-                "before": existing.type.value,
-                "after": metadata_data.type.value,
-            }
-
-        existing.name = metadata_data.name
-        existing.type = metadata_data.type
-        # updated_at will auto-update via onupdate in model
-        db.commit()
-        db.refresh(existing)
+def upsert_isin_metadata_in_tx(
+    db: Session,
+    metadata_data: ISINMetadataCreate
+) -> tuple[ISINMetadata, Optional[dict]]:
+    """
+    Same as upsert_isin_metadata(), but leaves committing to the caller.
 
-        # AUDIT LOG - UPDATE
-        log_with_context(
-            logger,
-            logging.INFO,
-            "ISIN metadata upserted (updated)",
-            operation="UPSERT_UPDATE",
-            isin=isin_normalized,
-            changes=changes,
-        )
+    Lets a handler that writes several records commit them together. The
+    audit record is returned instead of logged; pass it to
+    log_upsert_audit() once the transaction has committed.
 
-        return existing
-    else:
-        # Create new record
-        isin_metadata = ISINMetadata(
-            isin=isin_normalized,
-            name=metadata_data.name,
-            type=metadata_data.type
-        )
-        db.add(isin_metadata)
-        db.commit()
-        db.refresh(isin_metadata)
+    Args:
+        db: Database session
+        metadata_data: ISIN metadata data
 
-        # AUDIT LOG - CREATE
-        log_with_context(
-            logger,
-            logging.INFO,
-            "ISIN metadata upserted (created)",
-            operation="UPSERT_CREATE",
-            isin=isin_normalized,
-            isin_name=metadata_data.name,
-            isin_type=metadata_data.type.value,
-        )
+    Returns:
+        (created or updated ISIN metadata, audit record or None if nothing
+        was written)
+    """
+    return _upsert_isin_metadata(db, metadata_data)
 
-        return isin_metadata
+
+def bulk_upsert_isin_metadata(
+    db: Session,
+    metadata_rows: list[ISINMetadataCreate]
+) -> int:
+    """
+    Create or update many ISIN metadata records in one statement.
+
+    Issues a single multi-row INSERT ... ON CONFLICT DO UPDATE and one
+    commit. If the same ISIN appears more than once, the last entry wins.
+
+    Args:
+        db: Database session
+        metadata_rows: ISIN metadata data to upsert
+
+    Returns:
+        Number of distinct ISINs upserted
+    """
+    # Deduplicate by ISIN (already uppercased by the schema); ON CONFLICT
+    # cannot touch a row twice
+    now = utc_now()
+    values_by_isin = {
+        row.isin: {
+            "isin": row.isin,
+            "name": row.name,
+            "type": row.type,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for row in metadata_rows
+    }
+    if not values_by_isin:
+        return 0
+
+    stmt = dialect_insert(db)(ISINMetadata).values(list(values_by_isin.values()))
+    db.execute(_on_isin_conflict_update(stmt))
+    db.commit()
+    # The multi-row statement bypasses the identity map; expire loaded
+    # instances so they reload the upserted values
+    db.expire_all()
+
+    # AUDIT LOG
+    log_with_context(
+        logger,
+        logging.INFO,
+        "ISIN metadata bulk upserted",
+        operation="BULK_UPSERT",
+        upserted_count=len(values_by_isin),
+    )
+
+    return len(values_by_isin)
@@ -1,26 +1,161 @@
 """Other asset service for business logic."""
 
 import logging
-from datetime import datetime
 from decimal import Decimal
 
+from sqlalchemy import Row, bindparam, delete, or_, select
 from sqlalchemy.orm import Session
 
 from app.constants import AssetType, Currency
+from app.database import dialect_insert, utc_now
 from app.exceptions import OtherAssetNotFoundError
 from app.logging_config import log_with_context
 from app.models.other_asset import OtherAsset
-from app.schemas.other_asset import OtherAssetCreate
+from app.schemas.other_asset import OtherAssetCreate, OtherAssetResponse
 from app.services import cost_basis_service, user_setting_service
 
 logger = logging.getLogger(__name__)
 
+# Lookup statements built once at import; each call only binds parameters.
+# A NULL asset_detail needs IS NULL, which a bound "= :asset_detail" never matches.
+_GET_OTHER_ASSET_STMT = select(OtherAsset).where(
+    OtherAsset.asset_type == bindparam("asset_type"),
+    OtherAsset.asset_detail == bindparam("asset_detail"),
+)
+_GET_OTHER_ASSET_NULL_DETAIL_STMT = select(OtherAsset).where(
+    OtherAsset.asset_type == bindparam("asset_type"),
+    OtherAsset.asset_detail.is_(None),
+)
+
+
+def _select_other_asset(
+    db: Session, asset_type: str, asset_detail: str | None
+) -> OtherAsset | None:
+    """Load one other asset by its natural key using the prebuilt statements."""
+    if asset_detail is None:
+        stmt, params = _GET_OTHER_ASSET_NULL_DETAIL_STMT, {"asset_type": asset_type}
+    else:
+        stmt = _GET_OTHER_ASSET_STMT
+        params = {"asset_type": asset_type, "asset_detail": asset_detail}
+    return db.scalars(stmt, params).one_or_none()
+
+
+def _upsert_other_asset(
+    db: Session, asset_data: OtherAssetCreate
+) -> tuple[OtherAsset, dict | None]:
+    """
+    Run the upsert statement without committing.
+
+    Returns the row and its audit record (log_with_context() arguments),
+    or None instead of the audit record when nothing was written.
+    """
+    # The audit log records the values being replaced; only read them when
+    # that log will be emitted
+    previous = None
+    if logger.isEnabledFor(logging.INFO):
+        existing = _select_other_asset(db, asset_data.asset_type.value, asset_data.asset_detail)
+        if existing is not None:
+            previous = (existing.currency, existing.value)
+
+    # One atomic INSERT ... ON CONFLICT DO UPDATE instead of SELECT + write.
+    # NULL asset_detail rows conflict on the partial unique index over
+    # asset_type, the rest on the (asset_type, asset_detail) constraint.
+    # Both timestamps get the same value, so created_at == now means the
+    # row was inserted rather than updated. The update only fires when a
+    # value differs, so an identical re-post writes nothing.
+    now = utc_now()
+    stmt = dialect_insert(db)(OtherAsset).values(
+        asset_type=asset_data.asset_type.value,
+        asset_detail=asset_data.asset_detail,
+        currency=asset_data.currency.value,
+        value=asset_data.value,
+        created_at=now,
+        updated_at=now,
+    )
+    if asset_data.asset_detail is None:
+        conflict_target = {
+            "index_elements": [OtherAsset.asset_type],
+            "index_where": OtherAsset.asset_detail.is_(None),
+        }
+    else:
+        conflict_target = {"index_elements": [OtherAsset.asset_type, OtherAsset.asset_detail]}
+    stmt = stmt.on_conflict_do_update(
+        **conflict_target,
+        set_={
+            "currency": stmt.excluded.currency,
+            "value": stmt.excluded.value,
+            "updated_at": stmt.excluded.updated_at,
+        },
+        where=or_(
+            OtherAsset.currency.is_distinct_from(stmt.excluded.currency),
+            OtherAsset.value.is_distinct_from(stmt.excluded.value),
+        ),
+    ).returning(OtherAsset)
+
+    other_asset = db.scalars(
+        stmt, execution_options={"populate_existing": True}
+    ).one_or_none()
+    if other_asset is None:
+        # Existing row already holds these values: nothing written
+        existing = _select_other_asset(db, asset_data.asset_type.value, asset_data.asset_detail)
+        return existing, None
+
+    if other_asset.created_at == now:
+        audit = {
+            "message": "Other asset created",
+            "operation": "UPSERT_CREATE",
+            "asset_type": asset_data.asset_type.value,
+            "asset_detail": asset_data.asset_detail,
+            "currency": asset_data.currency.value,
+            "value": str(asset_data.value),
+        }
+    else:
+        # Track changes
+        changes = {}
+        if previous is not None:
+            old_currency, old_value = previous
+            if old_currency != asset_data.currency.value:
+                changes["currency"] = {
+                    "before": old_currency,
+                    "after": asset_data.currency.value,
+                }
+            if old_value != asset_data.value:
+                changes["value"] = {
+                    "before": str(old_value),
+                    "after": str(asset_data.value),
+                }
+
+        audit = {
+            "message": "Other asset updated",
+            "operation": "UPSERT_UPDATE",
+            "asset_type": asset_data.asset_type.value,
+            "asset_detail": asset_data.asset_detail,
+            "changes": changes,
+        }
+
+    return other_asset, audit
+
+
+def log_upsert_audit(audit: dict | None) -> None:
+    """
+    Log the audit record of a committed other asset upsert.
+
+    Args:
+        audit: Audit record returned by upsert_other_asset_in_tx(),
+            or None when nothing was written (logs nothing)
+    """
+    if audit is not None:
+        # AUDIT LOG
+        log_with_context(logger, logging.INFO, **audit)
+
 
 def upsert_other_asset(db: Session, asset_data: OtherAssetCreate) -> OtherAsset:
     """
     Create or update an other asset (UPSERT operation).
 
-    If (asset_type, asset_detail) exists, updates the value and updated_at.
+    If (asset_type, asset_detail) exists with a different currency or value,
+    updates them and updated_at; re-posting the same data is a no-op that
+    neither writes nor commits, so updated_at is left unchanged.
     If it doesn't exist, creates a new record.
 
     Note: Cannot create or update 'investments' type (validated in schema).
@@ -32,74 +167,32 @@ def upsert_other_asset(db: Session, asset_data: OtherAssetCreate) -> OtherAsset:
     Returns:
         Created or updated other asset
     """
-    # Check if asset exists with this (asset_type, asset_detail) combination
-    existing = (
-        db.query(OtherAsset)
-        .filter(
-            OtherAsset.asset_type == asset_data.asset_type.value,
-            OtherAsset.asset_detail == asset_data.asset_detail,
-        )
-        .first()
-    )
-
-    if existing:
-        # Update existing record
-        # Track changes
-        changes = {}
-        if existing.currency != asset_data.currency.value:
-            changes["currency"] = {
-                "before": existing.currency,
-                "after": asset_data.currency.value,
-            }
-        if existing.value != asset_data.value:
-            changes["value"] = {
-                "before": str(existing.value),
-                "after": str(asset_data.value),
-            }
-
-        existing.currency = asset_data.currency.value
-        existing.value = asset_data.value
-        # updated_at will auto-update via onupdate in model
+    other_asset, audit = _upsert_other_asset(db, asset_data)
+    if audit is not None:
         db.commit()
-        db.refresh(existing)
-
-        # AUDIT LOG - UPDATE
-        log_with_context(
-            logger,
-            logging.INFO,
-            "Other asset updated",
-            operation="UPSERT_UPDATE",
-            asset_type=asset_data.asset_type.value,
-            asset_detail=asset_data.asset_detail,
-            changes=changes,
-        )
+        log_upsert_audit(audit)
+    return other_asset
 
-        return existing
-    else:
-        # Create new record
-        other_asset = OtherAsset(
-            asset_type=asset_data.asset_type.value,
-            asset_detail=asset_data.asset_detail,
-            currency=asset_data.currency.value,
-            value=asset_data.value,
-        )
-        db.add(other_asset)
-        db.commit()
-        db.refresh(other_asset)
-
-        # AUDIT LOG - CREATE
-        log_with_context(
-            logger,
-            logging.INFO,
-            "Other asset created",
-            operation="UPSERT_CREATE",
-            asset_type=asset_data.asset_type.value,
-            asset_detail=asset_data.asset_detail,
-            currency=asset_data.currency.value,
-            value=str(asset_data.value),
-        )
 
-        return other_asset
+def upsert_other_asset_in_tx(
+    db: Session, asset_data: OtherAssetCreate
+) -> tuple[OtherAsset, dict | None]:
+    """
+    Same as upsert_other_asset(), but leaves committing to the caller.
+
+    Lets a handler that writes several records commit them together. The
+    audit record is returned instead of logged; pass it to
+    log_upsert_audit() once the transaction has committed.
+
+    Args:
+        db: Database session
+        asset_data: Other asset data
+
+    Returns:
+        (created or updated other asset, audit record or None if nothing
+        was written)
+    """
+    return _upsert_other_asset(db, asset_data)
 
 
 def get_other_asset(db: Session, asset_type: str, asset_detail: str | None = None) -> OtherAsset:
@@ -117,11 +210,7 @@ def get_other_asset(db: Session, asset_type: str, asset_detail: str | None = Non
     Raises:
         OtherAssetNotFoundError: If asset not found
     """
-    other_asset = (
-        db.query(OtherAsset)
-        .filter(OtherAsset.asset_type == asset_type, OtherAsset.asset_detail == asset_detail)
-        .first()
-    )
+    other_asset = _select_other_asset(db, asset_type, asset_detail)
 
     if not other_asset:
         raise OtherAssetNotFoundError(asset_type, asset_detail)
@@ -142,23 +231,53 @@ def get_all_other_assets(db: Session) -> list[OtherAsset]:
     Returns:
         List of all other assets
     """
-    return (
-        db.query(OtherAsset)
-        .order_by(OtherAsset.asset_type.asc(), OtherAsset.asset_detail.asc())
-        .all()
+    return list(
+        db.scalars(
+            select(OtherAsset).order_by(
+                OtherAsset.asset_type.asc(), OtherAsset.asset_detail.asc()
+            )
+        )
     )
 
 
-def get_all_other_assets_with_investments(db: Session) -> tuple[list[OtherAsset], Decimal]:
+def get_all_other_asset_rows(db: Session) -> list[Row]:
+    """
+    Get all other assets as plain column rows, for read-only listings.
+
+    Same rows and order as get_all_other_assets, without hydrating ORM
+    instances.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Rows with the other_assets columns as attributes
+    """
+    return list(
+        db.execute(
+            select(*OtherAsset.__table__.columns).order_by(
+                OtherAsset.asset_type.asc(), OtherAsset.asset_detail.asc()
+            )
+        )
+    )
+
+
+def get_all_other_assets_with_investments(
+    db: Session,
+) -> tuple[list[Row | OtherAssetResponse], Decimal]:
     """
     Get all other assets including synthetic 'investments' row with EUR conversion metadata.
 
     The investments row is computed from portfolio summary and represents
     the total current value of the ETF portfolio. It is NOT stored in the
-    database but generated on-the-fly.
+    database but generated on-the-fly, as an OtherAssetResponse rather than a
+    transient ORM instance. Stored assets come back as plain column rows;
+    callers only read attributes.
 
     Returns assets in order: investments first, then others sorted by type/detail.
-    Each asset has the exchange_rate attached as _exchange_rate for computed field access.
+    The exchange rate is returned alongside rather than set on each asset, so
+    loaded ORM instances are left untouched (callers pass it to the response
+    schema as exchange_rate_).
 
     Args:
         db: Database session
@@ -166,42 +285,30 @@ def get_all_other_assets_with_investments(db: Session) -> tuple[list[OtherAsset]
     Returns:
         Tuple of (assets list with synthetic investments row first, exchange_rate_used)
     """
-    # Get exchange rate from settings (default 25.00)
-    setting = user_setting_service.get_exchange_rate_setting(db)
-    exchange_rate = Decimal(setting.setting_value) if setting else Decimal("25.00")
-
-    # Get portfolio summary to extract total current invested value
-    portfolio_summary = cost_basis_service.get_portfolio_summary(db)
+    # Get exchange rate from settings (default 25.00, cached in-process)
+    exchange_rate = user_setting_service.get_exchange_rate(db)
 
-    # Extract total current portfolio value
-    # This is the sum of all position current_values from the holdings
-    investments_value = Decimal("0")
-    if portfolio_summary.holdings:
-        for holding in portfolio_summary.holdings:
-            if holding.current_value is not None:
-                investments_value += holding.current_value
+    # Total current portfolio value: sum of position values of open holdings
+    investments_value = cost_basis_service.get_open_positions_value(db)
 
     # Create synthetic investments row (id=0 as marker)
-    investments_asset = OtherAsset(
+    now = utc_now()
+    investments_asset = OtherAssetResponse(
         id=0,
-        asset_type=AssetType.INVESTMENTS.value,
+        asset_type=AssetType.INVESTMENTS,
         asset_detail=None,
-        currency=Currency.EUR.value,
+        currency=Currency.EUR,
         value=investments_value,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
+        exchange_rate_=exchange_rate,
     )
 
     # Get all real assets from database
-    real_assets = get_all_other_assets(db)
-
-    # Attach exchange rate to all assets for computed_field access
-    all_assets = [investments_asset] + real_assets
-    for asset in all_assets:
-        asset.exchange_rate_ = exchange_rate
+    real_assets = get_all_other_asset_rows(db)
 
     # Return assets and exchange rate used
-    return all_assets, exchange_rate
+    return [investments_asset] + real_assets, exchange_rate
 
 
 def delete_other_asset(db: Session, asset_type: str, asset_detail: str | None = None) -> None:
@@ -216,19 +323,28 @@ def delete_other_asset(db: Session, asset_type: str, asset_detail: str | None =
     Raises:
         OtherAssetNotFoundError: If asset not found
     """
-    other_asset = get_other_asset(db, asset_type, asset_detail)
+    # Delete and fetch the audit payload in one round-trip
+    deleted = db.execute(
+        delete(OtherAsset)
+        .where(OtherAsset.asset_type == asset_type, OtherAsset.asset_detail == asset_detail)
+        .returning(
+            OtherAsset.asset_type, OtherAsset.asset_detail, OtherAsset.currency, OtherAsset.value
+        )
+    ).first()
+
+    if deleted is None:
+        raise OtherAssetNotFoundError(asset_type, asset_detail)
+
+    db.commit()
 
     # Store for audit log
     deleted_data = {
-        "asset_type": other_asset.asset_type,
-        "asset_detail": other_asset.asset_detail,
-        "currency": other_asset.currency,
-        "value": str(other_asset.value),
+        "asset_type": deleted.asset_type,
+        "asset_detail": deleted.asset_detail,
+        "currency": deleted.currency,
+        "value": str(deleted.value),
     }
 
-    db.delete(other_asset)
-    db.commit()
-
     # AUDIT LOG
     log_with_context(
         logger,
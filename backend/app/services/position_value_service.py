@@ -1,17 +1,115 @@
 """Position value service for business logic."""
 
 import logging
+from collections.abc import Iterator
+from typing import Optional
 
+from sqlalchemy import Row, bindparam, delete, func, select
 from sqlalchemy.orm import Session
 
+from app.constants import POSITION_VALUE_STREAM_BATCH_SIZE
+from app.database import dialect_insert, utc_now
 from app.exceptions import PositionValueNotFoundError
 from app.logging_config import log_with_context
 from app.models.position_value import PositionValue
+from app.models.transaction import Transaction
 from app.schemas.position_value import PositionValueCreate
 from app.services import cost_basis_service
 
 logger = logging.getLogger(__name__)
 
+# Lookup statement built once at import; each call only binds the ISIN
+_GET_POSITION_VALUE_STMT = select(PositionValue).where(PositionValue.isin == bindparam("isin"))
+
+
+def _on_isin_conflict_update(stmt):
+    """
+    Turn a position value insert into an upsert on the isin column.
+
+    Existing rows are only updated when the value differs, so re-posting
+    the same value writes nothing.
+    """
+    return stmt.on_conflict_do_update(
+        index_elements=[PositionValue.isin],
+        set_={
+            "current_value": stmt.excluded.current_value,
+            "updated_at": stmt.excluded.updated_at,
+        },
+        where=PositionValue.current_value.is_distinct_from(stmt.excluded.current_value),
+    )
+
+
+def _upsert_position_value(
+    db: Session,
+    position_value_data: PositionValueCreate
+) -> tuple[PositionValue, Optional[dict]]:
+    """
+    Run the upsert statement without committing.
+
+    Returns the row and its audit record (log_with_context() arguments),
+    or None instead of the audit record when nothing was written.
+    """
+    # ISIN is already normalized to uppercase by PositionValueCreate
+    isin_normalized = position_value_data.isin
+
+    # The audit log records the value being replaced; only read it when
+    # that log will be emitted
+    old_value = None
+    if logger.isEnabledFor(logging.INFO):
+        existing = db.scalars(_GET_POSITION_VALUE_STMT, {"isin": isin_normalized}).one_or_none()
+        if existing is not None:
+            old_value = str(existing.current_value)
+
+    # One atomic INSERT ... ON CONFLICT DO UPDATE instead of SELECT + write.
+    # Both timestamps get the same value, so created_at == now means the
+    # row was inserted rather than updated.
+    now = utc_now()
+    stmt = dialect_insert(db)(PositionValue).values(
+        isin=isin_normalized,
+        current_value=position_value_data.current_value,
+        created_at=now,
+        updated_at=now,
+    )
+    stmt = _on_isin_conflict_update(stmt).returning(PositionValue)
+
+    position_value = db.scalars(
+        stmt, execution_options={"populate_existing": True}
+    ).one_or_none()
+    if position_value is None:
+        # Existing row already holds this value: nothing written
+        return db.scalars(_GET_POSITION_VALUE_STMT, {"isin": isin_normalized}).one(), None
+
+    if position_value.created_at == now:
+        audit = {
+            "message": "Position value created",
+            "operation": "CREATE",
+            "isin": isin_normalized,
+            "current_value": str(position_value_data.current_value),
+        }
+    else:
+        audit = {
+            "message": "Position value updated",
+            "operation": "UPDATE",
+            "isin": isin_normalized,
+            "old_value": old_value,
+            "new_value": str(position_value_data.current_value),
+        }
+
+    return position_value, audit
+
+
+def log_upsert_audit(audit: Optional[dict]) -> None:
+    """
+    Log the audit record of a committed position value upsert.
+
+    Args:
+        audit: Audit record returned by upsert_position_value_in_tx(),
+            or None when nothing was written (logs nothing)
+    """
+    if audit is not None:
+        # AUDIT LOG
+        log_with_context(logger, logging.INFO, **audit)
+
 
 def upsert_position_value(
     db: Session,
@@ -20,7 +118,9 @@ def upsert_position_value(
     """
     Create or update a position value (UPSERT operation).
 
-    If ISIN exists, updates the current_value and updated_at.
+    If ISIN exists with a different current_value, updates it and updated_at;
+    re-posting the same value is a no-op that neither writes nor commits,
+    so updated_at is left unchanged.
     If ISIN doesn't exist, creates new record.
 
     Args:
@@ -30,55 +130,84 @@ def upsert_position_value(
     Returns:
         Created or updated position value
     """
-    # Normalize ISIN to uppercase for consistency
-    isin_normalized = position_value_data.isin.upper()
+    position_value, audit = _upsert_position_value(db, position_value_data)
+    if audit is not None:
+        db.commit()
+        log_upsert_audit(audit)
+    return position_value
 
-    # Check if position value exists for this ISIN
-    existing = db.query(PositionValue).filter(
-        PositionValue.isin == isin_normalized
-    ).first()
 
-    if existing:
-        # Update existing record
-        old_value = str(existing.current_value)
-        existing.current_value = position_value_data.current_value
-        # updated_at will auto-update via onupdate in model
-        db.commit()
-        db.refresh(existing)
+def upsert_position_value_in_tx(
+    db: Session,
+    position_value_data: PositionValueCreate
+) -> tuple[PositionValue, Optional[dict]]:
+    """
+    Same as upsert_position_value(), but leaves committing to the caller.
 
-        # AUDIT LOG - UPDATE
-        log_with_context(
-            logger,
-            logging.INFO,
-            "Position value updated",
-            operation="UPDATE",
-            isin=isin_normalized,
-            old_value=old_value,
-            new_value=str(position_value_data.current_value),
-        )
+    Lets a handler that writes several records commit them together. The
+    audit record is returned instead of logged; pass it to
+    log_upsert_audit() once the transaction has committed.
 
-        return existing
-    else:
-        # Create new record
-        position_value = PositionValue(
-            isin=isin_normalized,
-            current_value=position_value_data.current_value
-        )
-        db.add(position_value)
-        db.commit()
-        db.refresh(position_value)
+    Args:
+        db: Database session
+        position_value_data: Position value data
+
+    Returns:
+        (created or updated position value, audit record or None if
+        nothing was written)
+    """
+    return _upsert_position_value(db, position_value_data)
 
-        # AUDIT LOG - CREATE
-        log_with_context(
-            logger,
-            logging.INFO,
-            "Position value created",
-            operation="CREATE",
-            isin=isin_normalized,
-            current_value=str(position_value_data.current_value),
-        )
 
-        return position_value
+def bulk_upsert_position_values(
+    db: Session,
+    position_values: list[PositionValueCreate]
+) -> int:
+    """
+    Create or update many position values in one statement.
+
+    Issues a single multi-row INSERT ... ON CONFLICT DO UPDATE and one
+    commit. If the same ISIN appears more than once, the last entry wins.
+
+    Args:
+        db: Database session
+        position_values: Position value data to upsert
+
+    Returns:
+        Number of distinct ISINs upserted
+    """
+    # Deduplicate by ISIN (already uppercased by the schema); ON CONFLICT
+    # cannot touch a row twice
+    now = utc_now()
+    values_by_isin = {
+        item.isin: {
+            "isin": item.isin,
+            "current_value": item.current_value,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for item in position_values
+    }
+    if not values_by_isin:
+        return 0
+
+    stmt = dialect_insert(db)(PositionValue).values(list(values_by_isin.values()))
+    db.execute(_on_isin_conflict_update(stmt))
+    db.commit()
+    # The multi-row statement bypasses the identity map; expire loaded
+    # instances so they reload the upserted values
+    db.expire_all()
+
+    # AUDIT LOG
+    log_with_context(
+        logger,
+        logging.INFO,
+        "Position values bulk upserted",
+        operation="BULK_UPSERT",
+        upserted_count=len(values_by_isin),
+    )
+
+    return len(values_by_isin)
 
 
 def get_position_value(db: Session, isin: str) -> PositionValue:
@@ -97,9 +226,9 @@ def get_position_value(db: Session, isin: str) -> PositionValue:
     """
     isin_normalized = isin.upper()
 
-    position_value = db.query(PositionValue).filter(
-        PositionValue.isin == isin_normalized
-    ).first()
+    position_value = db.scalars(
+        _GET_POSITION_VALUE_STMT, {"isin": isin_normalized}
+    ).one_or_none()
 
     if not position_value:
         raise PositionValueNotFoundError(isin_normalized)
@@ -117,7 +246,27 @@ def get_all_position_values(db: Session) -> list[PositionValue]:
     Returns:
         List of all position values ordered by ISIN
     """
-    return db.query(PositionValue).order_by(PositionValue.isin.asc()).all()
+    return list(db.scalars(select(PositionValue).order_by(PositionValue.isin.asc())))
+
+
+def get_position_values_iter(db: Session) -> Iterator[Row]:
+    """
+    Stream all position values ordered by ISIN, as plain column rows.
+
+    Rows are fetched in batches of POSITION_VALUE_STREAM_BATCH_SIZE and are
+    not hydrated into ORM instances, so read-only callers that serialize
+    each row once skip instance state and the identity map entirely.
+
+    Args:
+        db: Database session
+
+    Yields:
+        Rows with the position_values columns as attributes, ordered by ISIN
+    """
+    yield from db.execute(
+        select(*PositionValue.__table__.columns).order_by(PositionValue.isin.asc()),
+        execution_options={"yield_per": POSITION_VALUE_STREAM_BATCH_SIZE},
+    )
 
 
 def delete_position_value(db: Session, isin: str) -> None:
@@ -131,12 +280,18 @@ def delete_position_value(db: Session, isin: str) -> None:
     Raises:
         PositionValueNotFoundError: If position value not found
     """
-    position_value = get_position_value(db, isin)
+    isin_normalized = isin.upper()
 
-    # Store for audit log
-    deleted_value = str(position_value.current_value)
+    # Delete and fetch the audit payload in one round-trip
+    deleted = db.execute(
+        delete(PositionValue)
+        .where(PositionValue.isin == isin_normalized)
+        .returning(PositionValue.isin, PositionValue.current_value)
+    ).first()
+
+    if deleted is None:
+        raise PositionValueNotFoundError(isin_normalized)
 
-    db.delete(position_value)
     db.commit()
 
     # AUDIT LOG
@@ -145,11 +300,57 @@ def delete_position_value(db: Session, isin: str) -> None:
         logging.INFO,
         "Position value deleted",
         operation="DELETE",
-        isin=position_value.isin,
-        deleted_value=deleted_value,
+        isin=deleted.isin,
+        deleted_value=str(deleted.current_value),
     )
 
 
+def delete_position_values_for_closed_positions(db: Session, isins: set[str]) -> list[str]:
+    """
+    Delete the position values of the given ISINs whose positions are closed.
+
+    One DELETE ... RETURNING covers all ISINs, however many there are.
+    ISINs with no transactions are left alone (see
+    cleanup_orphaned_position_values for those).
+
+    Args:
+        db: Database session
+        isins: Uppercase ISIN codes to check
+
+    Returns:
+        Sorted list of ISINs whose position value was deleted
+    """
+    if not isins:
+        return []
+
+    deleted = db.execute(
+        delete(PositionValue)
+        .where(
+            PositionValue.isin.in_(isins),
+            PositionValue.isin.in_(select(Transaction.isin)),
+            PositionValue.isin.not_in(cost_basis_service.nonzero_position_isins()),
+        )
+        .returning(PositionValue.isin, PositionValue.current_value),
+        execution_options={"synchronize_session": "fetch"},
+    ).all()
+    if not deleted:
+        return []
+    db.commit()
+
+    for isin, current_value in sorted(deleted):
+        # AUDIT LOG
+        log_with_context(
+            logger,
+            logging.INFO,
+            "Position value deleted",
+            operation="DELETE",
+            isin=isin,
+            deleted_value=str(current_value),
+        )
+
+    return sorted(isin for isin, _ in deleted)
+
+
 def delete_position_value_by_id(db: Session, position_value_id: int) -> None:
     """
     Delete a position value by ID.
@@ -161,20 +362,22 @@ def delete_position_value_by_id(db: Session, position_value_id: int) -> None:
     Raises:
         PositionValueNotFoundError: If position value not found
     """
-    position_value = (
-        db.query(PositionValue).filter(PositionValue.id == position_value_id).first()
-    )
+    # Delete and fetch the audit payload in one round-trip
+    deleted = db.execute(
+        delete(PositionValue)
+        .where(PositionValue.id == position_value_id)
+        .returning(PositionValue.isin, PositionValue.current_value)
+    ).first()
 
-    if not position_value:
+    if deleted is None:
         raise PositionValueNotFoundError(position_value_id)
 
-    # Store for audit log
-    isin = position_value.isin
-    deleted_value = str(position_value.current_value)
-
-    db.delete(position_value)
     db.commit()
 
+    # Store for audit log
+    isin = deleted.isin
+    deleted_value = str(deleted.current_value)
+
     # AUDIT LOG
     log_with_context(
         logger,
@@ -195,6 +398,8 @@ def cleanup_orphaned_position_values(db: Session) -> dict:
     1. ISINs with no transactions (orphaned data)
     2. ISINs with closed positions (total_units == 0)
 
+    Orphans are found and removed with a single DELETE ... RETURNING.
+
     Args:
         db: Database session
 
@@ -207,10 +412,10 @@ def cleanup_orphaned_position_values(db: Session) -> dict:
             "errors": list[dict]
         }
     """
-    position_values = get_all_position_values(db)
+    checked = db.scalar(select(func.count(PositionValue.id)))
 
     stats = {
-        "checked": len(position_values),
+        "checked": checked,
         "deleted": 0,
         "deleted_isins": [],
         "errors": []
@@ -220,41 +425,45 @@ def cleanup_orphaned_position_values(db: Session) -> dict:
         logger,
         logging.INFO,
         "Starting position value cleanup",
-        total_position_values=len(position_values),
+        total_position_values=checked,
     )
 
-    for pv in position_values:
-        try:
-            # Calculate current position state
-            cost_basis = cost_basis_service.calculate_cost_basis(db, pv.isin)
-
-            # Delete if no transactions or position closed
-            should_delete = (
-                cost_basis is None or  # No transactions
-                cost_basis.total_units == 0  # Position closed
-            )
+    try:
+        # Set-based: one DELETE for every position value whose ISIN has no
+        # transactions or zero net units, returning what was removed
+        deleted = db.execute(
+            delete(PositionValue)
+            .where(PositionValue.isin.not_in(cost_basis_service.nonzero_position_isins()))
+            .returning(PositionValue.isin, PositionValue.current_value),
+            execution_options={"synchronize_session": "fetch"},
+        ).all()
+        db.commit()
 
-            if should_delete:
-                delete_position_value(db, pv.isin)
-                stats["deleted"] += 1
-                stats["deleted_isins"].append(pv.isin)
+    except Exception as e:
+        db.rollback()
+        stats["errors"].append({"isin": None, "error": str(e)})
 
-        except Exception as e:
-            # LOG ERROR - previously not logged
-            error_info = {
-                "isin": pv.isin,
-                "error": str(e)
-            }
-            stats["errors"].append(error_info)
+        log_with_context(
+            logger,
+            logging.ERROR,
+            "Error during position value cleanup",
+            error_type=type(e).__name__,
+            error_message=str(e),
+        )
 
+    else:
+        for isin, current_value in sorted(deleted):
+            # AUDIT LOG
             log_with_context(
                 logger,
-                logging.ERROR,
-                "Error during position value cleanup",
-                isin=pv.isin,
-                error_type=type(e).__name__,
-                error_message=str(e),
+                logging.INFO,
+                "Position value deleted",
+                operation="DELETE",
+                isin=isin,
+                deleted_value=str(current_value),
             )
+            stats["deleted_isins"].append(isin)
+        stats["deleted"] = len(stats["deleted_isins"])
 
     log_with_context(
         logger,
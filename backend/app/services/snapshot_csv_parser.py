@@ -2,15 +2,35 @@
 
 import csv
 import logging
+import sys
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from io import StringIO
+from operator import itemgetter
 from typing import Optional
 
 from app.logging_config import log_with_context
+from app.services.csv_utils import row_dict
 
 logger = logging.getLogger(__name__)
 
+# Snapshot exports repeat the same snapshot_date on every row of a snapshot
+_DATETIME_CACHE: dict[str, datetime] = {}
+_DATETIME_CACHE_MAX_SIZE = 4096
+
+_ZERO = Decimal("0.00")
+
+_REQUIRED_COLUMNS = frozenset(
+    {
+        "snapshot_date",
+        "asset_type",
+        "currency",
+        "value",
+        "exchange_rate",
+        "value_eur",
+    }
+)
+
 
 class SnapshotRowData:
     """Parsed snapshot CSV row data."""
@@ -26,7 +46,10 @@ class SnapshotRowData:
         exchange_rate: Decimal,
         value_eur: Decimal,
         created_at: Optional[datetime],
-        raw_row: dict,
+        raw_row: Optional[dict] = None,
+        *,
+        header: Optional[list[str]] = None,
+        raw_values: Optional[list[str]] = None,
     ):
         self.row_number = row_number
         self.snapshot_date = snapshot_date
@@ -37,7 +60,16 @@ class SnapshotRowData:
         self.exchange_rate = exchange_rate
         self.value_eur = value_eur
         self.created_at = created_at
-        self.raw_row = raw_row
+        self._raw_row = raw_row
+        self._header = header
+        self._raw_values = raw_values
+
+    @property
+    def raw_row(self) -> dict:
+        """Original CSV row keyed by column name (built on first access)."""
+        if self._raw_row is None:
+            self._raw_row = row_dict(self._header, self._raw_values)
+        return self._raw_row
 
 
 def parse_decimal(value: str) -> Decimal:
@@ -53,13 +85,16 @@ def parse_decimal(value: str) -> Decimal:
     Raises:
         ValueError: If value cannot be parsed
     """
-    if not value or value.strip() == "":
-        return Decimal("0.00")
+    if not value:
+        return _ZERO
 
+    # Decimal() ignores surrounding whitespace itself, so clean values need
+    # no strip(); blanks are told apart from bad input only on failure
     try:
-        clean_value = value.strip()
-        return Decimal(clean_value)
+        return Decimal(value)
     except InvalidOperation:
+        if value.isspace():
+            return _ZERO
         raise ValueError(f"Cannot parse decimal value: {value}")
 
 
@@ -76,26 +111,127 @@ def parse_iso_datetime(datetime_str: str) -> datetime:
     Raises:
         ValueError: If datetime cannot be parsed
     """
+    cached = _DATETIME_CACHE.get(datetime_str)
+    if cached is not None:
+        return cached
+
+    clean_str = datetime_str.strip()
     try:
         # Try parsing with fromisoformat (Python 3.7+)
-        return datetime.fromisoformat(datetime_str.strip())
+        parsed = datetime.fromisoformat(clean_str)
     except ValueError:
         # Try parsing with strptime as fallback
         try:
-            return datetime.strptime(datetime_str.strip(), "%Y-%m-%dT%H:%M:%S.%f")
+            parsed = datetime.strptime(clean_str, "%Y-%m-%dT%H:%M:%S.%f")
         except ValueError:
             raise ValueError(
                 f"Invalid datetime format: {datetime_str} (expected ISO 8601 format)"
             )
 
+    if len(_DATETIME_CACHE) >= _DATETIME_CACHE_MAX_SIZE:
+        _DATETIME_CACHE.clear()
+    _DATETIME_CACHE[datetime_str] = parsed
+    return parsed
+
+
+def _parse_cached_decimal(value: str, decimal_cache: Optional[dict[str, Decimal]]) -> Decimal:
+    """Parse a decimal, reusing the Decimal already built for an identical string."""
+    if decimal_cache is None:
+        return parse_decimal(value)
+    cached = decimal_cache.get(value)
+    if cached is None:
+        cached = decimal_cache[value] = parse_decimal(value)
+    return cached
+
+
+def _parse_snapshot_fields(
+    snapshot_date_raw: str,
+    asset_type_raw: str,
+    asset_detail_raw: Optional[str],
+    currency_raw: str,
+    value_raw: str,
+    exchange_rate_raw: str,
+    value_eur_raw: str,
+    created_at_raw: Optional[str],
+    decimal_cache: Optional[dict[str, Decimal]],
+) -> tuple:
+    """
+    Parse and validate the raw fields of one snapshot row.
+
+    Returns:
+        Tuple of values in SnapshotRowData field order, after row_number
+
+    Raises:
+        ValueError: If a field is invalid (without row context)
+    """
+    # snapshot_date (required)
+    snapshot_date = parse_iso_datetime(snapshot_date_raw)
+
+    # asset_type (required)
+    asset_type = sys.intern(asset_type_raw.strip())
+    if not asset_type or len(asset_type) > 50:
+        raise ValueError(
+            f"Invalid asset_type: must be between 1 and 50 characters"
+        )
 
-def parse_snapshot_row(row: dict, row_number: int) -> SnapshotRowData:
+    # asset_detail (optional; usually blank, which needs no strip)
+    asset_detail = asset_detail_raw.strip() if asset_detail_raw else None
+    if asset_detail:
+        asset_detail = sys.intern(asset_detail)
+        if len(asset_detail) > 100:
+            raise ValueError("asset_detail cannot exceed 100 characters")
+    else:
+        asset_detail = None
+
+    # currency (required)
+    currency = sys.intern(currency_raw.strip().upper())
+    if len(currency) != 3:
+        raise ValueError(f"Invalid currency: must be exactly 3 characters")
+
+    # value (required)
+    value = _parse_cached_decimal(value_raw, decimal_cache)
+    if value < 0:
+        raise ValueError("value cannot be negative")
+
+    # exchange_rate (required)
+    exchange_rate = _parse_cached_decimal(exchange_rate_raw, decimal_cache)
+    if exchange_rate <= 0:
+        raise ValueError("exchange_rate must be positive")
+
+    # value_eur (required)
+    value_eur = _parse_cached_decimal(value_eur_raw, decimal_cache)
+    if value_eur < 0:
+        raise ValueError("value_eur cannot be negative")
+
+    # created_at (optional, defaults to None)
+    created_at = None
+    if created_at_raw and not created_at_raw.isspace():
+        created_at = parse_iso_datetime(created_at_raw)
+
+    return (
+        snapshot_date,
+        asset_type,
+        asset_detail,
+        currency,
+        value,
+        exchange_rate,
+        value_eur,
+        created_at,
+    )
+
+
+def parse_snapshot_row(
+    row: dict,
+    row_number: int,
+    decimal_cache: Optional[dict[str, Decimal]] = None,
+) -> SnapshotRowData:
     """
     Parse a single snapshot CSV row.
 
     Args:
         row: Dictionary from csv.DictReader
         row_number: Row number for error reporting (1-indexed)
+        decimal_cache: Optional per-file cache of parsed Decimals by raw string
 
     Returns:
         SnapshotRowData object
@@ -104,60 +240,18 @@ def parse_snapshot_row(row: dict, row_number: int) -> SnapshotRowData:
         ValueError: If row cannot be parsed
     """
     try:
-        # snapshot_date (required)
-        snapshot_date = parse_iso_datetime(row["snapshot_date"])
-
-        # asset_type (required)
-        asset_type = row["asset_type"].strip()
-        if not asset_type or len(asset_type) > 50:
-            raise ValueError(
-                f"Invalid asset_type: must be between 1 and 50 characters"
-            )
-
-        # asset_detail (optional)
-        asset_detail_raw = row.get("asset_detail", "").strip()
-        asset_detail = asset_detail_raw if asset_detail_raw else None
-        if asset_detail and len(asset_detail) > 100:
-            raise ValueError("asset_detail cannot exceed 100 characters")
-
-        # currency (required)
-        currency = row["currency"].strip().upper()
-        if len(currency) != 3:
-            raise ValueError(f"Invalid currency: must be exactly 3 characters")
-
-        # value (required)
-        value = parse_decimal(row["value"])
-        if value < 0:
-            raise ValueError("value cannot be negative")
-
-        # exchange_rate (required)
-        exchange_rate = parse_decimal(row["exchange_rate"])
-        if exchange_rate <= 0:
-            raise ValueError("exchange_rate must be positive")
-
-        # value_eur (required)
-        value_eur = parse_decimal(row["value_eur"])
-        if value_eur < 0:
-            raise ValueError("value_eur cannot be negative")
-
-        # created_at (optional, defaults to None)
-        created_at = None
-        created_at_raw = row.get("created_at", "").strip()
-        if created_at_raw:
-            created_at = parse_iso_datetime(created_at_raw)
-
-        return SnapshotRowData(
-            row_number=row_number,
-            snapshot_date=snapshot_date,
-            asset_type=asset_type,
-            asset_detail=asset_detail,
-            currency=currency,
-            value=value,
-            exchange_rate=exchange_rate,
-            value_eur=value_eur,
-            created_at=created_at,
-            raw_row=row,
+        fields = _parse_snapshot_fields(
+            row["snapshot_date"],
+            row["asset_type"],
+            row.get("asset_detail"),
+            row["currency"],
+            row["value"],
+            row["exchange_rate"],
+            row["value_eur"],
+            row.get("created_at"),
+            decimal_cache,
         )
+        return SnapshotRowData(row_number, *fields, raw_row=row)
 
     except Exception as e:
         # Re-raise with row context
@@ -179,40 +273,82 @@ def parse_snapshot_csv(csv_content: str) -> list[SnapshotRowData]:
     """
     try:
         csv_file = StringIO(csv_content)
-        reader = csv.DictReader(csv_file)
+        # Blank lines are dropped entirely (not numbered), as csv.DictReader does
+        reader = (values for values in csv.reader(csv_file) if values)
+        header = next(reader, None)
 
         # Validate required columns
-        required_columns = {
-            "snapshot_date",
-            "asset_type",
-            "currency",
-            "value",
-            "exchange_rate",
-            "value_eur",
-        }
-
-        if not reader.fieldnames:
+        if not header:
             raise ValueError("CSV file is empty or has no header")
 
-        missing_columns = required_columns - set(reader.fieldnames)
+        missing_columns = _REQUIRED_COLUMNS.difference(header)
         if missing_columns:
             raise ValueError(
                 f"Missing required columns: {', '.join(missing_columns)}"
             )
 
-        # Parse rows
+        # Last occurrence wins for duplicate names, as with csv.DictReader
+        header_index = {column: i for i, column in enumerate(header)}
+        # Optional columns absent from the header read a placeholder position
+        # and are replaced with None below
+        get_fields = itemgetter(
+            header_index["snapshot_date"],
+            header_index["asset_type"],
+            header_index.get("asset_detail", header_index["asset_type"]),
+            header_index["currency"],
+            header_index["value"],
+            header_index["exchange_rate"],
+            header_index["value_eur"],
+            header_index.get("created_at", header_index["asset_type"]),
+        )
+        has_asset_detail = "asset_detail" in header_index
+        has_created_at = "created_at" in header_index
+        width = len(header)
+
+        # Parse rows; values such as exchange rates repeat across a file
         parsed_rows = []
-        for idx, row in enumerate(reader, start=1):
-            # Skip empty rows
-            if not any(row.values()):
+        decimal_cache: dict[str, Decimal] = {}
+        for idx, values in enumerate(reader, start=1):
+            # Skip empty rows; a filled first column settles it in one test
+            if not values[0] and not any(values):
                 continue
 
+            if len(values) != width:
+                # Ragged rows keep csv.DictReader's None padding semantics
+                parsed_rows.append(
+                    parse_snapshot_row(row_dict(header, values), idx, decimal_cache)
+                )
+                continue
+
+            (
+                snapshot_date_raw,
+                asset_type_raw,
+                asset_detail_raw,
+                currency_raw,
+                value_raw,
+                exchange_rate_raw,
+                value_eur_raw,
+                created_at_raw,
+            ) = get_fields(values)
             try:
-                parsed_data = parse_snapshot_row(row, idx)
-                parsed_rows.append(parsed_data)
-            except ValueError:
-                # Re-raise to be caught by import service
-                raise
+                fields = _parse_snapshot_fields(
+                    snapshot_date_raw,
+                    asset_type_raw,
+                    asset_detail_raw if has_asset_detail else None,
+                    currency_raw,
+                    value_raw,
+                    exchange_rate_raw,
+                    value_eur_raw,
+                    created_at_raw if has_created_at else None,
+                    decimal_cache,
+                )
+            except Exception as e:
+                # Re-raise with row context, to be caught by import service
+                raise ValueError(f"Row {idx}: {str(e)}") from e
+
+            parsed_rows.append(
+                SnapshotRowData(idx, *fields, header=header, raw_values=values)
+            )
 
         return parsed_rows
 
@@ -1,11 +1,20 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from decimal import Decimal
 from typing import Optional
 
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.constants import DEFAULT_PAGE_SIZE, TransactionType
+from app.constants import (
+    CSV_IMPORT_CHUNK_SIZE,
+    CSV_IMPORT_MAX_WORKERS,
+    DEFAULT_PAGE_SIZE,
+    TransactionType,
+)
 from app.exceptions import (
     CSVImportError,
     PositionValueNotFoundError,
@@ -18,6 +27,35 @@ from app.services import cost_basis_service, position_value_service
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole chunk of CSV rows in a single pydantic-core call
+_TRANSACTION_CREATE_LIST_ADAPTER = TypeAdapter(list[TransactionCreate])
+
+# Fields whose change can open, close or move a position
+_POSITION_AFFECTING_FIELDS = frozenset({"isin", "units", "transaction_type"})
+
+# Audit log form of each transaction type, resolved once
+_TRANSACTION_TYPE_VALUES = {member: member.value for member in TransactionType}
+
+
+def _audit_values(transaction: Transaction) -> dict:
+    """Audit log fields of a transaction, as strings where not JSON-native."""
+    return {
+        "isin": transaction.isin,
+        "transaction_type": _TRANSACTION_TYPE_VALUES[transaction.transaction_type],
+        "units": str(transaction.units),
+        "price_per_unit": str(transaction.price_per_unit),
+        "fee": str(transaction.fee),
+        "broker": transaction.broker,
+        "date": str(transaction.date),
+    }
+
+
+def _signed_units(transaction: Transaction) -> Decimal:
+    """Units a transaction adds to its position (SELLs negative)."""
+    if transaction.transaction_type == TransactionType.SELL:
+        return -transaction.units
+    return transaction.units
+
 
 def create_transaction(db: Session, transaction_data: TransactionCreate) -> Transaction:
     """
@@ -33,23 +71,17 @@ def create_transaction(db: Session, transaction_data: TransactionCreate) -> Tran
     transaction = Transaction(**transaction_data.model_dump())
     db.add(transaction)
     db.commit()
-    db.refresh(transaction)
 
     # AUDIT LOG
-    log_with_context(
-        logger,
-        logging.INFO,
-        "Transaction created",
-        operation="CREATE",
-        transaction_id=transaction.id,
-        isin=transaction.isin,
-        transaction_type=transaction.transaction_type.value,
-        units=str(transaction.units),
-        price_per_unit=str(transaction.price_per_unit),
-        fee=str(transaction.fee),
-        broker=transaction.broker,
-        date=str(transaction.date),
-    )
+    if logger.isEnabledFor(logging.INFO):
+        log_with_context(
+            logger,
+            logging.INFO,
+            "Transaction created",
+            operation="CREATE",
+            transaction_id=transaction.id,
+            **_audit_values(transaction),
+        )
 
     return transaction
 
@@ -106,34 +138,42 @@ def get_transactions(
     Returns:
         Tuple of (list of transactions, total count)
     """
-    query = db.query(Transaction)
-
     # Apply filters
+    filters = []
     if isin:
-        query = query.filter(Transaction.isin == isin.upper())
+        filters.append(Transaction.isin == isin.upper())
     if broker:
-        query = query.filter(Transaction.broker == broker)
+        filters.append(Transaction.broker == broker)
     if transaction_type:
-        query = query.filter(Transaction.transaction_type == transaction_type)
+        filters.append(Transaction.transaction_type == transaction_type)
     if start_date:
-        query = query.filter(Transaction.date >= start_date)
+        filters.append(Transaction.date >= start_date)
     if end_date:
-        query = query.filter(Transaction.date <= end_date)
-
-    # Get total count
-    total = query.count()
+        filters.append(Transaction.date <= end_date)
 
     # Apply sorting
     sort_field = Transaction.date if sort_by == "date" else Transaction.created_at
-    if sort_order == "desc":
-        query = query.order_by(sort_field.desc())
+    order = sort_field.desc() if sort_order == "desc" else sort_field.asc()
+
+    # Page and total in one query: the window count is computed over the
+    # filtered set before OFFSET/LIMIT apply
+    rows = db.execute(
+        select(Transaction, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(order)
+        .offset(skip)
+        .limit(limit)
+    ).all()
+
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page past the end: no row carries the total, count separately
+        total = db.scalar(select(func.count(Transaction.id)).where(*filters))
     else:
-        query = query.order_by(sort_field.asc())
+        total = 0
 
-    # Apply pagination
-    transactions = query.offset(skip).limit(limit).all()
-
-    return transactions, total
+    return [row.Transaction for row in rows], total
 
 
 def update_transaction(
@@ -157,59 +197,64 @@ def update_transaction(
     original_isin = transaction.isin
 
     # Store before values for audit log
-    before_values = {
-        "isin": transaction.isin,
-        "transaction_type": transaction.transaction_type.value,
-        "units": str(transaction.units),
-        "price_per_unit": str(transaction.price_per_unit),
-        "fee": str(transaction.fee),
-        "broker": transaction.broker,
-        "date": str(transaction.date),
-    }
+    audit_enabled = logger.isEnabledFor(logging.INFO)
+    if audit_enabled:
+        before_values = _audit_values(transaction)
+
+    # Fee, price, broker or date edits cannot close or reopen a position
+    update_dict = update_data.model_dump(exclude_unset=True)
+    needs_cleanup = not _POSITION_AFFECTING_FIELDS.isdisjoint(update_dict)
 
     # Calculate units before update to detect reopening
-    cost_basis_before = cost_basis_service.calculate_cost_basis(db, original_isin)
-    units_before = cost_basis_before.total_units if cost_basis_before else Decimal("0")
+    if needs_cleanup:
+        units_before = cost_basis_service.sum_units_for_isin(db, original_isin) or Decimal("0")
+        units_change = -_signed_units(transaction)
 
     # Update only provided fields
-    update_dict = update_data.model_dump(exclude_unset=True)
     for field, value in update_dict.items():
         setattr(transaction, field, value)
 
+    if needs_cleanup:
+        units_change += _signed_units(transaction)
+
     db.commit()
     db.refresh(transaction)
 
     # AUDIT LOG
-    after_values = {
-        "isin": transaction.isin,
-        "transaction_type": transaction.transaction_type.value,
-        "units": str(transaction.units),
-        "price_per_unit": str(transaction.price_per_unit),
-        "fee": str(transaction.fee),
-        "broker": transaction.broker,
-        "date": str(transaction.date),
-    }
+    if audit_enabled:
+        after_values = _audit_values(transaction)
+        changed_fields = {
+            k: {"before": before_values[k], "after": after_values[k]}
+            for k in before_values
+            if before_values[k] != after_values[k]
+        }
 
-    changed_fields = {
-        k: {"before": before_values[k], "after": after_values[k]}
-        for k in before_values
-        if before_values[k] != after_values[k]
-    }
+        log_with_context(
+            logger,
+            logging.INFO,
+            "Transaction updated",
+            operation="UPDATE",
+            transaction_id=transaction.id,
+            changed_fields=changed_fields,
+        )
 
-    log_with_context(
-        logger,
-        logging.INFO,
-        "Transaction updated",
-        operation="UPDATE",
-        transaction_id=transaction.id,
-        changed_fields=changed_fields,
-    )
+    if not needs_cleanup:
+        return transaction
 
     # Track if ISIN changed
     isin_changed = transaction.isin != original_isin
 
+    # Units non-zero before and after: the position neither closed nor reopened
+    if not isin_changed and units_before != 0 and units_before + units_change != 0:
+        return transaction
+
+    # Post-update state, computed once and shared by cleanup and reopening
+    units_after = cost_basis_service.sum_units_for_isin(db, transaction.isin)
+
     # Cleanup current ISIN if position closed
-    _cleanup_position_value_for_closed_position(db, transaction.isin)
+    _cleanup_position_value_for_closed_position(
+        db, transaction.isin, total_units=units_after
+    )
 
     # Cleanup original ISIN if changed
     if isin_changed:
@@ -217,9 +262,7 @@ def update_transaction(
 
     # Check for reopening on current ISIN
     if units_before == 0:
-        cost_basis_after = cost_basis_service.calculate_cost_basis(db, transaction.isin)
-        units_after = cost_basis_after.total_units if cost_basis_after else Decimal("0")
-        if units_after > 0:
+        if units_after is not None and units_after > 0:
             try:
                 position_value_service.delete_position_value(db, transaction.isin)
             except PositionValueNotFoundError:
@@ -243,41 +286,42 @@ def delete_transaction(db: Session, transaction_id: int) -> None:
     isin_to_check = transaction.isin
 
     # Store values for audit log before deletion
-    deleted_values = {
-        "transaction_id": transaction.id,
-        "isin": transaction.isin,
-        "transaction_type": transaction.transaction_type.value,
-        "units": str(transaction.units),
-        "price_per_unit": str(transaction.price_per_unit),
-        "fee": str(transaction.fee),
-        "broker": transaction.broker,
-        "date": str(transaction.date),
-    }
+    audit_enabled = logger.isEnabledFor(logging.INFO)
+    if audit_enabled:
+        deleted_values = {"transaction_id": transaction.id, **_audit_values(transaction)}
 
     # Calculate units before deletion to detect reopening
-    cost_basis_before = cost_basis_service.calculate_cost_basis(db, isin_to_check)
-    units_before = cost_basis_before.total_units if cost_basis_before else Decimal("0")
+    units_before = cost_basis_service.sum_units_for_isin(db, isin_to_check) or Decimal("0")
+    units_change = -_signed_units(transaction)
 
     db.delete(transaction)
     db.commit()
 
     # AUDIT LOG
-    log_with_context(
-        logger,
-        logging.INFO,
-        "Transaction deleted",
-        operation="DELETE",
-        **deleted_values,
-    )
+    if audit_enabled:
+        log_with_context(
+            logger,
+            logging.INFO,
+            "Transaction deleted",
+            operation="DELETE",
+            **deleted_values,
+        )
+
+    # Units non-zero before and after: the position neither closed nor reopened
+    if units_before != 0 and units_before + units_change != 0:
+        return
+
+    # Post-delete state, computed once and shared by both checks below
+    units_after = cost_basis_service.sum_units_for_isin(db, isin_to_check)
 
     # Cleanup if position closed
-    _cleanup_position_value_for_closed_position(db, isin_to_check)
+    _cleanup_position_value_for_closed_position(
+        db, isin_to_check, total_units=units_after
+    )
 
     # Also cleanup if position reopened (was 0, now positive)
     if units_before == 0:
-        cost_basis_after = cost_basis_service.calculate_cost_basis(db, isin_to_check)
-        units_after = cost_basis_after.total_units if cost_basis_after else Decimal("0")
-        if units_after > 0:
+        if units_after is not None and units_after > 0:
             # Position reopened - delete stale position value
             try:
                 position_value_service.delete_position_value(db, isin_to_check)
@@ -285,7 +329,9 @@ def delete_transaction(db: Session, transaction_id: int) -> None:
                 pass
 
 
-def _cleanup_position_value_for_closed_position(db: Session, isin: str) -> None:
+def _cleanup_position_value_for_closed_position(
+    db: Session, isin: str, *, total_units: Optional[Decimal] = None
+) -> None:
     """
     Delete position value if the position is closed (total_units == 0).
 
@@ -295,12 +341,15 @@ def _cleanup_position_value_for_closed_position(db: Session, isin: str) -> None:
     Args:
         db: Database session
         isin: ISIN code to check
+        total_units: Current net units of the ISIN, if the caller already has
+            them (None is looked up, which also covers ISINs with no transactions)
     """
     try:
-        cost_basis = cost_basis_service.calculate_cost_basis(db, isin)
+        if total_units is None:
+            total_units = cost_basis_service.sum_units_for_isin(db, isin)
 
         # If position is closed, delete the position value
-        if cost_basis and cost_basis.total_units == 0:
+        if total_units is not None and total_units == 0:
             try:
                 position_value_service.delete_position_value(db, isin)
             except PositionValueNotFoundError:
@@ -320,10 +369,118 @@ def _cleanup_position_value_for_closed_position(db: Session, isin: str) -> None:
         pass
 
 
+def _cleanup_position_values_for_closed_positions(db: Session, isins: set[str]) -> None:
+    """
+    Batch form of _cleanup_position_value_for_closed_position.
+
+    Checks every given ISIN with a single statement instead of one cost
+    basis calculation per ISIN. Errors are logged, not raised.
+
+    Args:
+        db: Database session
+        isins: ISIN codes to check
+    """
+    try:
+        position_value_service.delete_position_values_for_closed_positions(db, isins)
+    except Exception as e:
+        db.rollback()
+        log_with_context(
+            logger,
+            logging.ERROR,
+            "Error during position value cleanup",
+            isins=sorted(isins),
+            error_type=type(e).__name__,
+            error_message=str(e),
+        )
+
+
+def _degiro_row_to_create_payload(row_data) -> dict:
+    """Map a parsed DEGIRO row onto TransactionCreate input fields."""
+    return {
+        "date": row_data.date,
+        "isin": row_data.isin,
+        "broker": "DEGIRO",  # Always DEGIRO for CSV imports
+        "fee": row_data.fee,
+        "price_per_unit": row_data.price,
+        "units": row_data.quantity,
+        "transaction_type": row_data.transaction_type,
+    }
+
+
+def _validate_degiro_chunk(chunk: list) -> list[tuple]:
+    """
+    Validate a chunk of parsed DEGIRO rows.
+
+    The whole chunk is validated in one call; only when it fails are the rows
+    re-validated one by one so each failing row gets its own error details.
+
+    Args:
+        chunk: Parsed DEGIRO rows
+
+    Returns:
+        List of (row_data, TransactionCreate | ValidationError) in input order
+    """
+    try:
+        validated = _TRANSACTION_CREATE_LIST_ADAPTER.validate_python(
+            [_degiro_row_to_create_payload(row_data) for row_data in chunk]
+        )
+        return list(zip(chunk, validated))
+    except ValidationError:
+        outcomes = []
+        for row_data in chunk:
+            try:
+                outcomes.append(
+                    (row_data, TransactionCreate(**_degiro_row_to_create_payload(row_data)))
+                )
+            except ValidationError as e:
+                outcomes.append((row_data, e))
+        return outcomes
+
+
+def _record_import_success(
+    results: dict, row_data, transaction_id: int, txn: TransactionCreate
+) -> None:
+    """Append a successful CSV import row to the results dictionary."""
+    results["successful"] += 1
+    results["results"].append({
+        "row": row_data.row_number,
+        "transaction_id": transaction_id,
+        "isin": txn.isin,
+        "transaction_type": txn.transaction_type,
+    })
+
+
+def _record_import_unexpected_error(results: dict, row_data, error: Exception) -> None:
+    """Append a CSV import row that failed with an unexpected error to the results."""
+    results["failed"] += 1
+    results["errors"].append({
+        "row": row_data.row_number,
+        "isin": row_data.isin if hasattr(row_data, "isin") else None,
+        "date": str(row_data.date) if hasattr(row_data, "date") else None,
+        "errors": [f"Unexpected error: {str(error)}"],
+        "raw_data": row_data.raw_row if hasattr(row_data, "raw_row") else None,
+    })
+
+    log_with_context(
+        logger,
+        logging.ERROR,
+        "Unexpected error during CSV import",
+        row=row_data.row_number,
+        error_type=type(error).__name__,
+        error=str(error),
+    )
+
+
 def degiro_import_csv_transactions(db: Session, csv_content: str) -> dict:
     """
     Import transactions from DEGIRO CSV file.
 
+    Rows are validated in chunks on a small thread pool and all valid rows
+    are written with a single multi-row INSERT ... RETURNING. If the bulk
+    insert fails, rows are inserted one by one, each in its own savepoint,
+    so the failing row can be isolated and reported; the rows that did go
+    in are still committed together once.
+
     Args:
         db: Database session
         csv_content: CSV file content as string
@@ -341,8 +498,6 @@ def degiro_import_csv_transactions(db: Session, csv_content: str) -> dict:
     Raises:
         CSVImportError: If CSV format is invalid or required columns missing
     """
-    from pydantic import ValidationError
-
     from app.services.csv_parser import parse_degiro_csv
 
     results = {
@@ -375,78 +530,97 @@ def degiro_import_csv_transactions(db: Session, csv_content: str) -> dict:
         )
         raise CSVImportError(str(e))
 
-    # Process each row
-    for row_data in parsed_rows:
+    # Validate rows in chunks (map preserves chunk order)
+    chunks = [
+        parsed_rows[i:i + CSV_IMPORT_CHUNK_SIZE]
+        for i in range(0, len(parsed_rows), CSV_IMPORT_CHUNK_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=CSV_IMPORT_MAX_WORKERS) as executor:
+        chunk_outcomes = list(executor.map(_validate_degiro_chunk, chunks))
+
+    # Per-row loop: bind the appends and the log level check once
+    valid_rows = []
+    add_valid_row = valid_rows.append
+    add_error = results["errors"].append
+    log_failures = logger.isEnabledFor(logging.WARNING)
+    for outcomes in chunk_outcomes:
+        for row_data, outcome in outcomes:
+            if isinstance(outcome, ValidationError):
+                # Pydantic validation error
+                results["failed"] += 1
+                error_messages = [f"{err['loc'][-1]}: {err['msg']}" for err in outcome.errors()]
+                add_error({
+                    "row": row_data.row_number,
+                    "isin": row_data.isin,
+                    "date": str(row_data.date),
+                    "errors": error_messages,
+                    "raw_data": row_data.raw_row,
+                })
+
+                if log_failures:
+                    log_with_context(
+                        logger,
+                        logging.WARNING,
+                        "Transaction validation failed",
+                        row=row_data.row_number,
+                        isin=row_data.isin,
+                        errors=error_messages,
+                    )
+            else:
+                add_valid_row((row_data, outcome))
+
+    if valid_rows:
         try:
-            # Create TransactionCreate schema for validation
-            transaction_create = TransactionCreate(
-                date=row_data.date,
-                isin=row_data.isin,
-                broker="DEGIRO",  # Always DEGIRO for CSV imports
-                fee=row_data.fee,
-                price_per_unit=row_data.price,
-                units=row_data.quantity,
-                transaction_type=row_data.transaction_type,
-            )
+            # Single multi-row INSERT; ids come back in parameter order
+            transaction_ids = db.scalars(
+                insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True),
+                [txn.model_dump() for _, txn in valid_rows],
+            ).all()
+            db.commit()
 
-            # Create transaction (reuse existing service function)
-            transaction = create_transaction(db, transaction_create)
-
-            # Record success
-            results["successful"] += 1
-            results["results"].append({
-                "row": row_data.row_number,
-                "transaction_id": transaction.id,
-                "isin": transaction.isin,
-                "transaction_type": transaction.transaction_type,
-            })
-
-        except ValidationError as e:
-            # Pydantic validation error
-            results["failed"] += 1
-            error_messages = [f"{err['loc'][-1]}: {err['msg']}" for err in e.errors()]
-            results["errors"].append({
-                "row": row_data.row_number,
-                "isin": row_data.isin,
-                "date": str(row_data.date),
-                "errors": error_messages,
-                "raw_data": row_data.raw_row,
-            })
+            for (row_data, txn), transaction_id in zip(valid_rows, transaction_ids):
+                _record_import_success(results, row_data, transaction_id, txn)
 
-            log_with_context(
-                logger,
-                logging.WARNING,
-                "Transaction validation failed",
-                row=row_data.row_number,
-                isin=row_data.isin,
-                errors=error_messages,
-            )
-
-        except Exception as e:
-            # Unexpected error
-            results["failed"] += 1
-            results["errors"].append({
-                "row": row_data.row_number,
-                "isin": row_data.isin if hasattr(row_data, "isin") else None,
-                "date": str(row_data.date) if hasattr(row_data, "date") else None,
-                "errors": [f"Unexpected error: {str(e)}"],
-                "raw_data": row_data.raw_row if hasattr(row_data, "raw_row") else None,
-            })
+        except SQLAlchemyError as e:
+            db.rollback()
 
             log_with_context(
                 logger,
-                logging.ERROR,
-                "Unexpected error during CSV import",
-                row=row_data.row_number,
+                logging.WARNING,
+                "Bulk transaction insert failed, retrying row by row",
+                rows=len(valid_rows),
                 error_type=type(e).__name__,
                 error=str(e),
             )
 
+            # One transaction for all retried rows, committed when the block
+            # exits; a failing row only rolls back its own savepoint
+            inserted = []
+            with db.begin():
+                for row_data, txn in valid_rows:
+                    try:
+                        with db.begin_nested():
+                            transaction_id = db.scalar(
+                                insert(Transaction).returning(Transaction.id), txn.model_dump()
+                            )
+                        inserted.append((row_data, transaction_id, txn))
+                    except Exception as row_error:
+                        _record_import_unexpected_error(results, row_data, row_error)
+
+            for row_data, transaction_id, txn in inserted:
+                _record_import_success(results, row_data, transaction_id, txn)
+
+    # Positions closed by the imported rows, checked once per batch
+    _cleanup_position_values_for_closed_positions(
+        db, {result["isin"] for result in results["results"]}
+    )
+
     # Final summary log
     log_with_context(
         logger,
         logging.INFO,
         "DEGIRO CSV import completed",
+        operation="BULK_CREATE",
         total_rows=results["total_rows"],
         successful=results["successful"],
         failed=results["failed"],
@@ -474,11 +648,8 @@ def delete_all_transactions(db: Session) -> int:
         Exception: If database operation fails
     """
     try:
-        # Get count before deletion
-        count = db.query(Transaction).count()
-
-        # Delete all transactions
-        db.query(Transaction).delete()
+        # One DELETE; its rowcount replaces a separate COUNT(*) scan
+        count = db.execute(delete(Transaction)).rowcount
         db.commit()
 
         # AUDIT LOG
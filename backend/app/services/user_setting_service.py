@@ -1,11 +1,13 @@
 """User setting service for business logic."""
 
 import logging
+import time
 from decimal import Decimal
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.logging_config import log_with_context
 from app.models.user_setting import UserSetting
 
@@ -14,6 +16,13 @@ logger = logging.getLogger(__name__)
 # Setting key constants
 EXCHANGE_RATE_KEY = "czk_eur_exchange_rate"
 
+# In-process cache of the exchange rate value: (expires_at monotonic time, rate)
+_exchange_rate_cache: dict[str, tuple[float, Decimal]] = {}
+
+# Bumped on every committed update, so a read that started before the update
+# cannot put the old rate back into the cache
+_exchange_rate_generation = 0
+
 
 def get_exchange_rate_setting(db: Session) -> Optional[UserSetting]:
     """
@@ -31,6 +40,56 @@ def get_exchange_rate_setting(db: Session) -> Optional[UserSetting]:
     ).first()
 
 
+def get_exchange_rate(db: Session) -> Decimal:
+    """
+    Get the exchange rate value, falling back to the 25.00 default.
+
+    The value is cached in-process for settings.exchange_rate_cache_ttl_seconds
+    so repeated snapshot/asset reads share one lookup. Updates through this
+    service write the new rate into the cache once committed. Other worker
+    processes keep their cached rate until the TTL expires.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Exchange rate (CZK per 1 EUR)
+    """
+    if settings.exchange_rate_cache_ttl_seconds > 0:
+        cached = _exchange_rate_cache.get(EXCHANGE_RATE_KEY)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+    generation = _exchange_rate_generation
+    setting = get_exchange_rate_setting(db)
+    exchange_rate = Decimal(setting.setting_value) if setting else Decimal("25.00")
+
+    # Skip caching if an update committed while this read was in flight
+    if generation == _exchange_rate_generation:
+        _cache_exchange_rate(exchange_rate)
+
+    return exchange_rate
+
+
+def _cache_exchange_rate(exchange_rate: Decimal) -> None:
+    """Store the exchange rate in the in-process cache (no-op when TTL is 0)."""
+    ttl = settings.exchange_rate_cache_ttl_seconds
+    if ttl > 0:
+        _exchange_rate_cache[EXCHANGE_RATE_KEY] = (time.monotonic() + ttl, exchange_rate)
+
+
+def _exchange_rate_committed(exchange_rate: Decimal) -> None:
+    """Publish a committed exchange rate to this process's cache."""
+    global _exchange_rate_generation
+    _exchange_rate_generation += 1
+    _cache_exchange_rate(exchange_rate)
+
+
+def invalidate_exchange_rate_cache() -> None:
+    """Drop the cached exchange rate so the next read hits the database."""
+    _exchange_rate_cache.pop(EXCHANGE_RATE_KEY, None)
+
+
 def update_exchange_rate_setting(db: Session, exchange_rate: Decimal) -> UserSetting:
     """
     Create or update the exchange rate setting (UPSERT operation).
@@ -58,6 +117,9 @@ def update_exchange_rate_setting(db: Session, exchange_rate: Decimal) -> UserSet
         db.commit()
         db.refresh(existing)
 
+        # Only once committed, so concurrent readers cannot cache the old rate
+        _exchange_rate_committed(exchange_rate)
+
         # AUDIT LOG - UPDATE
         log_with_context(
             logger,
@@ -80,6 +142,9 @@ def update_exchange_rate_setting(db: Session, exchange_rate: Decimal) -> UserSet
         db.commit()
         db.refresh(setting)
 
+        # Only once committed, so concurrent readers cannot cache the old rate
+        _exchange_rate_committed(exchange_rate)
+
         # AUDIT LOG - CREATE
         log_with_context(
             logger,
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Simplified SQLite database backup to S3 with hot backup and compression.
+"""Simplified SQLite database backup to S3 with hot backup and zstd compression.
 
 This script creates a safe backup of the SQLite database, compresses it,
 and uploads it to S3. Old backups are managed via S3 Lifecycle Policies.
@@ -14,7 +14,6 @@ AWS Authentication:
     For local: Configure ~/.aws/credentials or set AWS_* env vars.
 """
 
-import gzip
 import os
 import sqlite3
 import tempfile
@@ -22,10 +21,16 @@ from datetime import datetime
 from pathlib import Path
 
 import boto3
+import zstandard as zstd
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Fast level with a ratio on par with gzip -9; threads=-1 uses every core
+ZSTD_LEVEL = 3
+ZSTD_THREADS = -1
+COPY_CHUNK_SIZE = 1 << 20
+
 
 def backup_and_upload_to_s3(db_path: str, bucket_name: str, s3_prefix: str = "backups/") -> str:
     """Create hot backup of SQLite database, compress it, and upload to S3.
@@ -53,15 +58,15 @@ def backup_and_upload_to_s3(db_path: str, bucket_name: str, s3_prefix: str = "ba
 
     # Generate backup filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_filename = f"portfolio_{timestamp}.db.gz"
+    backup_filename = f"portfolio_{timestamp}.db.zst"
     s3_key = f"{s3_prefix}{backup_filename}"
 
     # Create temporary files for backup
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as temp_db:
         temp_db_path = temp_db.name
 
-    with tempfile.NamedTemporaryFile(suffix=".db.gz", delete=False) as temp_gz:
-        temp_gz_path = temp_gz.name
+    with tempfile.NamedTemporaryFile(suffix=".db.zst", delete=False) as temp_zst:
+        temp_zst_path = temp_zst.name
 
     try:
         # Step 1: Hot backup (safe - doesn't lock database)
@@ -69,8 +74,10 @@ def backup_and_upload_to_s3(db_path: str, bucket_name: str, s3_prefix: str = "ba
         source_conn = sqlite3.connect(db_path)
         backup_conn = sqlite3.connect(temp_db_path)
 
+        # Copy every page in a single sqlite3_backup_step: no per-step Python
+        # callbacks, and no restart if the app writes between small steps
         with backup_conn:
-            source_conn.backup(backup_conn)
+            source_conn.backup(backup_conn, pages=-1)
 
         source_conn.close()
         backup_conn.close()
@@ -78,17 +85,19 @@ def backup_and_upload_to_s3(db_path: str, bucket_name: str, s3_prefix: str = "ba
 
         # Step 2: Compress
         print("Compressing backup...")
-        with open(temp_db_path, "rb") as f_in:
-            with gzip.open(temp_gz_path, "wb") as f_out:
-                f_out.writelines(f_in)
+        cctx = zstd.ZstdCompressor(level=ZSTD_LEVEL, threads=ZSTD_THREADS)
+        with open(temp_db_path, "rb") as f_in, open(temp_zst_path, "wb") as f_out:
+            cctx.copy_stream(
+                f_in, f_out, read_size=COPY_CHUNK_SIZE, write_size=COPY_CHUNK_SIZE
+            )
 
-        size_mb = Path(temp_gz_path).stat().st_size / (1024 * 1024)
+        size_mb = Path(temp_zst_path).stat().st_size / (1024 * 1024)
         print(f"Compressed: {size_mb:.2f} MB")
 
         # Step 3: Upload to S3
         print(f"Uploading to s3://{bucket_name}/{s3_key}...")
         s3_client = boto3.client("s3")
-        s3_client.upload_file(temp_gz_path, bucket_name, s3_key)
+        s3_client.upload_file(temp_zst_path, bucket_name, s3_key)
         print(f"Upload complete: {s3_key}")
 
         return s3_key
@@ -97,8 +106,8 @@ def backup_and_upload_to_s3(db_path: str, bucket_name: str, s3_prefix: str = "ba
         # Clean up temp files
         if os.path.exists(temp_db_path):
             os.remove(temp_db_path)
-        if os.path.exists(temp_gz_path):
-            os.remove(temp_gz_path)
+        if os.path.exists(temp_zst_path):
+            os.remove(temp_zst_path)
 
 
 if __name__ == "__main__":
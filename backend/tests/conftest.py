@@ -1,11 +1,14 @@
 """Test configuration and fixtures."""
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.database import Base, get_db
 from app.main import app
+from app.services import cost_basis_service, user_setting_service
 
 # Use in-memory SQLite database for tests
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -14,13 +17,18 @@ engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False}
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 @pytest.fixture(scope="function")
 def db_session():
     """Create a fresh database for each test."""
     Base.metadata.create_all(bind=engine)
+    # Cached settings must not leak between per-test databases
+    user_setting_service.invalidate_exchange_rate_cache()
+    cost_basis_service.invalidate_portfolio_summary_cache()
     db = TestingSessionLocal()
     try:
         yield db
@@ -42,3 +50,23 @@ def client(db_session):
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def captured_sql(db_session):
+    """Return a context manager collecting the SQL statements executed inside it."""
+    @contextmanager
+    def capture_sql():
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        bind = db_session.get_bind()
+        event.listen(bind, "before_cursor_execute", capture)
+        try:
+            yield statements
+        finally:
+            event.remove(bind, "before_cursor_execute", capture)
+
+    return capture_sql
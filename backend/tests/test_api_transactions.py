@@ -2,6 +2,9 @@
 from datetime import date, timedelta
 from io import BytesIO
 
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
 
 class TestTransactionAPI:
     """Test transaction API endpoints."""
@@ -448,6 +451,96 @@ class TestTransactionAPI:
         assert len(data["errors"]) == 1
         assert "future" in data["errors"][0]["errors"][0].lower()
 
+    def test_degiro_import_csv_transactions_mixed_valid_and_invalid(self, client):
+        """Test CSV import inserts valid rows in bulk and reports invalid ones."""
+        future_date = (date.today() + timedelta(days=365)).strftime("%d-%m-%Y")
+        csv_content = f"""Date,Time,Product,ISIN,Reference exchange,Venue,Quantity,Price,,Local value,,Value EUR,Exchange rate,AutoFX Fee,Transaction and/or third party fees EUR,Total EUR,Order ID,
+11-12-2024,16:03,VANGUARD FTSE ALL-WORLD...,IE00BK5BQT80,XET,XETA,21,"143,9000",EUR,"-3021,90",EUR,"-3021,90",,"0,00","-3,00","-3024,90",,a1
+{future_date},16:03,FUTURE DATE,IE00BK5BQT80,XET,XETA,21,"143,9000",EUR,"-3021,90",EUR,"-3021,90",,"0,00","-3,00","-3024,90",,bad1
+10-12-2024,10:30,APPLE INC,US0378331005,NDQ,XNAS,-10,"450,25",USD,"4502,50",EUR,"4000,00","1,125","0,00","-1,50","3998,50",,c2""".encode()
+
+        response = client.post(
+            "/api/v1/transactions/degiro-import-csv-transactions",
+            files={"file": ("degiro.csv", BytesIO(csv_content), "text/csv")},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_rows"] == 3
+        assert data["successful"] == 2
+        assert data["failed"] == 1
+        assert [r["row"] for r in data["results"]] == [1, 3]
+        assert data["errors"][0]["row"] == 2
+
+        # Returned IDs map to the rows they were reported for
+        for result in data["results"]:
+            txn = client.get(f"/api/v1/transactions/{result['transaction_id']}").json()
+            assert txn["isin"] == result["isin"]
+            assert txn["transaction_type"] == result["transaction_type"]
+            assert txn["broker"] == "DEGIRO"
+
+    def test_degiro_import_csv_transactions_bulk_failure_isolates_row(self, client, db_session):
+        """Test a failed bulk insert falls back to per-row savepoints and one commit."""
+        csv_content = b"""Date,Time,Product,ISIN,Reference exchange,Venue,Quantity,Price,,Local value,,Value EUR,Exchange rate,AutoFX Fee,Transaction and/or third party fees EUR,Total EUR,Order ID,
+11-12-2024,16:03,VANGUARD FTSE ALL-WORLD...,IE00BK5BQT80,XET,XETA,21,"143,9000",EUR,"-3021,90",EUR,"-3021,90",,"0,00","-3,00","-3024,90",,a1
+10-12-2024,10:30,APPLE INC,US0378331005,NDQ,XNAS,-10,"450,25",USD,"4502,50",EUR,"4000,00","1,125","0,00","-1,50","3998,50",,c2"""
+
+        # Any INSERT carrying the Apple ISIN fails: the bulk statement and
+        # that row's retry, but not the other row's retry
+        def fail_apple_insert(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO transactions") and "US0378331005" in parameters:
+                raise OperationalError(statement, parameters, Exception("simulated failure"))
+
+        # Real COMMITs on the connection; savepoint releases are not counted
+        commits = []
+
+        def capture(conn):
+            commits.append(conn)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", fail_apple_insert)
+        event.listen(engine, "commit", capture)
+        try:
+            response = client.post(
+                "/api/v1/transactions/degiro-import-csv-transactions",
+                files={"file": ("degiro.csv", BytesIO(csv_content), "text/csv")},
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", fail_apple_insert)
+            event.remove(engine, "commit", capture)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["successful"] == 1
+        assert data["failed"] == 1
+        assert data["results"][0]["isin"] == "IE00BK5BQT80"
+        assert data["errors"][0]["row"] == 2
+        assert len(commits) == 1
+
+        txn = client.get(f"/api/v1/transactions/{data['results'][0]['transaction_id']}").json()
+        assert txn["isin"] == "IE00BK5BQT80"
+
+    def test_degiro_import_csv_transactions_cleans_up_closed_positions(self, client):
+        """Test position values of positions closed by the import are removed."""
+        for isin in ("IE00BK5BQT80", "US0378331005"):
+            client.post(
+                "/api/v1/position-values", json={"isin": isin, "current_value": "100.00"}
+            )
+
+        csv_content = b"""Date,Time,Product,ISIN,Reference exchange,Venue,Quantity,Price,,Local value,,Value EUR,Exchange rate,AutoFX Fee,Transaction and/or third party fees EUR,Total EUR,Order ID,
+12-12-2024,16:03,VANGUARD FTSE ALL-WORLD...,IE00BK5BQT80,XET,XETA,-21,"145,0000",EUR,"3045,00",EUR,"3045,00",,"0,00","-3,00","3042,00",,a2
+11-12-2024,16:03,VANGUARD FTSE ALL-WORLD...,IE00BK5BQT80,XET,XETA,21,"143,9000",EUR,"-3021,90",EUR,"-3021,90",,"0,00","-3,00","-3024,90",,a1
+10-12-2024,10:30,APPLE INC,US0378331005,NDQ,XNAS,10,"450,25",USD,"-4502,50",EUR,"-4000,00","1,125","0,00","-1,50","-4001,50",,c2"""
+
+        response = client.post(
+            "/api/v1/transactions/degiro-import-csv-transactions",
+            files={"file": ("degiro.csv", BytesIO(csv_content), "text/csv")},
+        )
+        assert response.json()["successful"] == 3
+
+        isins = [pv["isin"] for pv in client.get("/api/v1/position-values").json()["position_values"]]
+        assert isins == ["US0378331005"]
+
     def test_degiro_import_csv_transactions_invalid_file_type(self, client):
         """Test CSV import rejects non-CSV files."""
         txt_content = b"not a csv file"
@@ -211,6 +211,27 @@ class TestAssetSnapshotService:
         assert cd_account.exchange_rate == Decimal("24.00")
         assert cd_account.value_eur == Decimal("100.00")  # 2400 / 24
 
+    def test_create_snapshot_total_matches_stored_values(self, db_session):
+        """Test that metadata total is the sum of the stored (rounded) value_eur."""
+        update_exchange_rate_setting(db_session, Decimal("3.00"))
+
+        other_asset_service.upsert_other_asset(
+            db_session,
+            OtherAssetCreate(
+                asset_type=AssetType.CD_ACCOUNT,
+                asset_detail=None,
+                currency=Currency.CZK,
+                value=Decimal("100.00")
+            )
+        )
+
+        snapshots, metadata = asset_snapshot_service.create_snapshot(db_session)
+
+        cd_account = next(s for s in snapshots if s.asset_type == "cd_account")
+        assert cd_account.value_eur == Decimal("33.33")  # 100 / 3, rounded on insert
+        assert metadata.total_value_eur == sum(s.value_eur for s in snapshots)
+        assert metadata.total_value_eur == Decimal("33.33")
+
     def test_create_snapshot_includes_asset_detail(self, db_session):
         """Test that asset_detail is stored correctly for cash accounts."""
         # Create cash account with detail
@@ -309,6 +330,20 @@ class TestAssetSnapshotService:
         assert len(snapshots) == 1
         assert snapshots[0].asset_type == "crypto"
 
+    def test_get_snapshots_iter_streams_in_order(self, db_session, monkeypatch):
+        """Test that the streaming variant yields the same ordered rows across batches."""
+        monkeypatch.setattr(asset_snapshot_service, "SNAPSHOT_STREAM_BATCH_SIZE", 2)
+
+        for day in (1, 2, 3):
+            asset_snapshot_service.create_snapshot(db_session, datetime(2024, 1, day))
+
+        stream = asset_snapshot_service.get_snapshots_iter(db_session)
+        assert not isinstance(stream, list)
+
+        streamed = [s.id for s in stream]
+        assert streamed == [s.id for s in asset_snapshot_service.get_snapshots(db_session)]
+        assert len(streamed) == 3
+
     def test_get_snapshots_by_date(self, db_session):
         """Test getting snapshots for a specific date."""
         snapshot_date = datetime(2024, 6, 15, 10, 0, 0)
@@ -503,6 +538,34 @@ class TestAssetSnapshotService:
         assert summaries[0].snapshot_date == date2
         assert summaries[1].snapshot_date == date1
 
+    def test_get_snapshot_summaries_breakdowns_stay_with_their_date(self, db_session, monkeypatch):
+        """Test that breakdowns are attached to the right date when dates differ in assets."""
+        # Small batches so a date's rows span several fetches
+        monkeypatch.setattr(asset_snapshot_service, "SNAPSHOT_STREAM_BATCH_SIZE", 2)
+
+        date1 = datetime(2024, 1, 1, 10, 0, 0)
+        date2 = datetime(2024, 2, 1, 10, 0, 0)
+
+        asset_snapshot_service.create_snapshot(db_session, date1)
+
+        other_asset_service.upsert_other_asset(
+            db_session,
+            OtherAssetCreate(
+                asset_type=AssetType.CD_ACCOUNT,
+                asset_detail=None,
+                currency=Currency.CZK,
+                value=Decimal("2500.00")
+            )
+        )
+        asset_snapshot_service.create_snapshot(db_session, date2)
+
+        summaries, _ = asset_snapshot_service.get_snapshot_summaries(db_session)
+
+        assert [c.currency for c in summaries[0].by_currency] == ["CZK", "EUR"]
+        assert [a.asset_type for a in summaries[0].by_asset_type] == ["cd_account", "investments"]
+        assert [c.currency for c in summaries[1].by_currency] == ["EUR"]
+        assert [a.asset_type for a in summaries[1].by_asset_type] == ["investments"]
+
     def test_get_snapshot_summaries_currency_aggregation(self, db_session):
         """Test that currency breakdown correctly sums EUR and CZK values."""
         # Create EUR asset
@@ -592,6 +655,40 @@ class TestAssetSnapshotService:
         assert by_asset_type["crypto"] == Decimal("300.00")
         assert by_asset_type["investments"] == Decimal("0")
 
+    def test_get_snapshot_summaries_changes_from_oldest(self, db_session):
+        """Test absolute and percentage change from the oldest date in the range."""
+        other_asset_service.upsert_other_asset(
+            db_session,
+            OtherAssetCreate(
+                asset_type=AssetType.CRYPTO,
+                asset_detail=None,
+                currency=Currency.EUR,
+                value=Decimal("300.00")
+            )
+        )
+        asset_snapshot_service.create_snapshot(db_session, datetime(2024, 1, 1))
+
+        other_asset_service.upsert_other_asset(
+            db_session,
+            OtherAssetCreate(
+                asset_type=AssetType.CRYPTO,
+                asset_detail=None,
+                currency=Currency.EUR,
+                value=Decimal("400.00")
+            )
+        )
+        asset_snapshot_service.create_snapshot(db_session, datetime(2024, 2, 1))
+
+        summaries, _ = asset_snapshot_service.get_snapshot_summaries(db_session)
+
+        assert summaries[0].absolute_change_from_oldest == Decimal("100.00")
+        # Exact Decimal arithmetic, not a float quotient from the database
+        assert summaries[0].percentage_change_from_oldest == (
+            Decimal("100.00") / Decimal("300.00") * Decimal("100")
+        )
+        assert summaries[1].absolute_change_from_oldest == Decimal("0")
+        assert summaries[1].percentage_change_from_oldest == Decimal("0")
+
     def test_get_snapshot_summaries_date_filtering(self, db_session):
         """Test that start_date and end_date filters work correctly."""
         date1 = datetime(2024, 1, 1, 10, 0, 0)
@@ -656,3 +753,30 @@ class TestAssetSnapshotService:
         # Verify - all cash accounts should be aggregated into one asset_type
         by_asset_type = {a.asset_type: a.total_value_eur for a in summaries[0].by_asset_type}
         assert by_asset_type["cash_eur"] == Decimal("300.00")  # 100 * 3 accounts
+
+    # CSV import tests
+
+    def test_import_snapshots_from_csv_in_chunks(self, db_session, monkeypatch):
+        """Test CSV import spanning several insert chunks keeps row/ID alignment."""
+        monkeypatch.setattr(asset_snapshot_service, "CSV_IMPORT_CHUNK_SIZE", 2)
+        csv_content = (
+            "snapshot_date,asset_type,asset_detail,currency,value,exchange_rate,value_eur\n"
+            "2024-01-01T00:00:00,crypto,,EUR,100.00,25.00,100.00\n"
+            "2024-01-01T00:00:00,cash_czk,CSOB,CZK,2500.00,25.00,100.00\n"
+            "2024-02-01T00:00:00,crypto,,EUR,150.00,25.00,150.00\n"
+        )
+
+        results = asset_snapshot_service.import_snapshots_from_csv(db_session, csv_content)
+
+        assert results["total_rows"] == 3
+        assert results["successful"] == 3
+        assert results["failed"] == 0
+        assert [r["row"] for r in results["results"]] == [1, 2, 3]
+        assert [r["asset_type"] for r in results["results"]] == ["crypto", "cash_czk", "crypto"]
+
+        snapshots = asset_snapshot_service.get_snapshots_by_date(
+            db_session, datetime(2024, 1, 1)
+        )
+        ids = {s.asset_type: s.id for s in snapshots}
+        assert ids["crypto"] == results["results"][0]["snapshot_id"]
+        assert ids["cash_czk"] == results["results"][1]["snapshot_id"]
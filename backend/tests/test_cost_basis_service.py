@@ -4,6 +4,7 @@ from datetime import date, timedelta
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event
 
 from app.constants import TransactionType
 from app.schemas.transaction import TransactionCreate
@@ -180,6 +181,51 @@ class TestCostBasisService:
         assert result is not None
         assert result.isin == "IE00B4L5Y983"
 
+    def test_calculate_cost_basis_issues_single_unordered_aggregate(self, db_session, captured_sql):
+        """Test cost basis runs one aggregate with no ORDER BY (sums need no sort)."""
+        transaction_service.create_transaction(
+            db_session,
+            TransactionCreate(
+                date=date.today(),
+                isin="IE00B4L5Y983",
+                broker="Broker",
+                fee=Decimal("1.00"),
+                price_per_unit=Decimal("100.00"),
+                units=Decimal("10.0"),
+                transaction_type=TransactionType.BUY,
+            ),
+        )
+
+        with captured_sql() as statements:
+            cost_basis_service.calculate_cost_basis(
+                db_session, "IE00B4L5Y983", as_of_date=date.today()
+            )
+
+        assert len(statements) == 1
+        assert "ORDER BY" not in statements[0].upper()
+
+    def test_sum_units_for_isin(self, db_session):
+        """Test net units are BUYs minus SELLs, and None without transactions."""
+        for units, transaction_type in (
+            (Decimal("10.0"), TransactionType.BUY),
+            (Decimal("4.0"), TransactionType.SELL),
+        ):
+            transaction_service.create_transaction(
+                db_session,
+                TransactionCreate(
+                    date=date.today(),
+                    isin="IE00B4L5Y983",
+                    broker="Broker",
+                    fee=Decimal("1.00"),
+                    price_per_unit=Decimal("100.00"),
+                    units=units,
+                    transaction_type=transaction_type,
+                ),
+            )
+
+        assert cost_basis_service.sum_units_for_isin(db_session, "IE00B4L5Y983") == Decimal("6.0")
+        assert cost_basis_service.sum_units_for_isin(db_session, "US0378331005") is None
+
     def test_calculate_cost_basis_as_of_date(self, db_session):
         """Test cost basis calculation as of a specific date."""
         today = date.today()
@@ -298,6 +344,33 @@ class TestCostBasisService:
         assert closed_pos.total_units == Decimal("0")
         assert closed_pos.transactions_count == 2
 
+    def test_fractional_units_sold_to_zero_are_closed(self, db_session):
+        """Test BUY 0.1 + BUY 0.2 - SELL 0.3 is a closed position, not a 0-unit holding."""
+        for units, transaction_type in (
+            (Decimal("0.1"), TransactionType.BUY),
+            (Decimal("0.2"), TransactionType.BUY),
+            (Decimal("0.3"), TransactionType.SELL),
+        ):
+            transaction_service.create_transaction(
+                db_session,
+                TransactionCreate(
+                    date=date.today(),
+                    isin="IE00B4L5Y983",
+                    broker="Broker",
+                    fee=Decimal("1.00"),
+                    price_per_unit=Decimal("100.00"),
+                    units=units,
+                    transaction_type=transaction_type,
+                ),
+            )
+
+        holdings, closed_positions = (
+            cost_basis_service.calculate_current_holdings_and_closed_positions(db_session, {})
+        )
+        assert holdings == []
+        assert [p.isin for p in closed_positions] == ["IE00B4L5Y983"]
+        assert closed_positions[0].total_units == Decimal("0")
+
     def test_closed_position_tracks_costs_and_gains(self, db_session):
         """Test that closed positions correctly track costs, gains, and fees."""
         # Buy 10 units at 100 with 1.50 fee
@@ -506,6 +579,15 @@ class TestCostBasisService:
         assert closed_positions[0].isin == "US0378331005"
         assert closed_positions[0].total_units == Decimal("0")
 
+        # Aggregated figures match the per-ISIN calculation
+        for position in holdings + closed_positions:
+            single = cost_basis_service.calculate_cost_basis(db_session, position.isin)
+            assert position.total_units == single.total_units
+            assert position.total_cost_without_fees == single.total_cost_without_fees
+            assert position.total_gains_without_fees == single.total_gains_without_fees
+            assert position.total_fees == single.total_fees
+            assert position.transactions_count == single.transactions_count
+
     def test_closed_position_with_multiple_buys_and_sells(self, db_session):
         """Test closed position with multiple buy and sell transactions."""
         # Buy 10 units at different times
@@ -995,3 +1077,216 @@ class TestCostBasisService:
         assert holding_without_value.current_value is None
         assert holding_without_value.absolute_pl_without_fees is None
         assert holding_without_value.percentage_pl_without_fees is None
+
+    def test_get_open_positions_value(self, db_session):
+        """Test open positions value only counts position values of open holdings."""
+        from app.services import position_value_service
+        from app.schemas.position_value import PositionValueCreate
+
+        assert cost_basis_service.get_open_positions_value(db_session) == Decimal("0")
+
+        # Open holding with a position value
+        transaction_service.create_transaction(
+            db_session,
+            TransactionCreate(
+                date=date.today() - timedelta(days=2),
+                isin="IE00B4L5Y983",
+                broker="Broker",
+                fee=Decimal("1.00"),
+                price_per_unit=Decimal("100.00"),
+                units=Decimal("10.0"),
+                transaction_type=TransactionType.BUY,
+            ),
+        )
+        position_value_service.upsert_position_value(
+            db_session,
+            PositionValueCreate(isin="IE00B4L5Y983", current_value=Decimal("1100.00")),
+        )
+
+        # Closed position whose stale position value must be ignored
+        for transaction_type in (TransactionType.BUY, TransactionType.SELL):
+            transaction_service.create_transaction(
+                db_session,
+                TransactionCreate(
+                    date=date.today() - timedelta(days=1),
+                    isin="US0378331005",
+                    broker="Broker",
+                    fee=Decimal("1.00"),
+                    price_per_unit=Decimal("200.00"),
+                    units=Decimal("5.0"),
+                    transaction_type=transaction_type,
+                ),
+            )
+        position_value_service.upsert_position_value(
+            db_session,
+            PositionValueCreate(isin="US0378331005", current_value=Decimal("900.00")),
+        )
+
+        summary = cost_basis_service.get_portfolio_summary(db_session)
+        expected = sum(h.current_value for h in summary.holdings if h.current_value is not None)
+
+        assert cost_basis_service.get_open_positions_value(db_session) == Decimal("1100.00")
+        assert cost_basis_service.get_open_positions_value(db_session) == expected
+
+    def test_get_open_positions_value_ignores_fractional_closed_position(self, db_session):
+        """Test a position sold to zero in fractional units does not count as open."""
+        from app.schemas.position_value import PositionValueCreate
+        from app.services import position_value_service
+
+        for units, transaction_type in (
+            (Decimal("0.1"), TransactionType.BUY),
+            (Decimal("0.2"), TransactionType.BUY),
+            (Decimal("0.3"), TransactionType.SELL),
+        ):
+            transaction_service.create_transaction(
+                db_session,
+                TransactionCreate(
+                    date=date.today(),
+                    isin="IE00B4L5Y983",
+                    broker="Broker",
+                    fee=Decimal("1.00"),
+                    price_per_unit=Decimal("100.00"),
+                    units=units,
+                    transaction_type=transaction_type,
+                ),
+            )
+        # Stale position value left behind by the closed position
+        position_value_service.upsert_position_value(
+            db_session,
+            PositionValueCreate(isin="IE00B4L5Y983", current_value=Decimal("5.00")),
+        )
+
+        assert cost_basis_service.get_open_positions_value(db_session) == Decimal("0")
+
+    def test_get_portfolio_summary_cached_until_data_changes(self, db_session, monkeypatch):
+        """Test repeat summaries are served from cache until data changes."""
+        from app.services import position_value_service
+        from app.schemas.position_value import PositionValueCreate
+
+        transaction = transaction_service.create_transaction(
+            db_session,
+            TransactionCreate(
+                date=date.today(),
+                isin="IE00B4L5Y983",
+                broker="Broker",
+                fee=Decimal("1.00"),
+                price_per_unit=Decimal("100.00"),
+                units=Decimal("10.0"),
+                transaction_type=TransactionType.BUY,
+            ),
+        )
+
+        calls = []
+        original = cost_basis_service._build_portfolio_summary
+        monkeypatch.setattr(
+            cost_basis_service,
+            "_build_portfolio_summary",
+            lambda db: calls.append(db) or original(db),
+        )
+
+        first = cost_basis_service.get_portfolio_summary(db_session)
+        first.holdings[0].current_value = Decimal("999")  # Caller mutation must not leak
+        second = cost_basis_service.get_portfolio_summary(db_session)
+        assert len(calls) == 1
+        assert second.holdings[0].current_value is None
+
+        # A position value change is picked up
+        position_value_service.upsert_position_value(
+            db_session,
+            PositionValueCreate(isin="IE00B4L5Y983", current_value=Decimal("1100.00")),
+        )
+        third = cost_basis_service.get_portfolio_summary(db_session)
+        assert len(calls) == 2
+        assert third.holdings[0].current_value == Decimal("1100.00")
+
+        # So is deleting the transaction
+        transaction_service.delete_transaction(db_session, transaction.id)
+        fourth = cost_basis_service.get_portfolio_summary(db_session)
+        assert len(calls) == 3
+        assert fourth.holdings == []
+
+    def test_portfolio_aggregates_do_not_load_transaction_rows(self, db_session):
+        """Test summary paths aggregate in SQL instead of hydrating Transaction objects."""
+        from app.models.transaction import Transaction
+
+        for days_ago in range(3):
+            transaction_service.create_transaction(
+                db_session,
+                TransactionCreate(
+                    date=date.today() - timedelta(days=days_ago),
+                    isin="IE00B4L5Y983",
+                    broker="Broker",
+                    fee=Decimal("1.00"),
+                    price_per_unit=Decimal("100.00"),
+                    units=Decimal("1.0"),
+                    transaction_type=TransactionType.BUY,
+                ),
+            )
+        db_session.expunge_all()
+
+        loaded = []
+
+        def capture(target, context):
+            loaded.append(target)
+
+        event.listen(Transaction, "load", capture)
+        try:
+            summary = cost_basis_service.get_portfolio_summary(db_session)
+            cost_basis_service.get_open_positions_value(db_session)
+            cost_basis_service.calculate_cost_basis(db_session, "IE00B4L5Y983")
+        finally:
+            event.remove(Transaction, "load", capture)
+
+        assert summary.holdings[0].transactions_count == 3
+        assert loaded == []
+
+    def test_get_open_positions_value_memoized_until_commit(self, db_session, captured_sql):
+        """Test repeated open positions value lookups share one query per transaction."""
+        with captured_sql() as statements:
+            first = cost_basis_service.get_open_positions_value(db_session)
+            second = cost_basis_service.get_open_positions_value(db_session)
+
+        assert first == second == Decimal("0")
+        assert len(statements) == 1
+
+        # Ending the transaction drops the memoized value
+        db_session.commit()
+        assert cost_basis_service._OPEN_POSITIONS_VALUE_KEY not in db_session.info
+
+    def test_portfolio_summary_query_count_independent_of_holdings(self, db_session, captured_sql):
+        """Test the summary issues the same number of queries for 1 or 3 holdings."""
+        from app.schemas.position_value import PositionValueCreate
+        from app.services import position_value_service
+
+        def count_summary_queries():
+            with captured_sql() as statements:
+                cost_basis_service._build_portfolio_summary(db_session)
+            return len(statements)
+
+        def add_holding(isin):
+            transaction_service.create_transaction(
+                db_session,
+                TransactionCreate(
+                    date=date.today(),
+                    isin=isin,
+                    broker="Broker",
+                    fee=Decimal("1.00"),
+                    price_per_unit=Decimal("100.00"),
+                    units=Decimal("1.0"),
+                    transaction_type=TransactionType.BUY,
+                ),
+            )
+            position_value_service.upsert_position_value(
+                db_session, PositionValueCreate(isin=isin, current_value=Decimal("110.00"))
+            )
+
+        add_holding("IE00B4L5Y983")
+        single = count_summary_queries()
+
+        add_holding("US0378331005")
+        add_holding("DE0005140008")
+        summary = cost_basis_service._build_portfolio_summary(db_session)
+
+        assert len(summary.holdings) == 3
+        assert all(h.current_value == Decimal("110.00") for h in summary.holdings)
+        assert count_summary_queries() == single
@@ -36,6 +36,12 @@ class TestParseEuropeanDecimal:
         """Test parsing integer without decimal."""
         assert parse_european_decimal("100") == Decimal("100")
 
+    def test_parse_keeps_scale_and_accepts_generic_forms(self):
+        """Test fast path keeps trailing zeros and unusual forms still parse."""
+        assert str(parse_european_decimal(" 2,50 ")) == "2.50"
+        assert parse_european_decimal("1.5") == Decimal("1.5")
+        assert parse_european_decimal("+5") == Decimal("5")
+
     def test_parse_invalid_decimal(self):
         """Test parsing invalid decimal raises ValueError."""
         with pytest.raises(ValueError, match="Cannot parse decimal value"):
@@ -205,6 +211,11 @@ class TestParseDegiroCSV:
         results = parse_degiro_csv(csv_content)
 
         assert len(results) == 2  # Empty row skipped
+        assert [r.row_number for r in results] == [1, 3]
+        assert results[1].quantity == Decimal("10")
+        assert results[1].fee == Decimal("1.50")
+        assert results[1].raw_row["ISIN"] == "US0378331005"
+        assert results[1].raw_row["Price"] == "450,25"
 
     def test_parse_missing_columns(self):
         """Test parsing CSV with missing columns raises ValueError."""
@@ -237,3 +248,24 @@ invalid-date,10:30,APPLE INC,US0378331005,NDQ,XNAS,-10,"450,25",USD,"4502,50",EU
 
         with pytest.raises(ValueError, match="Row 2"):
             parse_degiro_csv(csv_content)
+
+    def test_parse_truncated_row(self):
+        """Test a row missing trailing columns reports its row number."""
+        csv_content = """Date,Time,Product,ISIN,Reference exchange,Venue,Quantity,Price,,Local value,,Value EUR,Exchange rate,AutoFX Fee,Transaction and/or third party fees EUR,Total EUR,Order ID,
+11-12-2025,16:03,VANGUARD FTSE ALL-WORLD...,IE00BK5BQT80,XET,XETA,21,"143,9000",EUR,"-3021,90",EUR,"-3021,90",,"0,00","-3,00","-3024,90",,b1d87359
+15-11-2025,10:30,APPLE INC,US0378331005"""
+
+        with pytest.raises(ValueError, match="Row 2"):
+            parse_degiro_csv(csv_content)
+
+    def test_parse_row_missing_trailing_fee_fields(self):
+        """Test a row that stops before the fee column imports with a zero fee."""
+        csv_content = """Date,Time,Product,ISIN,Reference exchange,Venue,Quantity,Price,,Local value,,Value EUR,Exchange rate,AutoFX Fee,Transaction and/or third party fees EUR,Total EUR,Order ID,
+11-12-2025,16:03,VANGUARD FTSE ALL-WORLD...,IE00BK5BQT80,XET,XETA,21,"143,9000",EUR,"-3021,90",EUR,"-3021,90",,0"""
+
+        results = parse_degiro_csv(csv_content)
+
+        assert len(results) == 1
+        assert results[0].quantity == Decimal("21")
+        assert results[0].fee == Decimal("0.00")
+        assert results[0].raw_row["Transaction and/or third party fees EUR"] is None
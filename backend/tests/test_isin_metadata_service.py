@@ -1,9 +1,13 @@
 """Tests for ISIN metadata service."""
 
+import logging
+
 import pytest
+from sqlalchemy import event, text
 
 from app.constants import ISINType
 from app.exceptions import ISINMetadataAlreadyExistsError, ISINMetadataNotFoundError
+from app.models.isin_metadata import ISINMetadata
 from app.schemas.isin_metadata import ISINMetadataCreate, ISINMetadataUpdate
 from app.services import isin_metadata_service
 
@@ -28,6 +32,33 @@ class TestISINMetadataService:
         assert metadata.created_at is not None
         assert metadata.updated_at is not None
 
+    def test_create_isin_metadata_does_not_reload_row(self, db_session, captured_sql):
+        """Test that creating metadata issues no SELECT after the INSERT."""
+        with captured_sql() as statements:
+            metadata = isin_metadata_service.create_isin_metadata(
+                db_session,
+                ISINMetadataCreate(isin="IE00B4L5Y983", name="Test ETF", type=ISINType.STOCK),
+            )
+            # Reading the committed attributes must not go back to the database
+            assert metadata.id is not None
+            assert metadata.updated_at is not None
+
+        assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+    def test_type_stored_as_one_character_code(self, db_session):
+        """Test that the ISIN type is stored as its code and read back as ISINType."""
+        isin_metadata_service.create_isin_metadata(
+            db_session,
+            ISINMetadataCreate(isin="IE00B4L5Y983", name="Test ETF", type=ISINType.REAL_ASSET),
+        )
+
+        stored = db_session.execute(text("SELECT type FROM isin_metadata")).scalar_one()
+        assert stored == "R"
+
+        db_session.expire_all()
+        metadata = isin_metadata_service.get_isin_metadata(db_session, "IE00B4L5Y983")
+        assert metadata.type == ISINType.REAL_ASSET
+
     def test_create_isin_metadata_duplicate(self, db_session):
         """Test creating duplicate ISIN metadata raises error."""
         metadata_data = ISINMetadataCreate(
@@ -138,6 +169,23 @@ class TestISINMetadataService:
         assert len(real_assets) == 1
         assert real_assets[0].type == ISINType.REAL_ASSET
 
+    def test_get_all_isin_metadata_rows(self, db_session):
+        """Test the row listing matches the ORM listing without loading instances."""
+        isin_metadata_service.create_isin_metadata(
+            db_session, ISINMetadataCreate(isin="US0378331005", name="Stock", type=ISINType.STOCK)
+        )
+        isin_metadata_service.create_isin_metadata(
+            db_session, ISINMetadataCreate(isin="GB00B24CGK77", name="Bond", type=ISINType.BOND)
+        )
+        db_session.expunge_all()
+
+        rows = isin_metadata_service.get_all_isin_metadata_rows(db_session)
+        bonds = isin_metadata_service.get_all_isin_metadata_rows(db_session, asset_type=ISINType.BOND)
+
+        assert [r.isin for r in rows] == ["GB00B24CGK77", "US0378331005"]
+        assert [(r.isin, r.type) for r in bonds] == [("GB00B24CGK77", ISINType.BOND)]
+        assert len(db_session.identity_map) == 0
+
     def test_update_isin_metadata(self, db_session):
         """Test updating ISIN metadata."""
         # Create metadata
@@ -164,6 +212,36 @@ class TestISINMetadataService:
         assert updated.created_at == created_at  # Should not change
         assert updated.updated_at >= created.updated_at  # Should update
 
+    def test_update_isin_metadata_unchanged_skips_commit(self, db_session):
+        """Test that an update with identical values does not commit."""
+        isin_metadata_service.create_isin_metadata(
+            db_session,
+            ISINMetadataCreate(isin="IE00B4L5Y983", name="Test ETF", type=ISINType.STOCK),
+        )
+
+        commits = []
+
+        def capture(session):
+            commits.append(session)
+
+        event.listen(db_session, "after_commit", capture)
+        try:
+            metadata = isin_metadata_service.update_isin_metadata(
+                db_session,
+                "IE00B4L5Y983",
+                ISINMetadataUpdate(name="Test ETF", type=ISINType.STOCK),
+            )
+            upserted = isin_metadata_service.upsert_isin_metadata(
+                db_session,
+                ISINMetadataCreate(isin="IE00B4L5Y983", name="Test ETF", type=ISINType.STOCK),
+            )
+        finally:
+            event.remove(db_session, "after_commit", capture)
+
+        assert metadata.name == "Test ETF"
+        assert upserted is metadata
+        assert commits == []
+
     def test_update_isin_metadata_partial(self, db_session):
         """Test updating only some fields of ISIN metadata."""
         # Create metadata
@@ -263,3 +341,53 @@ class TestISINMetadataService:
         assert updated.type == ISINType.BOND
         assert updated.created_at == initial_created_at  # Should not change
         assert updated.updated_at >= initial.updated_at  # Should update
+        assert db_session.query(ISINMetadata).count() == 1
+
+    def test_upsert_isin_metadata_update_audit_log(self, db_session, caplog):
+        """Test the update audit record lists the changed fields before and after."""
+        isin_metadata_service.upsert_isin_metadata(
+            db_session,
+            ISINMetadataCreate(isin="IE00B4L5Y983", name="Original Name", type=ISINType.STOCK),
+        )
+
+        with caplog.at_level(logging.INFO, logger=isin_metadata_service.logger.name):
+            isin_metadata_service.upsert_isin_metadata(
+                db_session,
+                ISINMetadataCreate(isin="IE00B4L5Y983", name="Updated Name", type=ISINType.STOCK),
+            )
+
+        [record] = [
+            r for r in caplog.records if r.getMessage() == "ISIN metadata upserted (updated)"
+        ]
+        assert record.changes == {
+            "isin_name": {"before": "Original Name", "after": "Updated Name"}
+        }
+
+    def test_bulk_upsert_isin_metadata(self, db_session):
+        """Test bulk upsert creates new rows and updates existing ones."""
+        existing = isin_metadata_service.create_isin_metadata(
+            db_session,
+            ISINMetadataCreate(isin="IE00B4L5Y983", name="Old Name", type=ISINType.STOCK),
+        )
+
+        count = isin_metadata_service.bulk_upsert_isin_metadata(
+            db_session,
+            [
+                ISINMetadataCreate(isin="ie00b4l5y983", name="New Name", type=ISINType.BOND),
+                ISINMetadataCreate(isin="US0378331005", name="Apple", type=ISINType.STOCK),
+                ISINMetadataCreate(isin="US0378331005", name="Apple Inc", type=ISINType.STOCK),
+            ],
+        )
+
+        assert count == 2
+        assert db_session.query(ISINMetadata).count() == 2
+        updated = isin_metadata_service.get_isin_metadata(db_session, "IE00B4L5Y983")
+        assert updated is existing
+        assert updated.name == "New Name"
+        assert updated.type == ISINType.BOND
+        created = isin_metadata_service.get_isin_metadata(db_session, "US0378331005")
+        assert created.name == "Apple Inc"
+
+    def test_bulk_upsert_isin_metadata_empty(self, db_session):
+        """Test bulk upsert with no rows is a no-op."""
+        assert isin_metadata_service.bulk_upsert_isin_metadata(db_session, []) == 0
@@ -0,0 +1,45 @@
+"""Tests for logging configuration."""
+
+import logging
+import queue
+from logging.handlers import QueueListener
+
+from app.logging_config import ContextQueueHandler, request_id_context
+
+
+class _CaptureHandler(logging.Handler):
+    """Collect records emitted by the listener thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestContextQueueHandler:
+    """Test queued logging keeps request context."""
+
+    def test_request_id_and_message_survive_the_queue(self):
+        """Test records keep the request ID and resolved message off-thread."""
+        log_queue = queue.Queue(-1)
+        capture = _CaptureHandler()
+        listener = QueueListener(log_queue, capture)
+        logger = logging.getLogger("tests.queued")
+        logger.propagate = False
+        handler = ContextQueueHandler(log_queue)
+        logger.addHandler(handler)
+        listener.start()
+        token = request_id_context.set("req-123")
+        try:
+            logger.warning("Imported %d rows", 3, extra={"isin": "US0378331005"})
+        finally:
+            request_id_context.reset(token)
+            listener.stop()
+            logger.removeHandler(handler)
+
+        (record,) = capture.records
+        assert record.getMessage() == "Imported 3 rows"
+        assert record.request_id == "req-123"
+        assert record.isin == "US0378331005"
@@ -1,12 +1,13 @@
 """Tests for other asset service."""
 
+import logging
 from decimal import Decimal
 
 import pytest
 
 from app.constants import AssetType, Currency
 from app.exceptions import OtherAssetNotFoundError
-from app.schemas.other_asset import OtherAssetCreate
+from app.schemas.other_asset import OtherAssetCreate, OtherAssetResponse
 from app.services import other_asset_service
 
 
@@ -94,6 +95,29 @@ class TestOtherAssetService:
         assert updated.value == Decimal("850.00")
         assert updated.created_at == initial_created_at
         assert updated.updated_at >= initial.updated_at
+        assert len(other_asset_service.get_all_other_assets(db_session)) == 1
+
+    def test_upsert_other_asset_update_audit_log(self, db_session, caplog):
+        """Test the update audit record lists the changed fields before and after."""
+        other_asset_service.upsert_other_asset(
+            db_session,
+            OtherAssetCreate(
+                asset_type=AssetType.CRYPTO, currency=Currency.EUR, value=Decimal("700.00")
+            ),
+        )
+
+        with caplog.at_level(logging.INFO, logger=other_asset_service.logger.name):
+            other_asset_service.upsert_other_asset(
+                db_session,
+                OtherAssetCreate(
+                    asset_type=AssetType.CRYPTO, currency=Currency.EUR, value=Decimal("850.00")
+                ),
+            )
+
+        [record] = [r for r in caplog.records if r.getMessage() == "Other asset updated"]
+        assert list(record.changes) == ["value"]
+        assert Decimal(record.changes["value"]["before"]) == Decimal("700.00")
+        assert record.changes["value"]["after"] == "850.00"
 
     def test_upsert_other_asset_update_cash_account(self, db_session):
         """Test updating an existing cash account."""
@@ -246,10 +270,55 @@ class TestOtherAssetService:
         assert investments.asset_detail is None
         assert investments.currency == Currency.EUR.value
         assert investments.id == 0  # Marker for synthetic
-
-        # Check that exchange_rate_ is attached
-        assert hasattr(investments, 'exchange_rate_')
-        assert investments.exchange_rate_ == Decimal("25.00")
+        # Synthetic row is a response model, not a transient ORM instance
+        assert isinstance(investments, OtherAssetResponse)
+        assert investments.value_eur == investments.value
+
+        # Exchange rate is returned, not written onto the loaded ORM objects
+        assert not hasattr(all_assets[1], 'exchange_rate_')
+        assert not db_session.dirty
+
+    def test_investments_row_sums_open_position_values(self, db_session):
+        """Test investments row value is the sum of open positions' values."""
+        from datetime import date
+
+        from app.constants import TransactionType
+        from app.schemas.position_value import PositionValueCreate
+        from app.schemas.transaction import TransactionCreate
+        from app.services import position_value_service, transaction_service
+
+        # Two open holdings with values, one closed position with a stale value
+        for isin, transaction_types in (
+            ("IE00B4L5Y983", (TransactionType.BUY,)),
+            ("IE00BK5BQT80", (TransactionType.BUY,)),
+            ("US0378331005", (TransactionType.BUY, TransactionType.SELL)),
+        ):
+            for transaction_type in transaction_types:
+                transaction_service.create_transaction(
+                    db_session,
+                    TransactionCreate(
+                        date=date(2025, 1, 1),
+                        isin=isin,
+                        broker="Broker",
+                        fee=Decimal("1.00"),
+                        price_per_unit=Decimal("100.00"),
+                        units=Decimal("1.0"),
+                        transaction_type=transaction_type,
+                    ),
+                )
+        for isin, value in (
+            ("IE00B4L5Y983", Decimal("1000.00")),
+            ("IE00BK5BQT80", Decimal("250.50")),
+            ("US0378331005", Decimal("999.00")),
+        ):
+            position_value_service.upsert_position_value(
+                db_session, PositionValueCreate(isin=isin, current_value=value)
+            )
+
+        all_assets, _ = other_asset_service.get_all_other_assets_with_investments(db_session)
+
+        assert all_assets[0].asset_type == AssetType.INVESTMENTS.value
+        assert all_assets[0].value == Decimal("1250.50")
 
     def test_get_all_other_assets_empty(self, db_session):
         """Test getting all assets when none exist."""
@@ -9,7 +9,7 @@ from app.constants import TransactionType
 from app.exceptions import PositionValueNotFoundError
 from app.schemas.position_value import PositionValueCreate
 from app.schemas.transaction import TransactionCreate, TransactionUpdate
-from app.services import position_value_service, transaction_service
+from app.services import cost_basis_service, position_value_service, transaction_service
 
 
 class TestPositionValueCleanupOnDelete:
@@ -229,6 +229,143 @@ class TestPositionValueCleanupOnUpdate:
         with pytest.raises(PositionValueNotFoundError):
             position_value_service.get_position_value(db_session, "IE00B4L5Y983")
 
+    def test_update_computes_post_update_units_once(self, db_session, monkeypatch):
+        """Cleanup and the reopening check share one post-update unit total."""
+        # Setup: Buy 10, Sell 10 (position closed) with a stale position value
+        transaction_service.create_transaction(
+            db_session,
+            TransactionCreate(
+                date=date.today() - timedelta(days=2),
+                isin="IE00B4L5Y983",
+                broker="Broker",
+                fee=Decimal("1.00"),
+                price_per_unit=Decimal("100.00"),
+                units=Decimal("10.0"),
+                transaction_type=TransactionType.BUY,
+            ),
+        )
+        sell_txn = transaction_service.create_transaction(
+            db_session,
+            TransactionCreate(
+                date=date.today() - timedelta(days=1),
+                isin="IE00B4L5Y983",
+                broker="Broker",
+                fee=Decimal("1.00"),
+                price_per_unit=Decimal("110.00"),
+                units=Decimal("10.0"),
+                transaction_type=TransactionType.SELL,
+            ),
+        )
+        position_value_service.upsert_position_value(
+            db_session,
+            PositionValueCreate(isin="IE00B4L5Y983", current_value=Decimal("100.00")),
+        )
+
+        calls = []
+        original = cost_basis_service.sum_units_for_isin
+
+        def counting(db, isin):
+            calls.append(isin)
+            return original(db, isin)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("full cost basis is not needed for cleanup")
+
+        monkeypatch.setattr(cost_basis_service, "sum_units_for_isin", counting)
+        monkeypatch.setattr(cost_basis_service, "calculate_cost_basis", fail)
+
+        # Units resubmitted unchanged: the position stays closed, cleanup
+        # deletes the value
+        transaction_service.update_transaction(
+            db_session,
+            sell_txn.id,
+            TransactionUpdate(units=Decimal("10.0")),
+        )
+
+        # One unit total before the update, one after it
+        assert calls == ["IE00B4L5Y983", "IE00B4L5Y983"]
+        with pytest.raises(PositionValueNotFoundError):
+            position_value_service.get_position_value(db_session, "IE00B4L5Y983")
+
+    def test_fee_only_update_skips_position_checks(self, db_session, monkeypatch):
+        """Updates that cannot change units run no position lookups."""
+        txn = transaction_service.create_transaction(
+            db_session,
+            TransactionCreate(
+                date=date.today(),
+                isin="IE00B4L5Y983",
+                broker="Broker",
+                fee=Decimal("1.00"),
+                price_per_unit=Decimal("100.00"),
+                units=Decimal("10.0"),
+                transaction_type=TransactionType.BUY,
+            ),
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("fee/broker edits cannot close a position")
+
+        monkeypatch.setattr(cost_basis_service, "sum_units_for_isin", fail)
+
+        updated = transaction_service.update_transaction(
+            db_session,
+            txn.id,
+            TransactionUpdate(fee=Decimal("2.00"), broker="Other"),
+        )
+
+        assert updated.fee == Decimal("2.00")
+        assert updated.broker == "Other"
+
+    def test_update_staying_open_skips_post_update_lookup(self, db_session, monkeypatch):
+        """A units change that keeps the position open needs no second lookup."""
+        transaction_service.create_transaction(
+            db_session,
+            TransactionCreate(
+                date=date.today() - timedelta(days=2),
+                isin="IE00B4L5Y983",
+                broker="Broker",
+                fee=Decimal("1.00"),
+                price_per_unit=Decimal("100.00"),
+                units=Decimal("10.0"),
+                transaction_type=TransactionType.BUY,
+            ),
+        )
+        sell_txn = transaction_service.create_transaction(
+            db_session,
+            TransactionCreate(
+                date=date.today() - timedelta(days=1),
+                isin="IE00B4L5Y983",
+                broker="Broker",
+                fee=Decimal("1.00"),
+                price_per_unit=Decimal("110.00"),
+                units=Decimal("5.0"),
+                transaction_type=TransactionType.SELL,
+            ),
+        )
+        position_value_service.upsert_position_value(
+            db_session,
+            PositionValueCreate(isin="IE00B4L5Y983", current_value=Decimal("550.00")),
+        )
+
+        calls = []
+        original = cost_basis_service.sum_units_for_isin
+
+        def counting(db, isin):
+            calls.append(isin)
+            return original(db, isin)
+
+        monkeypatch.setattr(cost_basis_service, "sum_units_for_isin", counting)
+
+        # 10 - 5 = 5 units before, 10 - 3 = 7 after: still open
+        transaction_service.update_transaction(
+            db_session,
+            sell_txn.id,
+            TransactionUpdate(units=Decimal("3.0")),
+        )
+
+        assert calls == ["IE00B4L5Y983"]
+        assert position_value_service.get_position_value(db_session, "IE00B4L5Y983")
+
     def test_cleanup_handles_isin_change(self, db_session):
         """Cleanup checks both old and new ISIN when ISIN is changed."""
         # Setup: ISIN1 with Buy 10, Sell 10 (closed)
@@ -407,3 +544,37 @@ class TestBatchCleanupUtility:
         assert stats["deleted"] == 0
         assert len(stats["deleted_isins"]) == 0
         assert len(stats["errors"]) == 0
+
+    def test_cleanup_removes_fractional_positions_sold_to_zero(self, db_session):
+        """Batch and per-ISIN cleanup treat BUY 0.1 + BUY 0.2 - SELL 0.3 as closed."""
+        for isin in ("IE00B4L5Y983", "US0378331005"):
+            for units, transaction_type in (
+                (Decimal("0.1"), TransactionType.BUY),
+                (Decimal("0.2"), TransactionType.BUY),
+                (Decimal("0.3"), TransactionType.SELL),
+            ):
+                transaction_service.create_transaction(
+                    db_session,
+                    TransactionCreate(
+                        date=date.today(),
+                        isin=isin,
+                        broker="Broker",
+                        fee=Decimal("1.00"),
+                        price_per_unit=Decimal("100.00"),
+                        units=units,
+                        transaction_type=transaction_type,
+                    ),
+                )
+            position_value_service.upsert_position_value(
+                db_session,
+                PositionValueCreate(isin=isin, current_value=Decimal("5.00")),
+            )
+
+        deleted = position_value_service.delete_position_values_for_closed_positions(
+            db_session, {"IE00B4L5Y983"}
+        )
+        assert deleted == ["IE00B4L5Y983"]
+
+        stats = position_value_service.cleanup_orphaned_position_values(db_session)
+        assert stats["deleted"] == 1
+        assert stats["deleted_isins"] == ["US0378331005"]
@@ -1,8 +1,10 @@
 """Tests for position value service."""
 
+import logging
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event
 
 from app.exceptions import PositionValueNotFoundError
 from app.schemas.position_value import PositionValueCreate
@@ -52,6 +54,87 @@ class TestPositionValueService:
         assert updated.created_at == initial_created_at  # Should not change
         assert updated.updated_at >= initial.updated_at  # Should update
 
+    def test_upsert_position_value_update_audit_log(self, db_session, caplog):
+        """Test the update audit record carries the previous and the new value."""
+        position_value_service.upsert_position_value(
+            db_session, PositionValueCreate(isin="IE00B4L5Y983", current_value=Decimal("5000.50"))
+        )
+
+        with caplog.at_level(logging.INFO, logger=position_value_service.logger.name):
+            position_value_service.upsert_position_value(
+                db_session,
+                PositionValueCreate(isin="IE00B4L5Y983", current_value=Decimal("6000.75")),
+            )
+
+        [record] = [r for r in caplog.records if r.getMessage() == "Position value updated"]
+        assert Decimal(record.old_value) == Decimal("5000.50")
+        assert record.new_value == "6000.75"
+
+    def test_upsert_position_value_same_value_is_noop(self, db_session):
+        """Test that re-posting an unchanged value neither writes nor commits."""
+        pv_data = PositionValueCreate(isin="IE00B4L5Y983", current_value=Decimal("5000.50"))
+        initial = position_value_service.upsert_position_value(db_session, pv_data)
+        initial_updated_at = initial.updated_at
+
+        commits = []
+
+        def capture(session):
+            commits.append(session)
+
+        event.listen(db_session, "after_commit", capture)
+        try:
+            again = position_value_service.upsert_position_value(db_session, pv_data)
+        finally:
+            event.remove(db_session, "after_commit", capture)
+
+        assert again.id == initial.id
+        assert again.current_value == Decimal("5000.50")
+        assert again.updated_at == initial_updated_at
+        assert commits == []
+
+    def test_upsert_in_tx_leaves_commit_to_caller(self, db_session, caplog):
+        """Test the in-transaction variants write without committing or audit logging."""
+        from app.constants import AssetType, Currency
+        from app.schemas.other_asset import OtherAssetCreate
+        from app.services import other_asset_service
+
+        commits = []
+
+        def capture(session):
+            commits.append(session)
+
+        event.listen(db_session, "after_commit", capture)
+        try:
+            with caplog.at_level(logging.INFO):
+                _, position_audit = position_value_service.upsert_position_value_in_tx(
+                    db_session,
+                    PositionValueCreate(isin="IE00B4L5Y983", current_value=Decimal("10.00")),
+                )
+                _, asset_audit = other_asset_service.upsert_other_asset_in_tx(
+                    db_session,
+                    OtherAssetCreate(
+                        asset_type=AssetType.CRYPTO, currency=Currency.EUR, value=Decimal("5.00")
+                    ),
+                )
+                assert commits == []
+                assert caplog.records == []
+                db_session.commit()
+                position_value_service.log_upsert_audit(position_audit)
+                other_asset_service.log_upsert_audit(asset_audit)
+        finally:
+            event.remove(db_session, "after_commit", capture)
+
+        assert len(commits) == 1
+        assert [r.getMessage() for r in caplog.records] == [
+            "Position value created",
+            "Other asset created",
+        ]
+        db_session.expunge_all()
+        assert position_value_service.get_position_value(
+            db_session, "IE00B4L5Y983"
+        ).current_value == Decimal("10.00")
+        assert other_asset_service.get_other_asset(db_session, "crypto").value == Decimal("5.00")
+
     def test_upsert_normalizes_isin(self, db_session):
         """Test that ISIN is normalized to uppercase."""
         pv_data = PositionValueCreate(
@@ -63,6 +146,33 @@ class TestPositionValueService:
 
         assert position_value.isin == "IE00B4L5Y983"  # Should be uppercase
 
+    def test_bulk_upsert_position_values(self, db_session):
+        """Test bulk upsert creates new rows and updates existing ones."""
+        existing = position_value_service.upsert_position_value(
+            db_session, PositionValueCreate(isin="IE00B4L5Y983", current_value=Decimal("100.00"))
+        )
+
+        count = position_value_service.bulk_upsert_position_values(
+            db_session,
+            [
+                PositionValueCreate(isin="ie00b4l5y983", current_value=Decimal("150.00")),
+                PositionValueCreate(isin="US0378331005", current_value=Decimal("10.00")),
+                PositionValueCreate(isin="US0378331005", current_value=Decimal("20.00")),
+            ],
+        )
+
+        assert count == 2
+        assert len(position_value_service.get_all_position_values(db_session)) == 2
+        updated = position_value_service.get_position_value(db_session, "IE00B4L5Y983")
+        assert updated is existing
+        assert updated.current_value == Decimal("150.00")
+        created = position_value_service.get_position_value(db_session, "US0378331005")
+        assert created.current_value == Decimal("20.00")
+
+    def test_bulk_upsert_position_values_empty(self, db_session):
+        """Test bulk upsert with no rows is a no-op."""
+        assert position_value_service.bulk_upsert_position_values(db_session, []) == 0
+
     def test_get_position_value(self, db_session):
         """Test getting a position value by ISIN."""
         # Create position value
@@ -104,6 +214,24 @@ class TestPositionValueService:
         assert "US0378331005" in isins
         assert "GB00B24CGK77" in isins
 
+    def test_get_position_values_iter_streams_in_order(self, db_session, monkeypatch):
+        """Test that the streaming variant yields the same ordered rows across batches."""
+        monkeypatch.setattr(position_value_service, "POSITION_VALUE_STREAM_BATCH_SIZE", 2)
+
+        for isin in ("US0378331005", "IE00B4L5Y983", "DE0005140008"):
+            position_value_service.upsert_position_value(
+                db_session, PositionValueCreate(isin=isin, current_value=Decimal("1.00"))
+            )
+
+        db_session.expunge_all()
+        stream = position_value_service.get_position_values_iter(db_session)
+        assert not isinstance(stream, list)
+
+        streamed = [pv.isin for pv in stream]
+        assert streamed == ["DE0005140008", "IE00B4L5Y983", "US0378331005"]
+        # Plain rows: nothing entered the identity map
+        assert len(db_session.identity_map) == 0
+
     def test_get_all_position_values_empty(self, db_session):
         """Test getting all position values when none exist."""
         all_values = position_value_service.get_all_position_values(db_session)
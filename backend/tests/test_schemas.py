@@ -10,7 +10,7 @@ from app.schemas.transaction import TransactionCreate, TransactionUpdate, Transa
 from app.schemas.analytics import CostBasisResponse
 from app.schemas.position_value import PositionValueCreate
 from app.schemas.isin_metadata import ISINMetadataCreate, ISINMetadataUpdate
-from app.schemas.other_asset import OtherAssetCreate
+from app.schemas.other_asset import OtherAssetCreate, OtherAssetResponseListAdapter
 
 
 class TestTransactionSchemas:
@@ -351,6 +351,12 @@ class TestPositionValueSchemas:
         assert pv.isin == "IE00B4L5Y983"
         assert pv.current_value == Decimal("5000.50")
 
+    def test_position_value_create_normalizes_isin(self):
+        """Test that ISIN is normalized to uppercase."""
+        pv = PositionValueCreate(isin="ie00b4l5y983", current_value=Decimal("1.00"))
+
+        assert pv.isin == "IE00B4L5Y983"
+
     def test_position_value_create_negative_value(self):
         """Test that negative current_value is rejected."""
         with pytest.raises(ValidationError):
@@ -630,6 +636,37 @@ class TestOtherAssetSchemas:
 
         assert asset.value == Decimal("0.00")
 
+    def test_other_asset_response_list_adapter(self):
+        """Test that the list adapter builds responses with value_eur and hides exchange_rate_."""
+        now = datetime.now()
+        assets = OtherAssetResponseListAdapter.validate_python([
+            {
+                "id": 1,
+                "asset_type": "crypto",
+                "asset_detail": None,
+                "currency": "EUR",
+                "value": Decimal("700.00"),
+                "created_at": now,
+                "updated_at": now,
+                "exchange_rate_": Decimal("25.00"),
+            },
+            {
+                "id": 2,
+                "asset_type": "cash_czk",
+                "asset_detail": "CSOB",
+                "currency": "CZK",
+                "value": Decimal("5000.00"),
+                "created_at": now,
+                "updated_at": now,
+                "exchange_rate_": Decimal("25.00"),
+            },
+        ])
+
+        assert [a.value_eur for a in assets] == [Decimal("700.00"), Decimal("200")]
+        dumped = OtherAssetResponseListAdapter.dump_python(assets)
+        assert "exchange_rate_" not in dumped[0]
+        assert dumped[1]["value_eur"] == Decimal("200")
+
 
 class TestTransactionResponseComputedFields:
     """Test computed fields in TransactionResponse schema."""
@@ -710,6 +747,25 @@ class TestTransactionResponseComputedFields:
         assert transaction.total_with_fees == Decimal("1000.00")
 
 
+    def test_transaction_response_is_frozen(self):
+        """Test that response objects cannot be mutated after construction."""
+        transaction = TransactionResponse(
+            id=1,
+            date=date.today(),
+            isin="IE00B4L5Y983",
+            broker="Interactive Brokers",
+            fee=Decimal("1.50"),
+            price_per_unit=Decimal("25.75"),
+            units=Decimal("100.0"),
+            transaction_type=TransactionType.BUY,
+            created_at=datetime.now(),
+            updated_at=datetime.now()
+        )
+
+        with pytest.raises(ValidationError):
+            transaction.units = Decimal("1.0")
+
+
 class TestCostBasisResponseComputedFields:
     """Test computed fields in CostBasisResponse schema."""
 
@@ -0,0 +1,132 @@
+"""Tests for snapshot CSV parsing utilities."""
+
+import pytest
+from datetime import datetime
+from decimal import Decimal
+
+from app.services.snapshot_csv_parser import (
+    parse_decimal,
+    parse_iso_datetime,
+    parse_snapshot_csv,
+)
+
+
+class TestParseDecimal:
+    """Test decimal parsing."""
+
+    def test_parse_decimal_keeps_scale(self):
+        """Test parsing keeps the written scale and ignores surrounding spaces."""
+        assert str(parse_decimal("1.50")) == "1.50"
+        assert str(parse_decimal(" 25.00 ")) == "25.00"
+
+    def test_parse_blank_is_zero(self):
+        """Test empty and whitespace-only values parse as zero."""
+        assert parse_decimal("") == Decimal("0.00")
+        assert parse_decimal("   ") == Decimal("0.00")
+
+    def test_parse_invalid_decimal(self):
+        """Test parsing invalid input raises ValueError."""
+        with pytest.raises(ValueError, match="Cannot parse decimal value"):
+            parse_decimal("12,5")
+
+
+class TestParseIsoDatetime:
+    """Test ISO 8601 datetime parsing."""
+
+    def test_parse_valid_datetime(self):
+        """Test parsing a valid ISO 8601 datetime."""
+        assert parse_iso_datetime("2025-01-15T10:30:00") == datetime(2025, 1, 15, 10, 30)
+
+    def test_parse_with_microseconds(self):
+        """Test parsing a datetime with fractional seconds."""
+        assert parse_iso_datetime(" 2025-01-15T10:30:00.123456 ") == datetime(
+            2025, 1, 15, 10, 30, 0, 123456
+        )
+
+    def test_repeated_value_is_cached(self):
+        """Test repeated snapshot dates reuse the parsed datetime."""
+        first = parse_iso_datetime("2025-02-01T00:00:00")
+        assert parse_iso_datetime("2025-02-01T00:00:00") is first
+
+    def test_parse_invalid_datetime(self):
+        """Test parsing an invalid datetime raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid datetime format"):
+            parse_iso_datetime("15/01/2025")
+
+
+class TestParseSnapshotCsv:
+    """Test snapshot CSV parsing."""
+
+    def test_repeated_values_share_objects(self):
+        """Test repeated strings and decimals within a file are reused."""
+        csv_content = (
+            "snapshot_date,asset_type,asset_detail,currency,value,exchange_rate,value_eur\n"
+            "2025-01-15T10:30:00,cash,Bank,czk,1000.00,25.00,40.00\n"
+            "2025-01-15T10:30:00,cash,Broker,czk,1000.00,25.00,40.00\n"
+        )
+
+        first, second = parse_snapshot_csv(csv_content)
+
+        assert first.currency == "CZK"
+        assert first.value == Decimal("1000.00")
+        assert first.currency is second.currency
+        assert first.asset_type is second.asset_type
+        assert first.exchange_rate is second.exchange_rate
+        assert first.value_eur is second.value_eur
+
+    def test_raw_row_and_optional_columns(self):
+        """Test rows without optional columns still expose the raw CSV row."""
+        csv_content = (
+            "snapshot_date,asset_type,currency,value,exchange_rate,value_eur\n"
+            "\n"
+            "2025-01-15T10:30:00,cash,EUR,10.00,1.00,10.00\n"
+        )
+
+        (row,) = parse_snapshot_csv(csv_content)
+
+        assert row.row_number == 1
+        assert row.asset_detail is None
+        assert row.created_at is None
+        assert row.raw_row == {
+            "snapshot_date": "2025-01-15T10:30:00",
+            "asset_type": "cash",
+            "currency": "EUR",
+            "value": "10.00",
+            "exchange_rate": "1.00",
+            "value_eur": "10.00",
+        }
+
+    def test_invalid_row_reports_row_number(self):
+        """Test parse errors carry the offending row number."""
+        csv_content = (
+            "snapshot_date,asset_type,currency,value,exchange_rate,value_eur\n"
+            "2025-01-15T10:30:00,cash,EUR,10.00,1.00,10.00\n"
+            "2025-01-15T10:30:00,cash,EURO,10.00,1.00,10.00\n"
+        )
+
+        with pytest.raises(ValueError, match="Row 2: Invalid currency"):
+            parse_snapshot_csv(csv_content)
+
+    def test_rows_of_empty_fields_are_skipped(self):
+        """Test rows with only empty fields are skipped but still numbered."""
+        csv_content = (
+            "snapshot_date,asset_type,currency,value,exchange_rate,value_eur\n"
+            ",,,,,\n"
+            "2025-01-15T10:30:00,cash,EUR,10.00,1.00,10.00\n"
+        )
+
+        (row,) = parse_snapshot_csv(csv_content)
+
+        assert row.row_number == 2
+
+    def test_blank_optional_fields_are_none(self):
+        """Test whitespace-only asset_detail and created_at parse as None."""
+        csv_content = (
+            "snapshot_date,asset_type,asset_detail,currency,value,exchange_rate,value_eur,created_at\n"
+            "2025-01-15T10:30:00,cash,  ,EUR,10.00,1.00,10.00, \n"
+        )
+
+        (row,) = parse_snapshot_csv(csv_content)
+
+        assert row.asset_detail is None
+        assert row.created_at is None
@@ -37,6 +37,28 @@ class TestTransactionService:
         assert transaction.created_at is not None
         assert transaction.updated_at is not None
 
+    def test_create_transaction_does_not_reload_row(self, db_session, captured_sql):
+        """Test that creating a transaction issues no SELECT after the INSERT."""
+        with captured_sql() as statements:
+            transaction = transaction_service.create_transaction(
+                db_session,
+                TransactionCreate(
+                    date=date.today(),
+                    isin="IE00B4L5Y983",
+                    broker="Broker",
+                    fee=Decimal("1"),
+                    price_per_unit=Decimal("450.25"),
+                    units=Decimal("2"),
+                    transaction_type=TransactionType.BUY
+                ),
+            )
+
+        assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        # Amounts carry the column scale, as they would after a reload
+        assert str(transaction.fee) == "1.00"
+        assert str(transaction.price_per_unit) == "450.2500"
+        assert str(transaction.units) == "2.0000"
+
     def test_get_transaction(self, db_session):
         """Test getting a transaction by ID."""
         # Create a transaction
@@ -82,6 +104,36 @@ class TestTransactionService:
         assert total == 3
         assert len(transactions) == 3
 
+    def test_get_transactions_page_and_total_in_one_query(self, db_session, captured_sql):
+        """Test a page reports the full filtered total, including past the end."""
+        for i in range(5):
+            transaction_service.create_transaction(
+                db_session,
+                TransactionCreate(
+                    date=date.today() - timedelta(days=i),
+                    isin="IE00B4L5Y983",
+                    broker="Broker",
+                    fee=Decimal("1.00"),
+                    price_per_unit=Decimal("100.00"),
+                    units=Decimal("1.0"),
+                    transaction_type=TransactionType.BUY
+                )
+            )
+
+        with captured_sql() as statements:
+            transactions, total = transaction_service.get_transactions(db_session, skip=1, limit=2)
+
+        assert total == 5
+        assert [t.date for t in transactions] == [
+            date.today() - timedelta(days=1),
+            date.today() - timedelta(days=2),
+        ]
+        assert len(statements) == 1
+
+        transactions, total = transaction_service.get_transactions(db_session, skip=10)
+        assert transactions == []
+        assert total == 5
+
     def test_get_transactions_filter_by_isin(self, db_session):
         """Test filtering transactions by ISIN."""
         # Create transactions with different ISINs
@@ -364,3 +416,29 @@ class TestTransactionService:
         """Test deleting a non-existent transaction raises error."""
         with pytest.raises(TransactionNotFoundError):
             transaction_service.delete_transaction(db_session, 999)
+
+    def test_delete_all_transactions(self, db_session, captured_sql):
+        """Test deleting all transactions in a single statement."""
+        created = [
+            transaction_service.create_transaction(
+                db_session,
+                TransactionCreate(
+                    date=date.today(),
+                    isin=isin,
+                    broker="Broker",
+                    fee=Decimal("1.00"),
+                    price_per_unit=Decimal("100.00"),
+                    units=Decimal("5.0"),
+                    transaction_type=TransactionType.BUY
+                ),
+            )
+            for isin in ("IE00B4L5Y983", "US0378331005")
+        ]
+
+        with captured_sql() as statements:
+            deleted = transaction_service.delete_all_transactions(db_session)
+
+        assert deleted == 2
+        assert [s.split()[0] for s in statements] == ["DELETE"]
+        with pytest.raises(TransactionNotFoundError):
+            transaction_service.get_transaction(db_session, created[0].id)
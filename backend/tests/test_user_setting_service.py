@@ -1,6 +1,7 @@
 """Tests for user_setting_service."""
 
 from decimal import Decimal
+from types import SimpleNamespace
 
 import pytest
 
@@ -46,3 +47,50 @@ class TestUserSettingService:
         setting = user_setting_service.get_exchange_rate_setting(db_session)
         assert setting is not None
         assert Decimal(setting.setting_value) == Decimal("25.75")
+
+    def test_get_exchange_rate_value_default(self, db_session):
+        """Test exchange rate value defaults to 25.00 when not set."""
+        assert user_setting_service.get_exchange_rate(db_session) == Decimal("25.00")
+
+    def test_get_exchange_rate_value_cached_until_update(self, db_session):
+        """Test exchange rate value is cached and refreshed after an update."""
+        user_setting_service.update_exchange_rate_setting(db_session, Decimal("24.00"))
+        assert user_setting_service.get_exchange_rate(db_session) == Decimal("24.00")
+
+        # Change the row behind the service's back: cached value is still served
+        setting = user_setting_service.get_exchange_rate_setting(db_session)
+        setting.setting_value = "30.00"
+        db_session.commit()
+        assert user_setting_service.get_exchange_rate(db_session) == Decimal("24.00")
+
+        # Updating through the service invalidates the cache
+        user_setting_service.update_exchange_rate_setting(db_session, Decimal("26.00"))
+        assert user_setting_service.get_exchange_rate(db_session) == Decimal("26.00")
+
+    def test_update_writes_new_rate_into_cache(self, db_session, monkeypatch):
+        """Test a committed update is served from the cache without a read."""
+        user_setting_service.update_exchange_rate_setting(db_session, Decimal("26.00"))
+
+        def fail(db):
+            raise AssertionError("rate should come from the cache")
+
+        monkeypatch.setattr(user_setting_service, "get_exchange_rate_setting", fail)
+        assert user_setting_service.get_exchange_rate(db_session) == Decimal("26.00")
+
+    def test_read_racing_an_update_does_not_cache_old_rate(self, db_session, monkeypatch):
+        """Test a read that started before an update cannot cache the old rate."""
+        user_setting_service.update_exchange_rate_setting(db_session, Decimal("24.00"))
+        user_setting_service.invalidate_exchange_rate_cache()
+        original = user_setting_service.get_exchange_rate_setting
+
+        def read_then_update(db):
+            # Old row is read, then another request commits a new rate
+            old_row = SimpleNamespace(setting_value=original(db).setting_value)
+            monkeypatch.setattr(user_setting_service, "get_exchange_rate_setting", original)
+            user_setting_service.update_exchange_rate_setting(db, Decimal("26.00"))
+            return old_row
+
+        monkeypatch.setattr(user_setting_service, "get_exchange_rate_setting", read_then_update)
+
+        assert user_setting_service.get_exchange_rate(db_session) == Decimal("24.00")
+        assert user_setting_service.get_exchange_rate(db_session) == Decimal("26.00")